@@ -8,7 +8,9 @@ __all__ = [
     "DipoleFixed",
     "Epochs",
     "EpochsArray",
+    "EpochsConcatenated",
     "Evoked",
+    "EvokedAccumulator",
     "EvokedArray",
     "Forward",
     "HEDAnnotations",
@@ -306,6 +308,7 @@ from .epochs import (
     BaseEpochs,
     Epochs,
     EpochsArray,
+    EpochsConcatenated,
     concatenate_epochs,
     make_fixed_length_epochs,
     read_epochs,
@@ -322,7 +325,14 @@ from .event import (
     read_events,
     write_events,
 )
-from .evoked import Evoked, EvokedArray, combine_evoked, read_evokeds, write_evokeds
+from .evoked import (
+    Evoked,
+    EvokedAccumulator,
+    EvokedArray,
+    combine_evoked,
+    read_evokeds,
+    write_evokeds,
+)
 from .forward import (
     Forward,
     apply_forward,
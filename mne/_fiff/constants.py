@@ -1212,6 +1212,10 @@ FIFF.FIFFB_MNE_ANNOTATIONS = 3810  # annotations block
 # MNE Metadata Dataframes
 FIFF.FIFFB_MNE_METADATA = 3811  # metadata dataframes block
 
+# MNE compressed raw data
+FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER = 3820  # independently compressed buffer
+FIFF.FIFF_MNE_DATA_COMPRESSION = 3821  # compression of the data buffers
+
 # Table to match unrecognized channel location names to their known aliases
 CHANNEL_LOC_ALIASES = {
     # this set of aliases are published in doi:10.1097/WNP.0000000000000316 and
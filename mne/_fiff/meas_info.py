@@ -102,6 +102,7 @@ from .write import (
 
 b = bytes  # alias
 
+_NUMERIC_TYPES = (float, int, np.floating, np.integer)
 _SCALAR_CH_KEYS = (
     "scanno",
     "logno",
@@ -279,8 +280,8 @@ def _unique_channel_names(ch_names, max_length=None, verbose=None):
     suffixes = tuple(string.ascii_lowercase)
     if max_length is not None:
         ch_names[:] = [name[:max_length] for name in ch_names]
-    unique_ids = np.unique(ch_names, return_index=True)[1]
-    if len(unique_ids) != len(ch_names):
+    if len(set(ch_names)) != len(ch_names):
+        unique_ids = np.unique(ch_names, return_index=True)[1]
         dups = {ch_names[x] for x in np.setdiff1d(range(len(ch_names)), unique_ids)}
         warn(
             "Channel names are not unique, found duplicates for: "
@@ -1123,15 +1124,14 @@ def _format_trans(obj, key):
 
 def _check_ch_keys(ch, ci, name='info["chs"]', check_min=True):
     ch_keys = set(ch)
-    bad = sorted(ch_keys.difference(_ALL_CH_KEYS_SET))
-    if bad:
+    if not ch_keys.issubset(_ALL_CH_KEYS_SET):
+        bad = sorted(ch_keys.difference(_ALL_CH_KEYS_SET))
         raise KeyError(f"key{_pl(bad)} errantly present for {name}[{ci}]: {bad}")
-    if check_min:
+    if check_min and not _MIN_CH_KEYS_SET.issubset(ch_keys):
         bad = sorted(_MIN_CH_KEYS_SET.difference(ch_keys))
-        if bad:
-            raise KeyError(
-                f"key{_pl(bad)} missing for {name}[{ci}]: {bad}",
-            )
+        raise KeyError(
+            f"key{_pl(bad)} missing for {name}[{ci}]: {bad}",
+        )
 
 
 def _check_bads_info_compat(bads, info):
@@ -2001,14 +2001,18 @@ class Info(ValidatedDict, SetChannelsMixin, MontageMixin, ContainsMixin):
                 if key not in proj:
                     raise RuntimeError(f"Projection incomplete, missing {key}")
 
-        # Ensure info['chs'] has immutable entries (copies much faster)
+        # Ensure info['chs'] has immutable entries (copies much faster). The
+        # isinstance checks avoid the (comparatively slow) _validate_type calls
+        # in the common case, which matters when there are many channels.
         for ci, ch in enumerate(self["chs"]):
             _check_ch_keys(ch, ci)
             ch_name = ch["ch_name"]
-            _validate_type(ch_name, str, f'info["chs"][{ci}]["ch_name"]')
+            if not isinstance(ch_name, str):
+                _validate_type(ch_name, str, f'info["chs"][{ci}]["ch_name"]')
             for key in _SCALAR_CH_KEYS:
                 val = ch.get(key, 1)
-                _validate_type(val, "numeric", f'info["chs"][{ci}][{key}]')
+                if isinstance(val, bool) or not isinstance(val, _NUMERIC_TYPES):
+                    _validate_type(val, "numeric", f'info["chs"][{ci}][{key}]')
             loc = ch["loc"]
             if not (isinstance(loc, np.ndarray) and loc.shape == (12,)):
                 raise TypeError(
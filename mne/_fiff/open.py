@@ -2,6 +2,8 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import hashlib
+import os
 from gzip import GzipFile
 from io import SEEK_SET, BytesIO
 from pathlib import Path
@@ -9,7 +11,15 @@ from pathlib import Path
 import numpy as np
 from scipy.sparse import issparse
 
-from ..utils import _check_fname, _file_like, _validate_type, logger, verbose, warn
+from ..utils import (
+    _check_fname,
+    _file_like,
+    _validate_type,
+    get_config,
+    logger,
+    verbose,
+    warn,
+)
 from .constants import FIFF
 from .tag import Tag, _call_dict_names, _matrix_info, _read_tag_header, read_tag
 from .tree import dir_tree_find, make_dir_tree
@@ -157,6 +167,15 @@ def _fiff_open(fname, fid, preload):
     if tag.size != 20:
         raise ValueError(f"{prefix} start with a file id tag")
 
+    cache_fname = _get_index_cache_fname(fname)
+    if cache_fname is not None:
+        key = _get_index_cache_key(fname, read_tag(fid, 0).data)
+        out = _read_index_cache(cache_fname, key)
+        if out is not None:
+            logger.debug(f"    Using cached tag directory for {fname}")
+            fid.seek(0)
+            return (fid,) + out
+
     tag = read_tag(fid, tag.next_pos)
 
     if tag.kind != FIFF.FIFF_DIR_POINTER:
@@ -192,6 +211,8 @@ def _fiff_open(fname, fid, preload):
             directory.append(tag)
 
     tree, _ = make_dir_tree(fid, directory, indent=1)
+    if cache_fname is not None:
+        _write_index_cache(cache_fname, key, tree, directory)
 
     logger.debug("[done]")
 
@@ -201,6 +222,125 @@ def _fiff_open(fname, fid, preload):
     return fid, tree, directory
 
 
+# Bump this whenever the layout of the cached arrays changes
+_INDEX_CACHE_VERSION = 1
+
+
+def _get_index_cache_fname(fname):
+    """Get the tag directory cache filename (or None if caching is disabled)."""
+    cache_dir = get_config("MNE_FIF_INDEX_CACHE_DIR", None)
+    if cache_dir is None or _file_like(fname):
+        return None
+    name = hashlib.sha1(str(Path(fname).resolve()).encode()).hexdigest()
+    return Path(cache_dir).expanduser() / f"{name}-idx.npz"
+
+
+def _id_to_row(id_):
+    if id_ is None:
+        return [0] * 6
+    return [1, id_["version"], *id_["machid"].tolist(), id_["secs"], id_["usecs"]]
+
+
+def _row_to_id(row):
+    if not row[0]:
+        return None
+    return dict(
+        version=int(row[1]),
+        machid=np.array(row[2:4], dtype=">i4"),
+        secs=int(row[4]),
+        usecs=int(row[5]),
+    )
+
+
+def _get_index_cache_key(fname, file_id):
+    """Get the key that identifies the file the index was created from."""
+    stat = os.stat(fname)
+    return np.array(
+        [_INDEX_CACHE_VERSION, stat.st_size, stat.st_mtime_ns] + _id_to_row(file_id),
+        np.int64,
+    )
+
+
+def _write_index_cache(cache_fname, key, tree, directory):
+    """Store the tag directory and tree as flat arrays."""
+    ent_idx = {id(ent): ii for ii, ent in enumerate(directory)}
+    ent_node = np.full(len(directory), -1, np.int64)
+    nodes = list()  # (block, parent) in depth-first order
+    ids = list()  # (id, parent_id) of each node
+
+    def _add_node(node, parent):
+        this = len(nodes)
+        nodes.append((node["block"], parent))
+        ids.append((_id_to_row(node["id"]), _id_to_row(node["parent_id"])))
+        for ent in node["directory"] or ():
+            ent_node[ent_idx[id(ent)]] = this
+        for child in node["children"]:
+            _add_node(child, this)
+
+    _add_node(tree, -1)
+    ents = np.array(
+        [(ent.kind, ent.type, ent.size, ent.next, ent.pos) for ent in directory],
+        np.int64,
+    ).reshape(-1, 5)
+    # write to a temporary file first so that concurrent readers never see a
+    # partially written cache
+    tmp_fname = cache_fname.with_name(f"{cache_fname.name}.{os.getpid()}.tmp")
+    try:
+        cache_fname.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_fname, "wb") as fid:
+            np.savez(
+                fid,
+                key=key,
+                ents=ents,
+                ent_node=ent_node,
+                nodes=np.array(nodes, np.int64).reshape(-1, 2),
+                ids=np.array(ids, np.int64).reshape(-1, 2, 6),
+            )
+        os.replace(tmp_fname, cache_fname)
+    except OSError as exp:
+        warn(f"Could not write FIF index cache {cache_fname}: {exp}")
+
+
+def _read_index_cache(cache_fname, key):
+    """Rebuild the tree and directory from the cache if it is up to date."""
+    try:
+        with np.load(cache_fname, allow_pickle=False) as npz:
+            if not np.array_equal(npz["key"], key):
+                logger.debug(f"    FIF index cache {cache_fname} is out of date")
+                return None
+            ents, ent_node = npz["ents"].tolist(), npz["ent_node"].tolist()
+            nodes, ids = npz["nodes"].tolist(), npz["ids"].tolist()
+    except FileNotFoundError:
+        return None
+    except Exception as exp:  # corrupted, e.g. zipfile.BadZipFile
+        logger.debug(f"    Could not read FIF index cache {cache_fname}: {exp}")
+        return None
+    directory = [Tag(*ent) for ent in ents]
+    trees = list()
+    for (block, parent), (id_, parent_id) in zip(nodes, ids):
+        tree = dict(
+            block=block,
+            id=_row_to_id(id_),
+            parent_id=_row_to_id(parent_id),
+            nent=0,
+            nchild=0,
+            directory=None,
+            children=[],
+        )
+        if parent >= 0:
+            trees[parent]["nchild"] += 1
+            trees[parent]["children"].append(tree)
+        trees.append(tree)
+    for ent, node in zip(directory, ent_node):
+        if node >= 0:
+            tree = trees[node]
+            if tree["directory"] is None:
+                tree["directory"] = list()
+            tree["directory"].append(ent)
+            tree["nent"] += 1
+    return trees[0], directory
+
+
 @verbose
 def show_fiff(
     fname,
@@ -308,7 +308,7 @@ def pick_channels(ch_names, include, exclude=(), ordered=True, *, verbose=None):
     --------
     pick_channels_regexp, pick_types
     """
-    if len(np.unique(ch_names)) != len(ch_names):
+    if len(set(ch_names)) != len(ch_names):
         raise RuntimeError("ch_names is not a unique list, picking is unsafe")
     _validate_type(ordered, bool, "ordered")
     _check_excludes_includes(include)
@@ -317,13 +317,14 @@ def pick_channels(ch_names, include, exclude=(), ordered=True, *, verbose=None):
         include = list(include)
     if len(include) == 0:
         include = list(ch_names)
-    if not isinstance(exclude, list):
-        exclude = list(exclude)
+    # use a dict and a set to avoid quadratic lookups with many channels
+    ch_idx = {name: ii for ii, name in enumerate(ch_names)}
+    exclude = set(exclude)
     sel, missing = list(), list()
     for name in include:
-        if name in ch_names:
+        if name in ch_idx:
             if name not in exclude:
-                sel.append(ch_names.index(name))
+                sel.append(ch_idx[name])
         else:
             missing.append(name)
     if len(missing) and ordered:
@@ -620,6 +621,7 @@ def pick_types(
     if selection is not None:
         # the selection only restricts these types of channels
         sel_kind = [FIFF.FIFFV_MEG_CH, FIFF.FIFFV_REF_MEG_CH, FIFF.FIFFV_EEG_CH]
+        selection = set(selection)
         for k in np.where(pick)[0]:
             if (
                 info["chs"][k]["kind"] in sel_kind
@@ -1388,10 +1390,12 @@ def _picks_str_to_idx(
 
     bad_names = []
     picks_name = list()
+    # reversed so that the first of any duplicates is used (like list.index)
+    ch_idx = {name: ii for ii, name in reversed(list(enumerate(info["ch_names"])))}
     for pick in picks:
         try:
-            picks_name.append(info["ch_names"].index(pick))
-        except ValueError:
+            picks_name.append(ch_idx[pick])
+        except KeyError:
             bad_names.append(pick)
 
     #
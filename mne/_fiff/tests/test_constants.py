@@ -57,7 +57,10 @@ _dir_ignore_names = (
     "viewkeys",
     "viewvalues",  # Py2
 )
-_tag_ignore_names = ()  # for fiff-constants pending updates
+_tag_ignore_names = (  # for fiff-constants pending updates
+    "FIFF_MNE_COMPRESSED_DATA_BUFFER",
+    "FIFF_MNE_DATA_COMPRESSION",
+)
 _ignore_incomplete_enums = (  # XXX eventually we could complete these
     "bem_surf_id",
     "cardinal_point_cardiac",
@@ -685,6 +685,8 @@ def test_check_consistency():
         ("ch_name", 1.0, "must be an instance"),
         ("loc", np.zeros(15), "12 elements"),
         ("cal", np.ones(1), "numeric"),
+        ("cal", True, "numeric"),
+        ("kind", "eeg", "numeric"),
     ):
         info._check_consistency()  # okay
         old = ch[key]
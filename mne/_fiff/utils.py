@@ -4,10 +4,12 @@
 
 import os
 import os.path as op
+import zlib
 from pathlib import Path
 
 import numpy as np
 
+from ..utils import _check_option, _soft_import
 from .constants import FIFF
 from .meas_info import _get_valid_units
 
@@ -190,6 +192,23 @@ def _blk_read_lims(start, stop, buf_len):
     return block_start_idx, r_lims, d_lims
 
 
+def _get_compression_funcs(compression):
+    """Get the (compress, decompress) functions for raw data buffers."""
+    _check_option("compression", compression, ("zlib", "zstd"))
+    if compression == "zlib":
+        return zlib.compress, zlib.decompress
+    zstd = _soft_import("zstandard", "using zstd compression")
+
+    # (de)compressor objects cannot be shared across threads
+    def compress(data):
+        return zstd.ZstdCompressor().compress(data)
+
+    def decompress(data):
+        return zstd.ZstdDecompressor().decompress(data)
+
+    return compress, decompress
+
+
 def _file_size(fname):
     """Get the file size in bytes."""
     with open(fname, "rb") as f:
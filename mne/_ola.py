@@ -314,10 +314,10 @@ class _COLA:
         self._window /= _check_cola(
             self._window, self._n_samples, self._step, window_name, tol=tol
         )
-        self.starts = np.arange(0, n_total - self._n_samples + 1, self._step)
-        self.stops = self.starts + self._n_samples
-        delta = n_total - self.stops[-1]
-        self.stops[-1] = n_total
+        self.starts, self.stops = _cola_bounds(
+            n_total, self._n_samples, self._n_overlap
+        )
+        delta = n_total - self.starts[-1] - self._n_samples
         sfreq = float(sfreq)
         pl = "s" if len(self.starts) != 1 else ""
         logger.info(
@@ -433,6 +433,14 @@ class _COLA:
                 ob[..., -delta:] = 0.0
 
 
+def _cola_bounds(n_total, n_samples, n_overlap):
+    """Get the window boundaries, lumping any remainder into the last window."""
+    starts = np.arange(0, n_total - n_samples + 1, n_samples - n_overlap)
+    stops = starts + n_samples
+    stops[-1] = n_total
+    return starts, stops
+
+
 def _check_cola(win, nperseg, step, window_name, tol=1e-10):
     """Check whether the Constant OverLap Add (COLA) constraint is met."""
     # adapted from SciPy
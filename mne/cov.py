@@ -34,6 +34,7 @@ from ._fiff.proj import activate_proj as _activate_proj
 from ._fiff.proj import make_projector as _make_projector
 from ._fiff.tag import find_tag
 from ._fiff.tree import dir_tree_find
+from .annotations import _annotations_starts_stops
 from .defaults import (
     _BORDER_DEFAULT,
     _EXTRAPOLATE_DEFAULT,
@@ -608,7 +609,8 @@ def compute_raw_covariance(
         Length of data chunks for artifact rejection in seconds.
         Can also be None to use a single epoch of (tmax - tmin)
         duration. This can use a lot of memory for large ``Raw``
-        instances.
+        instances, unless ``method='empirical'`` is used without ``reject``
+        and ``flat``, in which case the data are read in chunks.
     reject : dict | None (default None)
         Rejection parameters based on peak-to-peak amplitude.
         Valid keys are 'grad' | 'mag' | 'eeg' | 'eog' | 'ecg'.
@@ -703,6 +705,7 @@ def compute_raw_covariance(
     tmin = 0.0 if tmin is None else float(tmin)
     dt = 1.0 / raw.info["sfreq"]
     tmax = raw.times[-1] + dt if tmax is None else float(tmax)
+    single_segment = tstep is None
     tstep = tmax - tmin if tstep is None else float(tstep)
     tstep_m1 = tstep - dt  # inclusive!
     events = make_fixed_length_events(raw, 1, tmin, tmax, tstep)
@@ -739,8 +742,26 @@ def compute_raw_covariance(
         data = 0
         n_samples = 0
         mu = 0
+        segments = epochs
+        if single_segment and reject is None and flat is None and len(epochs.events):
+            # No rejection can happen within the segment, so read it in chunks
+            # instead of as one huge epoch
+            start = epochs.events[0, 0] - raw.first_samp
+            stop = start + len(epochs.times)
+            onsets, ends = _annotations_starts_stops(raw, ["BAD"])
+            if not (reject_by_annotation and np.any((onsets < stop) & (ends > start))):
+                segments = (
+                    chunk
+                    for _, _, chunk in raw.iter_chunks(
+                        10.0,
+                        picks=epochs.picks,
+                        start=start,
+                        stop=stop,
+                        verbose=_verbose_safe_false(),
+                    )
+                )
         # Read data in chunks
-        for raw_segment in epochs:
+        for raw_segment in segments:
             raw_segment = raw_segment[pick_mask]
             mu += raw_segment.sum(axis=1)
             data += np.dot(raw_segment, raw_segment.T)
@@ -4,8 +4,10 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import io
 import json
 import operator
+import os
 import os.path as op
 from collections import Counter
 from copy import deepcopy
@@ -14,7 +16,6 @@ from inspect import getfullargspec
 from pathlib import Path
 
 import numpy as np
-from scipy.interpolate import interp1d
 
 from ._fiff.constants import FIFF
 from ._fiff.meas_info import (
@@ -57,6 +58,7 @@ from ._fiff.write import (
 from .annotations import (
     EpochAnnotationsMixin,
     _read_annotations_fif,
+    _sync_onset,
     _write_annotations,
     events_from_annotations,
 )
@@ -64,7 +66,7 @@ from .baseline import _check_baseline, _log_rescale, rescale
 from .bem import _check_origin
 from .channels.channels import InterpolationMixin, ReferenceMixin, UpdateChannelsMixin
 from .event import _read_events_fif, make_fixed_length_events, match_event_names
-from .evoked import EvokedArray
+from .evoked import EvokedAccumulator, EvokedArray
 from .filter import FilterMixin, _check_fun, detrend
 from .fixes import _reshape_view, rng_uniform
 from .html_templates import _get_html_template
@@ -77,6 +79,7 @@ from .utils import (
     SizeMixin,
     _build_data_frame,
     _check_combine,
+    _check_data_dtype,
     _check_event_id,
     _check_fname,
     _check_option,
@@ -94,6 +97,7 @@ from .utils import (
     _prepare_write_metadata,
     _scale_dataframe_data,
     _validate_type,
+    _verbose_safe_false,
     check_fname,
     check_random_state,
     copy_function_doc_to_method_doc,
@@ -102,6 +106,7 @@ from .utils import (
     object_size,
     repr_html,
     sizeof_fmt,
+    use_log_level,
     verbose,
     warn,
 )
@@ -119,6 +124,35 @@ def _pack_reject_params(epochs):
     return reject_params
 
 
+def _get_source_fnames(epochs):
+    """Get the files that non-preloaded epochs read their data from."""
+    fnames = list()
+    if epochs.preload or not isinstance(epochs._raw, list):
+        return fnames
+    for raw in epochs._raw:
+        if isinstance(raw, BaseEpochs):  # concatenated epochs
+            fnames.extend(_get_source_fnames(raw))
+        elif raw.fname is not None:
+            fnames.append(raw.fname)
+    return fnames
+
+
+def _load_epochs_block(epochs, block, check, keep):
+    """Load a block of epochs in a parallel worker."""
+    return epochs._load_block(block, check=check, keep=keep)
+
+
+def _reads_shared_fid(raw):
+    """Check if reading from a data source seeks in a shared file object."""
+    if isinstance(raw, list):
+        return any(_reads_shared_fid(r) for r in raw)
+    if isinstance(raw, _RawContainer):
+        return raw.memmap() is None
+    if isinstance(raw, BaseEpochs):  # inputs of EpochsConcatenated
+        return not raw.preload and _reads_shared_fid(raw._raw)
+    return False
+
+
 def _save_split(epochs, split_fnames, part_idx, n_parts, fmt, overwrite):
     """Split epochs.
 
@@ -423,6 +457,9 @@ class BaseEpochs(
     %(raw_sfreq)s
     annotations : instance of mne.Annotations | None
         Annotations to set.
+    %(dtype_data)s
+    %(n_jobs)s
+        Used to load the data if ``preload_at_end=True``.
     %(verbose)s
 
     See Also
@@ -468,8 +505,11 @@ class BaseEpochs(
         on_outside="warn",
         raw_sfreq=None,
         annotations=None,
+        dtype=None,
+        n_jobs=None,
         verbose=None,
     ):
+        self._data_dtype = _check_data_dtype(dtype)
         if events is not None:  # RtEpochs can have events=None
             events = _ensure_events(events)
             # Allow reading empty epochs (ToDo: Maybe not anymore in the future)
@@ -605,7 +645,7 @@ class BaseEpochs(
                     "The number of epochs and the number of events must match"
                 )
             self.preload = True
-            self._data = data
+            self._data = data.astype(self._get_data_dtype(data), copy=False)
             self._do_baseline = False
         self._offset = None
 
@@ -682,7 +722,7 @@ class BaseEpochs(
         if preload_at_end:
             assert self._data is None
             assert self.preload is False
-            self.load_data()  # this will do the projection
+            self.load_data(n_jobs=n_jobs)  # this will do the projection
         elif proj is True and self._projector is not None and data is not None:
             # let's make sure we project if data was provided and proj
             # requested
@@ -752,9 +792,17 @@ class BaseEpochs(
         self.drop_log = (tuple(),) * len(self.events)
         self._check_consistency()
 
-    def load_data(self):
+    @fill_doc
+    def load_data(self, *, n_jobs=None):
         """Load the data if not already preloaded.
 
+        Parameters
+        ----------
+        %(n_jobs)s
+            Blocks of epochs are read and processed in parallel.
+
+            .. versionadded:: 1.13
+
         Returns
         -------
         epochs : instance of Epochs
@@ -768,7 +816,7 @@ class BaseEpochs(
         """
         if self.preload:
             return self
-        self._data = self._get_data()
+        self._data = self._get_data(n_jobs=n_jobs)
         self.preload = True
         self._do_baseline = False
         self._decim_slice = slice(None, None, None)
@@ -954,11 +1002,47 @@ class BaseEpochs(
                 ignore_chs=self.info["bads"],
             )
 
+    @verbose
+    def _is_good_epochs(self, epochs, verbose=None):
+        """Determine which of multiple epochs are good.
+
+        Same as calling :meth:`_is_good_epoch` on each epoch, but thresholds
+        are applied to all full-length epochs at once.
+        """
+        goods = [None] * len(epochs)
+        full = list()
+        n_times = len(self.times)
+        for ii, data in enumerate(epochs):
+            if isinstance(data, np.ndarray) and data.shape[1] >= n_times:
+                full.append(ii)
+            else:
+                goods[ii] = self._is_good_epoch(data)
+        if len(full) == 0 or (self.reject is None and self.flat is None):
+            bad_tuples = [()] * len(full)
+        else:
+            if len(full) == len(epochs) and isinstance(epochs, np.ndarray):
+                data = epochs
+            else:
+                data = np.array([epochs[ii] for ii in full])
+            if self._reject_time is not None:
+                data = data[..., self._reject_time]
+            bad_tuples = _are_good(
+                data,
+                self.ch_names,
+                self._channel_type_idx,
+                self.reject,
+                self.flat,
+                ignore_chs=self.info["bads"],
+            )
+        for ii, bad_tuple in zip(full, bad_tuples):
+            goods[ii] = (True, None) if bad_tuple == () else (False, bad_tuple)
+        return goods
+
     @verbose
     def _detrend_offset_decim(self, epoch, picks, verbose=None):
         """Aux Function: detrend, baseline correct, offset, decim.
 
-        Note: operates inplace
+        Note: operates inplace, on a single epoch or a stack of epochs
         """
         if (epoch is None) or isinstance(epoch, str):
             return epoch
@@ -968,7 +1052,9 @@ class BaseEpochs(
             # We explicitly detrend just data channels (not EMG, ECG, EOG which
             # are processed by baseline correction)
             use_picks = _pick_data_channels(self.info, exclude=())
-            epoch[use_picks] = detrend(epoch[use_picks], self.detrend, axis=1)
+            epoch[..., use_picks, :] = detrend(
+                epoch[..., use_picks, :], self.detrend, axis=-1
+            )
 
         # Baseline correct
         if self._do_baseline:
@@ -982,7 +1068,7 @@ class BaseEpochs(
             )
 
         # Decimate if necessary (i.e., epoch not preloaded)
-        epoch = epoch[:, self._decim_slice]
+        epoch = epoch[..., self._decim_slice]
 
         # handle offset
         if self._offset is not None:
@@ -1209,27 +1295,15 @@ class BaseEpochs(
                     "If data are not preloaded, can only compute "
                     "mean or standard deviation."
                 )
-            data = np.zeros((n_channels, n_times))
-            n_events = 0
-            for e in self:
-                if np.iscomplexobj(e):
-                    data = data.astype(np.complex128)
-                data += e
-                n_events += 1
-
+            # one pass with numerically stable updates of mean and variance
+            acc = EvokedAccumulator(self.info).update(self)
+            n_events = acc.nave
             if n_events > 0:
-                data /= n_events
+                n_events, data, m2 = acc._pool()
+                if mode == "std":
+                    data = np.sqrt(m2 / n_events)
             else:
-                data.fill(np.nan)
-
-            # convert to stderr if requested, could do in one pass but do in
-            # two (slower) in case there are large numbers
-            if mode == "std":
-                data_mean = data.copy()
-                data.fill(0.0)
-                for e in self:
-                    data += (e - data_mean) ** 2
-                data = np.sqrt(data / n_events)
+                data = np.full((n_channels, n_times), np.nan)
 
         if mode == "std":
             kind = "standard_error"
@@ -1299,6 +1373,7 @@ class BaseEpochs(
             nave=n_events,
             kind=kind,
             baseline=None,
+            dtype=self._data_dtype,
         )
         evoked.baseline = self.baseline
 
@@ -1426,7 +1501,9 @@ class BaseEpochs(
         )
 
     @verbose
-    def drop_bad(self, reject="existing", flat="existing", verbose=None):
+    def drop_bad(
+        self, reject="existing", flat="existing", *, n_jobs=None, verbose=None
+    ):
         """Drop bad epochs without retaining the epochs data.
 
         Should be used before slicing operations.
@@ -1443,6 +1520,10 @@ class BaseEpochs(
         ----------
         %(reject_drop_bad)s
         %(flat_drop_bad)s
+        %(n_jobs)s
+            Blocks of epochs are read and checked in parallel.
+
+            .. versionadded:: 1.13
         %(verbose)s
 
         Returns
@@ -1467,7 +1548,7 @@ class BaseEpochs(
         if any(isinstance(rej, str) and rej != "existing" for rej in (reject, flat)):
             raise ValueError('reject and flat, if strings, must be "existing"')
         self._reject_setup(reject, flat, allow_callable=True)
-        self._get_data(out=False, verbose=verbose)
+        self._get_data(out=False, n_jobs=n_jobs, verbose=verbose)
         return self
 
     def drop_log_stats(self, ignore=("IGNORED",)):
@@ -1638,6 +1719,98 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _get_epochs_from_raw(self, idxs):
+        """Get multiple epochs from disk.
+
+        Returns
+        -------
+        data : array, shape (n_full, n_channels, n_times) | None
+            Epochs that could be loaded together, if any.
+        epochs : list
+            For each requested epoch, either the index of the epoch in
+            ``data`` or the output of :meth:`_get_epoch_from_raw`.
+        """
+        return None, [self._get_epoch_from_raw(idx) for idx in idxs]
+
+    def _get_data_dtype(self, data):
+        """Get the in-memory data type to use for data like ``data``."""
+        return _check_data_dtype(self._data_dtype, is_complex=np.iscomplexobj(data))
+
+    def _get_n_per_block(self):
+        """Get the number of epochs to process at once (~32 MB of float64)."""
+        n_values = len(self.info["ch_names"]) * len(self._raw_times)
+        return max(2**22 // max(n_values, 1), 1)
+
+    def _iter_epochs_from_raw(self, idxs):
+        """Get detrended, baseline-corrected and decimated epochs from disk."""
+        detrend_picks = self._detrend_picks
+        idxs = np.asarray(idxs, dtype=np.int64)
+        n_per = self._get_n_per_block()
+        for bi in range(0, len(idxs), n_per):
+            data, epochs = self._get_epochs_from_raw(idxs[bi : bi + n_per])
+            if data is not None:
+                data = self._detrend_offset_decim(data, detrend_picks)
+            for epoch in epochs:
+                if isinstance(epoch, int):
+                    yield data[epoch]
+                else:
+                    yield self._detrend_offset_decim(epoch, detrend_picks)
+
+    def _load_block(self, block, *, check=True, keep=True, verbose=None):
+        """Load, project and (optionally) check a block of epochs.
+
+        Returns
+        -------
+        epochs_out : list | None
+            The epochs to store or return (unprojected if the projection is
+            delayed), or None if ``keep=False``.
+        goods : list | None
+            The output of :meth:`_is_good_epochs` if ``check=True``.
+        """
+        if self.preload and not self._do_delayed_proj:  # already projected
+            epochs = epochs_out = self._data[block.start : block.stop]
+        else:
+            if self.preload:  # from memory
+                assert self._data is not None
+                epochs_noproj = [self._data[idx] for idx in block]
+            else:  # from disk
+                epochs_noproj = list(self._iter_epochs_from_raw(block))
+            epochs = [self._project_epoch(epoch) for epoch in epochs_noproj]
+            epochs_out = epochs_noproj if self._do_delayed_proj else epochs
+        goods = self._is_good_epochs(epochs, verbose=verbose) if check else None
+        return (epochs_out if keep else None), goods
+
+    def _load_blocks(self, blocks, n_jobs, *, check=True, keep=True, verbose=None):
+        """Iterate over the output of :meth:`_load_block` for blocks of epochs."""
+        if self.preload:
+            n_jobs = 1  # nothing to read
+        elif _reads_shared_fid(self._raw):
+            n_jobs = 1  # reads seek in a single shared file object
+        # Raw data and open files are shared with threads, unread Raw
+        # instances can be sent to processes to read their own part of the data
+        from .io import BaseRaw
+
+        lazy_raw = isinstance(self._raw, BaseRaw) and not self._raw.preload
+        parallel, p_fun, n_jobs = parallel_func(
+            _load_epochs_block,
+            n_jobs,
+            prefer=None if lazy_raw else "threads",
+            max_jobs=len(blocks),
+        )
+        if n_jobs == 1:
+            for block in blocks:
+                yield self._load_block(block, check=check, keep=keep, verbose=verbose)
+            return
+        # dispatch n_jobs blocks at a time to bound the memory use, quieting the
+        # logger here so that threads never change its (shared) level
+        for bi in range(0, len(blocks), n_jobs):
+            with use_log_level(_verbose_safe_false()):
+                out = parallel(
+                    p_fun(self, block, check, keep)
+                    for block in blocks[bi : bi + n_jobs]
+                )
+            yield from out
+
     def _project_epoch(self, epoch):
         """Process a raw epoch based on the delayed param."""
         # whenever requested, the first epoch is being projected.
@@ -1670,6 +1843,7 @@ class BaseEpochs(
         tmax=None,
         copy=False,
         on_empty="warn",
+        n_jobs=None,
         verbose=None,
     ):
         """Load all data, dropping bad epochs along the way.
@@ -1687,6 +1861,7 @@ class BaseEpochs(
             Start time of data to get in seconds.
         tmax : int | float | None
             End time of data to get in seconds.
+        %(n_jobs)s
         %(verbose)s
         """
         from .io.base import _get_ch_factors
@@ -1774,21 +1949,19 @@ class BaseEpochs(
                 )
 
             # we need to load from disk, drop, and return data
-            detrend_picks = self._detrend_picks
-            for ii, idx in enumerate(use_idx):
-                # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
-                epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
-                if self._do_delayed_proj:
-                    epoch_out = epoch_noproj
-                else:
-                    epoch_out = self._project_epoch(epoch_noproj)
-                if ii == 0:
-                    data = np.empty(
-                        (n_events, len(self.ch_names), len(self.times)),
-                        dtype=epoch_out.dtype,
-                    )
-                data[ii] = epoch_out
+            n_per = self._get_n_per_block()
+            blocks = [use_idx[i0 : i0 + n_per] for i0 in range(0, n_events, n_per)]
+            ii = 0
+            for epochs_out, _ in self._load_blocks(blocks, n_jobs, check=False):
+                for epoch_out in epochs_out:
+                    # faster to pre-allocate memory here
+                    if ii == 0:
+                        data = np.empty(
+                            (n_events, len(self.ch_names), len(self.times)),
+                            dtype=self._get_data_dtype(epoch_out),
+                        )
+                    data[ii] = epoch_out
+                    ii += 1
         else:
             # bads need to be dropped, this might occur after a preload
             # e.g., when calling drop_bad w/new params
@@ -1796,45 +1969,43 @@ class BaseEpochs(
             n_out = 0
             drop_log = list(self.drop_log)
             assert n_events == len(self.selection)
-            if not self.preload:
-                detrend_picks = self._detrend_picks
-            for idx, sel in enumerate(self.selection):
-                if self.preload:  # from memory
-                    assert self._data is not None
-                    if self._do_delayed_proj:
-                        epoch_noproj = self._data[idx]
-                        epoch = self._project_epoch(epoch_noproj)
-                    else:
-                        epoch_noproj = None
-                        epoch = self._data[idx]
-                else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
-                    epoch_noproj = self._detrend_offset_decim(
-                        epoch_noproj, detrend_picks
-                    )
-                    epoch = self._project_epoch(epoch_noproj)
-
-                epoch_out = epoch_noproj if self._do_delayed_proj else epoch
-                is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
-                if not is_good:
-                    assert isinstance(bad_tuple, tuple)
-                    assert all(isinstance(x, str) for x in bad_tuple)
-                    drop_log[sel] = drop_log[sel] + bad_tuple
-                    continue
-                good_idx.append(idx)
-
-                # store the epoch if there is a reason to (output or update)
-                assert epoch_out is not None
-                if out or self.preload:
-                    # faster to pre-allocate, then trim as necessary
-                    if n_out == 0 and not self.preload:
-                        data = np.empty(
-                            (n_events, epoch_out.shape[0], epoch_out.shape[1]),
-                            dtype=epoch_out.dtype,
-                            order="C",
-                        )
-                    data[n_out] = epoch_out
-                    n_out += 1
+            n_per = self._get_n_per_block()
+            blocks = [
+                range(i0, min(i0 + n_per, n_events)) for i0 in range(0, n_events, n_per)
+            ]
+            # only keep the data of lazy epochs if they are returned
+            keep = out or self.preload
+            loaded = self._load_blocks(blocks, n_jobs, keep=keep, verbose=verbose)
+            for block, (epochs_out, goods) in zip(blocks, loaded):
+                if epochs_out is None:
+                    epochs_out = [None] * len(block)
+                for idx, epoch_out, (is_good, bad_tuple) in zip(
+                    block, epochs_out, goods
+                ):
+                    sel = self.selection[idx]
+                    if not is_good:
+                        assert isinstance(bad_tuple, tuple)
+                        assert all(isinstance(x, str) for x in bad_tuple)
+                        drop_log[sel] = drop_log[sel] + bad_tuple
+                        continue
+                    good_idx.append(idx)
+
+                    # store the epoch if there is a reason to (output or update)
+                    if keep:
+                        assert epoch_out is not None
+                        # faster to pre-allocate, then trim as necessary
+                        if n_out == 0 and not self.preload:
+                            data = np.empty(
+                                (n_events, epoch_out.shape[0], epoch_out.shape[1]),
+                                dtype=self._get_data_dtype(epoch_out),
+                                order="C",
+                            )
+                        if n_out != idx or not self.preload:
+                            if not data.flags.writeable:
+                                # read-only view of the raw data, copy on write
+                                data = self._data = data.copy()
+                            data[n_out] = epoch_out
+                        n_out += 1
             self.drop_log = tuple(drop_log)
             del drop_log
 
@@ -2222,6 +2393,11 @@ class BaseEpochs(
             # deepcopy)
             if k in ("drop_log", "_raw", "_times_readonly"):
                 memodict[id(v)] = v
+            elif k == "_data" and v is not None and not v.flags.writeable:
+                # read-only views of raw data become regular arrays
+                if id(v) not in memodict:
+                    memodict[id(v)] = v.copy(order="C")
+                v = memodict[id(v)]
             else:
                 v = deepcopy(v, memodict)
             result.__dict__[k] = v
@@ -2311,8 +2487,9 @@ class BaseEpochs(
         else:
             d = self[0].get_data(copy=False)
             # this should be guaranteed by subclasses
-            assert d.dtype in (">f8", "<f8", ">c16", "<c16")
-            total_size = d.nbytes * len(self)
+            assert d.dtype in (">f4", "<f4", ">f8", "<f8", ">c8", "<c8", ">c16", "<c16")
+            # sizes are computed for double precision, like the written data
+            total_size = d.size * np.result_type(d, np.float64).itemsize * len(self)
         self._check_consistency()
         over_size = 0
         if fmt == "single":
@@ -2382,8 +2559,16 @@ class BaseEpochs(
 
         _check_option("split_naming", split_naming, ("neuromag", "bids"))
         split_fnames = _make_split_fnames(fname, n_parts, split_naming)
+        # data cannot be read lazily from files that are being overwritten
+        epochs = self
+        if any(
+            op.isfile(src) and op.isfile(dst) and op.samefile(src, dst)
+            for src in _get_source_fnames(self)
+            for dst in split_fnames
+        ):
+            epochs = self.copy().load_data()
         for part_idx, epoch_idx in enumerate(epoch_idxs):
-            this_epochs = self[epoch_idx] if n_parts > 1 else self
+            this_epochs = epochs[epoch_idx] if n_parts > 1 else epochs
             # avoid missing event_ids in splits
             this_epochs.event_id = self.event_id
 
@@ -3518,6 +3703,13 @@ class Epochs(BaseEpochs):
         .. versionadded:: 0.16
     %(event_repeated_epochs)s
     %(on_outside_epochs)s
+    %(dtype_data)s
+    %(n_jobs)s
+        Used to read and process blocks of epochs in parallel if
+        ``preload=True``; see also :meth:`~mne.Epochs.load_data` and
+        :meth:`~mne.Epochs.drop_bad`.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Attributes
@@ -3620,6 +3812,8 @@ class Epochs(BaseEpochs):
         event_repeated="error",
         *,
         on_outside="warn",
+        dtype=None,
+        n_jobs=None,
         verbose=None,
     ):
         from .io import BaseRaw
@@ -3683,31 +3877,17 @@ class Epochs(BaseEpochs):
             verbose=verbose,
             raw_sfreq=raw_sfreq,
             annotations=annotations,
+            dtype=dtype,
+            n_jobs=n_jobs,
         )
 
-    @verbose
-    def _get_epoch_from_raw(self, idx, verbose=None):
-        """Load one epoch from disk.
-
-        Returns
-        -------
-        data : array | str | None
-            If string, it's details on rejection reason.
-            If array, it's the data in the desired range (good segment)
-            If None, it means no data is available.
-        """
-        if self._raw is None:
-            # This should never happen, as raw=None only if preload=True
-            raise ValueError(
-                "An error has occurred, no valid raw file found. "
-                "Please report this to the mne-python "
-                "developers."
-            )
+    def _get_raw_lims(self, idx):
+        """Get the (reject) start and stop samples of epochs in the raw data."""
         sfreq = self._raw.info["sfreq"]
         event_samp = self.events[idx, 0]
         # Read a data segment from "start" to "stop" in samples
         first_samp = self._raw.first_samp
-        start = int(round(event_samp + self._raw_times[0] * sfreq))
+        start = np.round(event_samp + self._raw_times[0] * sfreq).astype(np.int64)
         start -= first_samp
         stop = start + len(self._raw_times)
 
@@ -3716,7 +3896,7 @@ class Epochs(BaseEpochs):
         reject_tmin = self.reject_tmin
         if reject_tmin is None:
             reject_tmin = self._raw_times[0]
-        reject_start = int(round(event_samp + reject_tmin * sfreq))
+        reject_start = np.round(event_samp + reject_tmin * sfreq).astype(np.int64)
         reject_start -= first_samp
 
         reject_tmax = self.reject_tmax
@@ -3724,7 +3904,32 @@ class Epochs(BaseEpochs):
             reject_tmax = self._raw_times[-1]
         diff = int(round((self._raw_times[-1] - reject_tmax) * sfreq))
         reject_stop = stop - diff
+        return start, stop, reject_start, reject_stop
+
+    def _check_raw(self):
+        if self._raw is None:
+            # This should never happen, as raw=None only if preload=True
+            raise ValueError(
+                "An error has occurred, no valid raw file found. "
+                "Please report this to the mne-python "
+                "developers."
+            )
+
+    @verbose
+    def _get_epoch_from_raw(self, idx, verbose=None):
+        """Load one epoch from disk.
 
+        Returns
+        -------
+        data : array | str | None
+            If string, it's details on rejection reason.
+            If array, it's the data in the desired range (good segment)
+            If None, it means no data is available.
+        """
+        self._check_raw()
+        start, stop, reject_start, reject_stop = (
+            int(x) for x in self._get_raw_lims(idx)
+        )
         logger.debug(f"    Getting epoch for {start}-{stop}")
         data = self._raw._check_bad_segment(
             start,
@@ -3736,6 +3941,141 @@ class Epochs(BaseEpochs):
         )
         return data
 
+    def _get_epochs_from_raw(self, idxs):
+        """Load multiple epochs from disk at once.
+
+        Windows of neighboring events are merged into contiguous segments,
+        which are read with a single call each.
+
+        Returns
+        -------
+        data : array, shape (n_full, n_channels, n_times) | None
+            The epochs that lie entirely within the raw data and were not
+            rejected based on annotations.
+        epochs : list
+            For each requested epoch, either the index of the epoch in
+            ``data`` or the output of :meth:`_get_epoch_from_raw`.
+        """
+        self._check_raw()
+        raw = self._raw
+        idxs = np.asarray(idxs, dtype=np.int64)
+        n_times = len(self._raw_times)
+        start, stop, reject_start, reject_stop = self._get_raw_lims(idxs)
+        epochs = [None] * len(idxs)
+        full = (start >= 0) & (stop <= raw.n_times)
+        # edge cases (missing or too-short data) go through the single-epoch path
+        for ii in np.where(~full)[0]:
+            epochs[ii] = self._get_epoch_from_raw(idxs[ii])
+        for ii, description in self._get_annotation_rejects(reject_start, reject_stop):
+            if full[ii]:
+                epochs[ii] = description
+                full[ii] = False
+        use = np.where(full)[0]
+        data = None
+        if len(use):
+            # Merge windows that overlap or are separated by less than an epoch
+            # length, so that at most about twice the necessary data are read
+            order = use[np.argsort(start[use], kind="stable")]
+            starts, stops = start[order], stop[order]
+            breaks = starts[1:] > np.maximum.accumulate(stops)[:-1] + n_times
+            span_bounds = np.concatenate([[0], np.where(breaks)[0] + 1, [len(order)]])
+            pos = np.empty(len(idxs), np.int64)
+            pos[use] = np.arange(len(use))
+            for si in range(len(span_bounds) - 1):
+                these = slice(span_bounds[si], span_bounds[si + 1])
+                span_start = starts[these][0]
+                span_stop = stops[these].max()
+                logger.debug(f"    Getting epochs for {span_start}-{span_stop}")
+                span = raw._getitem(
+                    (self.picks, slice(span_start, span_stop)), return_times=False
+                )
+                if data is None:
+                    data = np.empty((len(use), len(span), n_times), span.dtype)
+                windows = np.lib.stride_tricks.sliding_window_view(
+                    span, n_times, axis=-1
+                )
+                data[pos[order[these]]] = np.moveaxis(
+                    windows[:, starts[these] - span_start], 0, 1
+                )
+            for ii, ui in enumerate(use):
+                epochs[ui] = ii
+        return data, epochs
+
+    def _get_annotation_rejects(self, reject_start, reject_stop):
+        """Find the epochs that overlap bad annotations.
+
+        Returns
+        -------
+        rejects : list of tuple
+            The index of each rejected epoch and the description of the first
+            bad annotation it overlaps.
+        """
+        raw = self._raw
+        if not self.reject_by_annotation or len(raw.annotations) == 0:
+            return []
+        annot = raw.annotations
+        bad = np.array(
+            [desc.lower().startswith("bad") for desc in annot.description], bool
+        )
+        onset = _sync_onset(raw, annot.onset)[bad]
+        duration = annot.duration[bad]
+        description = annot.description[bad]
+        sfreq = raw.info["sfreq"]
+        # first overlapping bad annotation, if any, for each epoch
+        overlaps = (onset < np.asarray(reject_stop)[:, np.newaxis] / sfreq) & (
+            onset + duration > np.asarray(reject_start)[:, np.newaxis] / sfreq
+        )
+        return [
+            (ii, str(description[np.argmax(overlaps[ii])]))
+            for ii in np.where(overlaps.any(axis=1))[0]
+        ]
+
+    def _load_view(self):
+        """Preload the epochs as a read-only view of the preloaded raw data.
+
+        Only valid if the epochs data are unchanged copies of the raw data
+        (no baseline, detrending, decimation or projection) and all epochs
+        lie within the raw data.
+        """
+        self._check_raw()
+        _check_preload(self._raw, "Viewing epochs of raw data")
+        if self._projector is not None and self.proj and not self._do_delayed_proj:
+            raise ValueError(
+                "Epochs cannot be views of the raw data when projectors need to "
+                'be applied, use proj=False or proj="delayed" instead.'
+            )
+        assert self.detrend is None and self.baseline is None and self._decim == 1
+        idxs = np.arange(len(self.events))
+        start, _, reject_start, reject_stop = self._get_raw_lims(idxs)
+        drop_log = list(self.drop_log)
+        rejects = self._get_annotation_rejects(reject_start, reject_stop)
+        for ii, description in rejects:
+            drop_log[self.selection[ii]] += (description,)
+        self.drop_log = tuple(drop_log)
+        good = np.setdiff1d(idxs, [ii for ii, _ in rejects])
+        self._getitem(good, None, copy=False, drop_event_id=False, select_data=False)
+        self._bad_dropped = True
+        logger.info(f"{len(rejects)} bad epochs dropped")
+        start = start[good]
+        windows = np.lib.stride_tricks.sliding_window_view(
+            self._raw._data, len(self._raw_times), axis=-1
+        )
+        step = np.unique(np.diff(start))
+        if len(start) == 0:
+            start = slice(0, 0)
+        elif len(step) <= 1:
+            # evenly spaced epochs, no copy needed
+            step = int(step[0]) if len(step) else 1
+            start = slice(start[0], start[-1] + 1, step)
+        else:
+            logger.info("    Epochs are not evenly spaced, copying data")
+        self._data = np.moveaxis(windows[:, start], 0, 1)
+        assert self._data.shape[1:] == (len(self.ch_names), len(self.times))
+        self.preload = True
+        self._do_baseline = False
+        self._raw = None
+        return self
+
 
 @fill_doc
 class EpochsArray(BaseEpochs):
@@ -3769,6 +4109,7 @@ class EpochsArray(BaseEpochs):
     %(raw_sfreq)s
 
         .. versionadded:: 1.3
+    %(dtype_data)s
     %(verbose)s
 
     See Also
@@ -3815,9 +4156,10 @@ class EpochsArray(BaseEpochs):
         on_outside="warn",
         drop_log=None,
         raw_sfreq=None,
+        dtype=None,
         verbose=None,
     ):
-        dtype = np.complex128 if np.any(np.iscomplex(data)) else np.float64
+        dtype = _check_data_dtype(dtype, is_complex=np.any(np.iscomplex(data)))
         data = np.asanyarray(data, dtype=dtype)
         if data.ndim != 3:
             raise ValueError(
@@ -3852,6 +4194,7 @@ class EpochsArray(BaseEpochs):
             on_outside=on_outside,
             drop_log=drop_log,
             raw_sfreq=raw_sfreq,
+            dtype=dtype,
             verbose=verbose,
         )
         if self.baseline is not None:
@@ -3995,33 +4338,39 @@ def _minimize_time_diff(t_shorter, t_longer):
     """Find a boolean mask to minimize timing differences."""
     keep = np.ones((len(t_longer)), dtype=bool)
     # special case: length zero or one
-    if len(t_shorter) < 2:  # interp1d won't work
+    if len(t_shorter) < 2:
         keep.fill(False)
         if len(t_shorter) == 1:
             idx = np.argmin(np.abs(t_longer - t_shorter))
             keep[idx] = True
         return keep
-    scores = np.ones(len(t_longer))
-    x1 = np.arange(len(t_shorter))
-    # The first set of keep masks to test
-    kwargs = dict(copy=False, bounds_error=False, assume_sorted=True)
-    shorter_interp = interp1d(x1, t_shorter, fill_value=t_shorter[-1], **kwargs)
-    for ii in range(len(t_longer) - len(t_shorter)):
-        scores.fill(np.inf)
-        # set up the keep masks to test, eliminating any rows that are already
-        # gone
-        keep_mask = ~np.eye(len(t_longer), dtype=bool)[keep]
-        keep_mask[:, ~keep] = False
-        # Check every possible removal to see if it minimizes
-        x2 = np.arange(len(t_longer) - ii - 1)
-        t_keeps = np.array([t_longer[km] for km in keep_mask])
-        longer_interp = interp1d(
-            x2, t_keeps, axis=1, fill_value=t_keeps[:, -1], **kwargs
-        )
-        d1 = longer_interp(x1) - t_shorter
-        d2 = shorter_interp(x2) - t_keeps
-        scores[keep] = np.abs(d1, d1).sum(axis=1) + np.abs(d2, d2).sum(axis=1)
-        keep[np.argmin(scores)] = False
+    if len(t_longer) <= len(t_shorter):
+        return keep
+    # Greedily remove the event whose removal minimizes the score, which is the
+    # sum of the absolute differences between the remaining events and
+    # t_shorter (counted twice) plus, beyond the end of t_shorter, between the
+    # remaining events and t_shorter[-1]. Removing the event at position j
+    # shifts all later events by one, so all scores are a prefix sum of the
+    # unshifted plus a suffix sum of the shifted differences.
+    n_shorter = len(t_shorter)
+    t_longer = np.asarray(t_longer, float)
+    t_ref = np.full(len(t_longer) - 1, t_shorter[-1], float)
+    t_ref[:n_shorter] = t_shorter
+    weights = np.ones(len(t_ref))
+    weights[:n_shorter] = 2
+    kept = np.arange(len(t_longer))
+    t_keep = t_longer
+    scores = np.zeros(len(t_longer))
+    for n_keep in range(len(t_longer), n_shorter, -1):
+        ref, w = t_ref[: n_keep - 1], weights[: n_keep - 1]
+        score = scores[:n_keep]
+        score[0] = 0
+        np.cumsum(w * np.abs(t_keep[:-1] - ref), out=score[1:])
+        score[:-1] += np.cumsum((w * np.abs(t_keep[1:] - ref))[::-1])[::-1]
+        idx = np.argmin(score)
+        kept, t_keep = np.delete(kept, idx), np.delete(t_keep, idx)
+    keep.fill(False)
+    keep[kept] = True
     return keep
 
 
@@ -4111,7 +4460,60 @@ def _is_good(
             return False, bad_tuple
 
 
-def _read_one_epoch_file(f, tree, preload):
+def _are_good(data, ch_names, channel_type_idx, reject, flat, ignore_chs=()):
+    """Test which of the segments in data are good according to reject and flat.
+
+    Vectorized version of :func:`_is_good` (with ``full_report=True``) for
+    data of shape (n_epochs, n_channels, n_times). Returns the tuple of
+    offending channels (or reasons) for each segment, which is empty for good
+    segments.
+    """
+    n_epochs = len(data)
+    bad_tuples = [()] * n_epochs
+    has_printed = np.zeros(n_epochs, bool)
+    checkable = np.ones(len(ch_names), dtype=bool)
+    checkable[np.array([c in ignore_chs for c in ch_names], dtype=bool)] = False
+    deltas = None  # peak-to-peak amplitudes, computed once for all channels
+
+    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
+        if refl is None:
+            continue
+        for key, criterion in refl.items():
+            idx = channel_type_idx[key]
+            name = key.upper()
+            if len(idx) == 0:
+                continue
+            if callable(criterion):
+                # functions operate on one epoch at a time
+                kwargs = dict(reject=None, flat=None)
+                kwargs["flat" if t else "reject"] = {key: criterion}
+                for ei in range(n_epochs):
+                    _, bad_tuple = _is_good(
+                        data[ei],
+                        ch_names,
+                        channel_type_idx,
+                        full_report=True,
+                        ignore_chs=ignore_chs,
+                        **kwargs,
+                    )
+                    if bad_tuple is not None:
+                        bad_tuples[ei] = bad_tuples[ei] + bad_tuple
+                continue
+            if deltas is None:
+                deltas = np.max(data, axis=-1) - np.min(data, axis=-1)
+            bad = f(deltas[:, idx], criterion) & checkable[idx]
+            for ei in np.where(bad.any(axis=1))[0]:
+                bad_names = [ch_names[idx[i]] for i in np.where(bad[ei])[0]]
+                if not has_printed[ei]:
+                    logger.info(
+                        f"    Rejecting {t} epoch based on {name} : {bad_names}"
+                    )
+                    has_printed[ei] = True
+                bad_tuples[ei] = bad_tuples[ei] + tuple(bad_names)
+    return bad_tuples
+
+
+def _read_one_epoch_file(f, tree, preload, dtype=None):
     """Read a single FIF file."""
     with f as fid:
         #   Read the measurement info
@@ -4223,7 +4625,7 @@ def _read_one_epoch_file(f, tree, preload):
             raise ValueError("Epochs data not found")
         epoch_shape = (len(info["ch_names"]), n_samp)
         size_expected = len(events) * np.prod(epoch_shape)
-        # on read double-precision is always used
+        # on read double-precision is used unless requested otherwise
         if data_tag.type == FIFF.FIFFT_FLOAT:
             datatype = np.float64
             fmt = ">f4"
@@ -4236,6 +4638,7 @@ def _read_one_epoch_file(f, tree, preload):
         elif data_tag.type == FIFF.FIFFT_COMPLEX_DOUBLE:
             datatype = np.complex128
             fmt = ">c16"
+        datatype = _check_data_dtype(dtype, is_complex=fmt in (">c8", ">c16"))
         fmt_itemsize = np.dtype(fmt).itemsize
         assert fmt_itemsize in (4, 8, 16)
         size_actual = data_tag.size // fmt_itemsize - 16 // fmt_itemsize
@@ -4297,7 +4700,9 @@ def _read_one_epoch_file(f, tree, preload):
 
 
 @verbose
-def read_epochs(fname, proj=True, preload=True, verbose=None) -> "EpochsFIF":
+def read_epochs(
+    fname, proj=True, preload=True, *, dtype=None, verbose=None
+) -> "EpochsFIF":
     """Read epochs from a fif file.
 
     Parameters
@@ -4307,6 +4712,7 @@ def read_epochs(fname, proj=True, preload=True, verbose=None) -> "EpochsFIF":
     preload : bool
         If True, read all epochs from disk immediately. If ``False``, epochs
         will be read on demand.
+    %(dtype_data)s
     %(verbose)s
 
     Returns
@@ -4314,7 +4720,7 @@ def read_epochs(fname, proj=True, preload=True, verbose=None) -> "EpochsFIF":
     epochs : instance of EpochsFIF
         The epochs.
     """
-    return EpochsFIF(fname, proj, preload, verbose)
+    return EpochsFIF(fname, proj, preload, dtype=dtype, verbose=verbose)
 
 
 class _RawContainer:
@@ -4322,13 +4728,31 @@ class _RawContainer:
 
     def __init__(self, fid, data_tag, event_samps, epoch_shape, cals, fmt):
         self.fid = fid
+        self.fname = getattr(fid, "name", None)
         self.data_tag = data_tag
         self.event_samps = event_samps
+        self.event_idx = {samp: ii for ii, samp in enumerate(event_samps.tolist())}
         self.epoch_shape = epoch_shape
         self.cals = cals
         self.proj = False
         self.fmt = fmt
 
+    def memmap(self):
+        """Memory-map the on-disk epochs, None if not possible.
+
+        The map is created anew on each call, so that changes to the file
+        (e.g., when overwriting it) cannot leave us with an invalid mapping.
+        """
+        # gzip-compressed and file-like objects cannot be memory-mapped
+        if not isinstance(self.fid, io.BufferedReader):
+            return None
+        shape = (len(self.event_samps),) + tuple(self.epoch_shape)
+        offset = self.data_tag.pos + 16  # 16 = Tag header
+        size = np.prod(shape) * np.dtype(self.fmt).itemsize
+        if os.fstat(self.fid.fileno()).st_size < offset + size:
+            return None
+        return np.memmap(self.fid, dtype=self.fmt, mode="r", offset=offset, shape=shape)
+
     def __del__(self):  # noqa: D105
         self.fid.close()
 
@@ -4344,6 +4768,7 @@ class EpochsFIF(BaseEpochs):
     preload : bool
         If True, read all epochs from disk immediately. If False, epochs will
         be read on demand.
+    %(dtype_data)s
     %(verbose)s
 
     See Also
@@ -4354,7 +4779,7 @@ class EpochsFIF(BaseEpochs):
     """
 
     @verbose
-    def __init__(self, fname, proj=True, preload=True, verbose=None):
+    def __init__(self, fname, proj=True, preload=True, *, dtype=None, verbose=None):
         from .io.base import _get_fname_rep
 
         if _path_like(fname):
@@ -4393,7 +4818,7 @@ class EpochsFIF(BaseEpochs):
                 fmt,
                 annotations,
                 raw_sfreq,
-            ) = _read_one_epoch_file(fid, tree, preload)
+            ) = _read_one_epoch_file(fid, tree, preload, dtype)
 
             if (events[:, 0] < 0).any():
                 events = events.copy()
@@ -4422,6 +4847,7 @@ class EpochsFIF(BaseEpochs):
                 proj=False,
                 verbose=False,
                 raw_sfreq=raw_sfreq,
+                dtype=dtype,
             )
             epoch.baseline = baseline
             epoch._do_baseline = False  # might be superfluous but won't hurt
@@ -4500,6 +4926,7 @@ class EpochsFIF(BaseEpochs):
             verbose=verbose,
             raw_sfreq=raw_sfreq,
             annotations=annotations,
+            dtype=dtype,
             **reject_params,
         )
         self.baseline = baseline
@@ -4511,51 +4938,207 @@ class EpochsFIF(BaseEpochs):
         # annotations
         self._unsafe_annot_add = unsafe_annot_add
 
+    def _get_raw_idx(self, idx):
+        """Get the file part and position within it of an epoch."""
+        event_samp = int(self.events[idx, 0])
+        assert self._raw is not None
+        for raw in self._raw:
+            ii = raw.event_idx.get(event_samp)
+            if ii is not None:
+                return raw, ii
+        raise RuntimeError(
+            "Correct epoch could not be found, please contact mne-python developers"
+        )
+
     @verbose
     def _get_epoch_from_raw(self, idx, verbose=None):
         """Load one epoch from disk."""
         # Find the right file and offset to use
-        event_samp = self.events[idx, 0]
-        assert self._raw is not None
-        for raw in self._raw:
-            idx = np.where(raw.event_samps == event_samp)[0]
-            if len(idx) == 1:
-                fmt = raw.fmt
-                idx = idx[0]
-                size = np.prod(raw.epoch_shape) * np.dtype(fmt).itemsize
-                offset = idx * size + 16  # 16 = Tag header
-                break
+        raw, idx = self._get_raw_idx(idx)
+        fmt = raw.fmt
+        memmap = raw.memmap()
+        if memmap is not None:
+            data = memmap[idx]
         else:
-            # read the correct subset of the data
-            raise RuntimeError(
-                "Correct epoch could not be found, please contact mne-python developers"
-            )
-        # the following is equivalent to this, but faster:
-        #
-        # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
-        # >>> data *= raw.cals[np.newaxis, :, :]
-        # >>> data = data[idx]
-        #
-        # Eventually this could be refactored in io/tag.py if other functions
-        # could make use of it
-        raw.fid.seek(raw.data_tag.pos + offset, 0)
-        if fmt == ">c8":
-            read_fmt = ">f4"
-        elif fmt == ">c16":
-            read_fmt = ">f8"
-        else:
-            read_fmt = fmt
-        data = np.frombuffer(raw.fid.read(size), read_fmt)
-        if read_fmt != fmt:
-            data = data.view(fmt)
-            data = data.astype(np.complex128)
-        else:
-            data = data.astype(np.float64)
-
-        data = _reshape_view(data, raw.epoch_shape)
+            size = np.prod(raw.epoch_shape) * np.dtype(fmt).itemsize
+            offset = idx * size + 16  # 16 = Tag header
+            # the following is equivalent to this, but faster:
+            #
+            # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
+            # >>> data *= raw.cals[np.newaxis, :, :]
+            # >>> data = data[idx]
+            #
+            # Eventually this could be refactored in io/tag.py if other
+            # functions could make use of it
+            raw.fid.seek(raw.data_tag.pos + offset, 0)
+            if fmt == ">c8":
+                read_fmt = ">f4"
+            elif fmt == ">c16":
+                read_fmt = ">f8"
+            else:
+                read_fmt = fmt
+            data = np.frombuffer(raw.fid.read(size), read_fmt)
+            if read_fmt != fmt:
+                data = data.view(fmt)
+            data = _reshape_view(data, raw.epoch_shape)
+        data = data.astype(self._get_data_dtype(data))
         data *= raw.cals
         return data
 
+    def _get_epochs_from_raw(self, idxs):
+        """Load multiple epochs from disk at once.
+
+        Epochs are sliced from the memory-mapped data of each file part.
+
+        Returns
+        -------
+        data : array, shape (n_epochs, n_channels, n_times) | None
+            The epochs from file parts that can be memory-mapped.
+        epochs : list
+            For each requested epoch, either the index of the epoch in
+            ``data`` or the output of :meth:`_get_epoch_from_raw`.
+        """
+        epochs = [None] * len(idxs)
+        memmaps = [raw.memmap() for raw in self._raw]
+        by_part = dict()
+        for ii, idx in enumerate(idxs):
+            raw, raw_idx = self._get_raw_idx(idx)
+            pi = self._raw.index(raw)
+            if memmaps[pi] is None:
+                epochs[ii] = self._get_epoch_from_raw(idx)
+            else:
+                by_part.setdefault(pi, (raw, [], []))
+                by_part[pi][1].append(ii)
+                by_part[pi][2].append(raw_idx)
+        data = None
+        n_use = 0
+        for pi, (raw, use, raw_idx) in by_part.items():
+            this_data = memmaps[pi][raw_idx]
+            if data is None:
+                data = np.empty(
+                    (sum(len(p[1]) for p in by_part.values()),) + this_data.shape[1:],
+                    self._get_data_dtype(this_data),
+                )
+            data[n_use : n_use + len(use)] = this_data
+            data[n_use : n_use + len(use)] *= raw.cals
+            for ii in use:
+                epochs[ii] = n_use
+                n_use += 1
+        return data, epochs
+
+
+@fill_doc
+class EpochsConcatenated(BaseEpochs):
+    """Epochs concatenated without loading the data of the inputs.
+
+    The data are read on demand from the input `~mne.Epochs` instances, which
+    can themselves be backed by files on disk (see :func:`mne.read_epochs`
+    with ``preload=False``). Use :func:`mne.concatenate_epochs` with
+    ``preload=False`` to create instances of this class.
+
+    Parameters
+    ----------
+    epochs_list : list
+        List of `~mne.Epochs` instances to concatenate (in that order). They
+        must not be modified while the concatenated epochs are in use.
+    add_offset : bool
+        If True, a fixed offset is added to the event times from different
+        Epochs sets, such that they are easy to distinguish after the
+        concatenation.
+    %(on_mismatch_info)s
+    %(verbose)s
+
+    See Also
+    --------
+    mne.concatenate_epochs
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+
+    @verbose
+    def __init__(
+        self, epochs_list, add_offset=True, *, on_mismatch="raise", verbose=None
+    ):
+        (
+            info,
+            _,
+            raw_sfreq,
+            events,
+            event_id,
+            tmin,
+            tmax,
+            metadata,
+            baseline,
+            _,
+            drop_log,
+        ) = _concatenate_epochs(
+            epochs_list,
+            with_data=False,
+            drop_bad=True,
+            add_offset=add_offset,
+            on_mismatch=on_mismatch,
+        )
+        # map each epoch (by selection) to its input and index therein
+        drop_offsets = np.cumsum([0] + [len(epochs.drop_log) for epochs in epochs_list])
+        selection = np.concatenate(
+            [
+                offset + epochs.selection
+                for offset, epochs in zip(drop_offsets, epochs_list)
+            ]
+        ).astype(np.int64)
+        self._sel_part = np.full(len(drop_log), -1, np.int64)
+        self._sel_idx = np.full(len(drop_log), -1, np.int64)
+        self._sel_part[selection] = np.repeat(
+            np.arange(len(epochs_list)), [len(epochs) for epochs in epochs_list]
+        )
+        self._sel_idx[selection] = np.concatenate(
+            [np.arange(len(epochs)) for epochs in epochs_list]
+        )
+        # the inputs already applied their baseline correction
+        super().__init__(
+            info,
+            None,
+            events,
+            event_id,
+            tmin,
+            tmax,
+            baseline=None,
+            raw=list(epochs_list),
+            proj=False,
+            on_missing="ignore",
+            selection=selection,
+            drop_log=drop_log,
+            metadata=metadata,
+            raw_sfreq=raw_sfreq,
+            verbose=False,
+        )
+        self.baseline = baseline
+        self._do_baseline = False
+
+    def _get_epoch_from_raw(self, idx, verbose=None):
+        """Load one epoch from its input."""
+        data, _ = self._get_epochs_from_raw([idx])
+        return data[0]
+
+    def _get_epochs_from_raw(self, idxs):
+        """Load multiple epochs at once, reading each input only once."""
+        sel = self.selection[np.asarray(idxs, dtype=np.int64)]
+        parts, sel_idx = self._sel_part[sel], self._sel_idx[sel]
+        data = None
+        for pi in np.unique(parts):
+            use = np.where(parts == pi)[0]
+            this_data = self._raw[pi].get_data(
+                item=sel_idx[use], verbose=_verbose_safe_false()
+            )
+            if data is None:
+                data = np.empty(
+                    (len(sel),) + this_data.shape[1:], self._get_data_dtype(this_data)
+                )
+            data[use] = this_data
+        return data, list(range(len(sel)))
+
 
 @fill_doc
 def bootstrap(epochs, random_state=None):
@@ -4588,9 +5171,11 @@ def bootstrap(epochs, random_state=None):
 
 
 def _concatenate_epochs(
-    epochs_list, *, with_data=True, add_offset=True, on_mismatch="raise"
+    epochs_list, *, with_data=True, drop_bad=None, add_offset=True, on_mismatch="raise"
 ):
     """Auxiliary function for concatenating epochs."""
+    if drop_bad is None:
+        drop_bad = with_data
     if not isinstance(epochs_list, list | tuple):
         raise TypeError(f"epochs_list must be a list or tuple, got {type(epochs_list)}")
 
@@ -4620,8 +5205,9 @@ def _concatenate_epochs(
             epochs.set_annotations(None)
     out = epochs_list[0]
     offsets = [0]
-    if with_data:
+    if drop_bad:
         out.drop_bad()
+    if with_data:
         offsets.append(len(out))
     events = [out.events]
     metadata = [out.metadata]
@@ -4678,8 +5264,9 @@ def _concatenate_epochs(
                         f"in epochs_list[0] and to {b[k_v]} in epochs_list[{ii}]."
                     )
 
-        if with_data:
+        if drop_bad:
             epochs.drop_bad()
+        if with_data:
             offsets.append(len(epochs))
         evs = epochs.events.copy()
         if len(epochs.events) == 0:
@@ -4752,7 +5339,7 @@ def _concatenate_epochs(
 
 @verbose
 def concatenate_epochs(
-    epochs_list, add_offset=True, *, on_mismatch="raise", verbose=None
+    epochs_list, add_offset=True, *, on_mismatch="raise", preload=True, verbose=None
 ):
     """Concatenate a list of `~mne.Epochs` into one `~mne.Epochs` object.
 
@@ -4769,19 +5356,32 @@ def concatenate_epochs(
         concatenation.
         If False, the event times are unaltered during the concatenation.
     %(on_mismatch_info)s
-    %(verbose)s
 
         .. versionadded:: 0.24
+    preload : bool
+        If True (default), all data are loaded into memory. If False, the data
+        are read on demand from the input instances (and thus from their files
+        if they were read with ``preload=False``), which allows concatenating
+        more data than fit into memory, e.g. to :meth:`~mne.Epochs.save` them
+        to a split file one part at a time. The inputs must then not be
+        modified while the concatenated epochs are in use.
+
+        .. versionadded:: 1.13
+    %(verbose)s
 
     Returns
     -------
-    epochs : instance of EpochsArray
-        The result of the concatenation. All data will be loaded into memory.
+    epochs : instance of EpochsArray | instance of EpochsConcatenated
+        The result of the concatenation.
 
     Notes
     -----
     .. versionadded:: 0.9.0
     """
+    if not preload:
+        return EpochsConcatenated(
+            epochs_list, add_offset=add_offset, on_mismatch=on_mismatch
+        )
     (
         info,
         data,
@@ -5034,6 +5634,7 @@ def make_fixed_length_epochs(
     proj=True,
     overlap=0.0,
     id=1,  # noqa: A002
+    copy=True,
     verbose=None,
 ):
     """Divide continuous raw data into equal-sized consecutive epochs.
@@ -5060,6 +5661,18 @@ def make_fixed_length_epochs(
         The id to use (default 1).
 
         .. versionadded:: 0.24.0
+    copy : bool
+        If False, the raw data must be preloaded and the epochs are preloaded
+        as a read-only view of the raw data instead of a copy (``preload`` is
+        ignored), which saves memory when epochs overlap. Methods that modify
+        the data in place require :meth:`~mne.Epochs.copy` to be called first.
+        Epochs are only views if the step between them (``duration - overlap``)
+        is a whole number of samples and no epochs in between are rejected by
+        annotations, otherwise the data are copied. Projectors cannot be
+        applied, use ``proj=False`` or ``proj="delayed"`` if the raw data
+        contain inactive projectors. Default is True.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -5071,17 +5684,21 @@ def make_fixed_length_epochs(
     -----
     .. versionadded:: 0.20
     """
+    _validate_type(copy, bool, "copy")
     events = make_fixed_length_events(raw, id=id, duration=duration, overlap=overlap)
     delta = 1.0 / raw.info["sfreq"]
-    return Epochs(
+    epochs = Epochs(
         raw,
         events,
         event_id=[id],
         tmin=0,
         tmax=duration - delta,
         baseline=None,
-        preload=preload,
+        preload=preload and copy,
         reject_by_annotation=reject_by_annotation,
         proj=proj,
         verbose=verbose,
     )
+    if not copy:
+        epochs._load_view()
+    return epochs
@@ -47,6 +47,7 @@ from .utils import (
     ExtendedTimeMixin,
     SizeMixin,
     _build_data_frame,
+    _check_data_dtype,
     _check_fname,
     _check_option,
     _check_pandas_index_arguments,
@@ -54,6 +55,7 @@ from .utils import (
     _check_preload,
     _check_time_format,
     _convert_times,
+    _pl,
     _scale_dataframe_data,
     _validate_type,
     check_fname,
@@ -126,6 +128,7 @@ class Evoked(
         generally not be loaded directly, but should first be processed using
         SSS/tSSS to remove the compensation signals that may also affect brain
         activity. Can also be ``"yes"`` to load without eliciting a warning.
+    %(dtype_data)s
     %(verbose)s
 
     Attributes
@@ -171,6 +174,7 @@ class Evoked(
         kind="average",
         allow_maxshield=False,
         *,
+        dtype=None,
         verbose=None,
     ):
         _validate_type(proj, bool, "'proj'")
@@ -184,7 +188,7 @@ class Evoked(
             times,
             self.data,
             self.baseline,
-        ) = _read_evoked(fname, condition, kind, allow_maxshield)
+        ) = _read_evoked(fname, condition, kind, allow_maxshield, dtype)
         self._set_times(times)
         self._raw_times = self.times.copy()
         self._decim = 1
@@ -1473,6 +1477,7 @@ class EvokedArray(Evoked):
         Defaults to ``None``, i.e. no baseline correction.
 
         .. versionadded:: 0.23
+    %(dtype_data)s
     %(verbose)s
 
     See Also
@@ -1502,9 +1507,10 @@ class EvokedArray(Evoked):
         kind="average",
         baseline=None,
         *,
+        dtype=None,
         verbose=None,
     ):
-        dtype = np.complex128 if np.iscomplexobj(data) else np.float64
+        dtype = _check_data_dtype(dtype, is_complex=np.iscomplexobj(data))
         data = np.asanyarray(data, dtype=dtype)
 
         if data.ndim != 2:
@@ -1548,6 +1554,256 @@ class EvokedArray(Evoked):
         self._filename = None
 
 
+def _merge_moments(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+    """Merge counts, means and sums of squared deviations (Chan et al.)."""
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * (n_b / n)
+    m2 = m2_a + m2_b + np.abs(delta) ** 2 * (n_a * n_b / n)
+    return n, mean, m2
+
+
+@fill_doc
+class EvokedAccumulator:
+    """Accumulate the average of epochs incrementally.
+
+    The mean and variance of each event type are updated with Welford's
+    algorithm, so epochs can be added one at a time (e.g., as they arrive in
+    real time) or in blocks, and accumulators of different subsets of epochs
+    (e.g., computed by parallel workers) can be merged.
+
+    Parameters
+    ----------
+    %(info_not_none)s
+    tmin : float
+        Start time of the epochs in seconds. Defaults to 0.
+    event_id : dict | None
+        Mapping from event type names to the event codes passed to
+        :meth:`update`, used to name the averages per event type. Mappings of
+        the `~mne.Epochs` passed to :meth:`update` are added automatically.
+    %(baseline_evoked)s
+        The baseline is not applied, but stored in the ``baseline`` attribute
+        of the resulting `~mne.Evoked`, which is useful if the accumulated
+        epochs were already baseline-corrected. Defaults to ``None``.
+
+    See Also
+    --------
+    mne.Epochs.average
+    combine_evoked
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+
+    def __init__(self, info, tmin=0.0, *, event_id=None, baseline=None):
+        _validate_type(info, "info", "info")
+        _validate_type(event_id, (dict, None), "event_id")
+        self.info = info.copy()
+        self.tmin = float(tmin)
+        self.event_id = dict() if event_id is None else dict(event_id)
+        self.baseline = baseline
+        self._n_times = None
+        self._moments = dict()  # event -> [n, mean, m2]
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"<EvokedAccumulator | {self.nave} epoch{_pl(self.nave)}, "
+            f"{len(self._moments)} event type{_pl(self._moments)}>"
+        )
+
+    @property
+    def nave(self):
+        """The number of accumulated epochs."""
+        return sum(n for n, _, _ in self._moments.values())
+
+    def update(self, data, event=None):
+        """Add one or more epochs.
+
+        Parameters
+        ----------
+        data : array, shape ([n_epochs, ]n_channels, n_times) | Epochs | Evoked
+            The epoch(s) to add. `~mne.Epochs` are added with their event
+            codes (reading them one at a time if they are not preloaded), and
+            `~mne.Evoked` must contain a single epoch (``nave=1``), as yielded
+            by :meth:`mne.Epochs.iter_evoked`.
+        event : int | str | array-like | None
+            The event code or name of the epoch(s), or one per epoch. Ignored
+            if ``data`` is an instance of `~mne.Epochs`. If None and ``data``
+            is an instance of `~mne.Evoked`, its ``comment`` (the event code
+            for :meth:`mne.Epochs.iter_evoked`) is used.
+
+        Returns
+        -------
+        self : instance of EvokedAccumulator
+            The accumulator, modified in place.
+        """
+        from .epochs import BaseEpochs
+
+        if isinstance(data, BaseEpochs):
+            self._check_ch_names(data.ch_names)
+            self.event_id.update(data.event_id)
+            if data.preload:
+                self.update(data.get_data(copy=False), data.events[:, 2])
+            else:
+                data.__iter__()
+                while True:
+                    try:
+                        epoch, event = data.__next__(return_event_id=True)
+                    except StopIteration:
+                        break
+                    self.update(epoch, event)
+            return self
+        if isinstance(data, Evoked):
+            self._check_ch_names(data.ch_names)
+            if data.nave != 1:
+                raise ValueError(
+                    "Evoked instances must contain a single epoch (nave=1), got "
+                    f"nave={data.nave}, consider merging accumulators instead"
+                )
+            if event is None:
+                codes = {str(code): code for code in self.event_id.values()}
+                event = codes.get(data.comment, data.comment)
+            data = data.data
+        data = np.asarray(data)
+        if data.ndim == 2:
+            data = data[np.newaxis]
+        if data.ndim != 3 or data.shape[1] != self.info["nchan"]:
+            raise ValueError(
+                f"data must have shape ([n_epochs, ]{self.info['nchan']}, n_times), "
+                f"got {data.shape[1:] if data.ndim == 3 else data.shape}"
+            )
+        self._check_n_times(data.shape[2])
+        if event is None or np.ndim(event) == 0:
+            groups = [(event, slice(None))]
+        else:
+            event = np.asarray(event)
+            if event.shape != (len(data),):
+                raise ValueError(
+                    f"event must have one entry per epoch ({len(data)}), got shape "
+                    f"{event.shape}"
+                )
+            groups = [(ev.item(), event == ev) for ev in np.unique(event)]
+        for key, mask in groups:
+            block = data[mask]
+            n = len(block)
+            if n == 0:
+                continue
+            mean = block.mean(axis=0, dtype=np.result_type(block, np.float64))
+            m2 = (np.abs(block - mean) ** 2).sum(axis=0) if n > 1 else 0.0
+            self._add(key, n, mean, m2)
+        return self
+
+    def merge(self, other):
+        """Merge the epochs accumulated by another accumulator.
+
+        Parameters
+        ----------
+        other : instance of EvokedAccumulator
+            The accumulator to merge, which is not modified.
+
+        Returns
+        -------
+        self : instance of EvokedAccumulator
+            The accumulator, modified in place.
+        """
+        _validate_type(other, EvokedAccumulator, "other")
+        self._check_ch_names(other.info["ch_names"])
+        if other._n_times is not None:
+            self._check_n_times(other._n_times)
+        self.event_id.update(other.event_id)
+        for key, (n, mean, m2) in other._moments.items():
+            self._add(key, n, mean, m2)
+        return self
+
+    def finalize(self, kind="average", *, by_event_type=False, weights="nave"):
+        """Get the accumulated average.
+
+        Parameters
+        ----------
+        kind : str
+            Either ``'average'`` or ``'standard_error'``.
+        %(by_event_type)s
+        weights : ``'nave'`` | ``'equal'``
+            How event types are weighted when ``by_event_type=False``:
+            ``'nave'`` (default) pools all epochs like
+            :meth:`mne.Epochs.average`, ``'equal'`` averages the averages of
+            the event types (see :func:`mne.combine_evoked`).
+
+        Returns
+        -------
+        evoked : instance of Evoked | list of Evoked
+            The average, or a list of averages (one per event type) if
+            ``by_event_type=True``.
+        """
+        _check_option("kind", kind, ("average", "standard_error"))
+        _check_option("weights", weights, ("nave", "equal"))
+        if not self._moments:
+            raise RuntimeError("No epochs have been accumulated")
+        if by_event_type:
+            return [
+                self._to_evoked(kind, *moments, self._name(key))
+                for key, moments in self._moments.items()
+            ]
+        comment = " + ".join(self._name(key) for key in self._moments)
+        if weights == "nave":
+            return self._to_evoked(kind, *self._pool(), comment)
+        moments = list(self._moments.values())
+        w = 1.0 / len(moments)
+        mean = sum(w * mean for _, mean, _ in moments)
+        # variance of the weighted mean, like combine_evoked
+        var = sum(w**2 * m2 / n**2 for n, _, m2 in moments)
+        nave = 1.0 / sum(w**2 / n for n, _, _ in moments)
+        data = mean if kind == "average" else np.sqrt(var)
+        return self._make_evoked(data, kind, nave, comment)
+
+    def _pool(self):
+        """Merge the moments of all event types."""
+        moments = iter(self._moments.values())
+        n, mean, m2 = next(moments)
+        for other in moments:
+            n, mean, m2 = _merge_moments(n, mean, m2, *other)
+        return n, mean, m2
+
+    def _to_evoked(self, kind, n, mean, m2, comment):
+        if kind == "average":
+            data = mean
+        else:  # standard deviation over sqrt(n), like Epochs.standard_error
+            data = np.sqrt(m2 / n) / np.sqrt(n)
+        return self._make_evoked(data, kind, n, comment)
+
+    def _make_evoked(self, data, kind, nave, comment):
+        evoked = EvokedArray(
+            data, self.info, tmin=self.tmin, comment=comment, nave=nave, kind=kind
+        )
+        evoked.baseline = self.baseline
+        return evoked
+
+    def _add(self, key, n, mean, m2):
+        if key in self._moments:
+            self._moments[key] = list(_merge_moments(*self._moments[key], n, mean, m2))
+        else:
+            self._moments[key] = [n, mean.copy(), m2 + np.zeros(mean.shape)]
+
+    def _name(self, key):
+        names = {code: name for name, code in self.event_id.items()}
+        if key in names:
+            return names[key]
+        return "" if key is None else str(key)
+
+    def _check_ch_names(self, ch_names):
+        if list(ch_names) != list(self.info["ch_names"]):
+            raise ValueError("Channel names must match those of the accumulator")
+
+    def _check_n_times(self, n_times):
+        if self._n_times is None:
+            self._n_times = n_times
+        elif n_times != self._n_times:
+            raise ValueError(
+                f"Number of time points must be {self._n_times}, got {n_times}"
+            )
+
+
 def _get_entries(fid, evoked_node, allow_maxshield=False):
     """Get all evoked entries."""
     comments = list()
@@ -1721,6 +1977,8 @@ def read_evokeds(
     kind="average",
     proj=True,
     allow_maxshield=False,
+    *,
+    dtype=None,
     verbose=None,
 ) -> list[Evoked] | Evoked:
     """Read evoked dataset(s).
@@ -1756,6 +2014,7 @@ def read_evokeds(
         generally not be loaded directly, but should first be processed using
         SSS/tSSS to remove the compensation signals that may also affect brain
         activity. Can also be ``"yes"`` to load without eliciting a warning.
+    %(dtype_data)s
     %(verbose)s
 
     Returns
@@ -1795,6 +2054,7 @@ def read_evokeds(
             kind=kind,
             proj=proj,
             allow_maxshield=allow_maxshield,
+            dtype=dtype,
             verbose=verbose,
         )
         if baseline is None and evoked.baseline is None:
@@ -1813,7 +2073,9 @@ def read_evokeds(
     return out if return_list else out[0]
 
 
-def _read_evoked(fname, condition=None, kind="average", allow_maxshield=False):
+def _read_evoked(
+    fname, condition=None, kind="average", allow_maxshield=False, dtype=None
+):
     """Read evoked data from a FIF file."""
     if fname is None:
         raise ValueError("No evoked filename specified")
@@ -1971,10 +2233,7 @@ def _read_evoked(fname, condition=None, kind="average", allow_maxshield=False):
         else:
             # Put the old style epochs together
             data = np.concatenate([e.data[None, :] for e in epoch], axis=0)
-        if np.isrealobj(data):
-            data = data.astype(np.float64)
-        else:
-            data = data.astype(np.complex128)
+        data = data.astype(_check_data_dtype(dtype, is_complex=np.iscomplexobj(data)))
 
         if first_time is not None and nsamp is not None:
             times = first_time + np.arange(nsamp) / info["sfreq"]
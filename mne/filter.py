@@ -6,6 +6,7 @@
 
 from collections import Counter
 from copy import deepcopy
+from fractions import Fraction
 from functools import partial
 from math import gcd
 
@@ -14,7 +15,7 @@ from scipy import fft, signal
 from scipy.stats import f as fstat
 
 from ._fiff.pick import _picks_to_idx
-from ._ola import _COLA
+from ._ola import _COLA, _Storer
 from .cuda import (
     _fft_multiply_repeated,
     _fft_resample,
@@ -27,9 +28,11 @@ from .parallel import parallel_func
 from .utils import (
     _check_option,
     _check_preload,
+    _custom_lru_cache,
     _ensure_int,
     _pl,
     _validate_type,
+    fill_doc,
     logger,
     sum_squared,
     verbose,
@@ -39,6 +42,9 @@ from .utils import (
 # These values from Ifeachor and Jervis.
 _length_factors = dict(hann=3.1, hamming=3.3, blackman=5.0)
 
+# Number of designed filters of each kind to keep, see filter_cache_info
+_FILTER_CACHE_SIZE = 32
+
 
 def next_fast_len(target):
     """Find the next fast size of input data to `fft`, for zero-padding, etc.
@@ -331,28 +337,56 @@ def _overlap_add_filter(
             f"{n_fft}"
         )
 
-    # Figure out if we should use CUDA
-    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
-
-    # Process each row separately
     picks = _picks_to_idx(len(x), picks)
-    parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs)
-    if n_jobs == 1:
+    if isinstance(n_jobs, str):
+        # Figure out if we should use CUDA, and process each row separately
+        n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
         for p in picks:
             x[p] = _1d_overlap_filter(
                 x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft
             )
     else:
-        data_new = parallel(
-            p_fun(x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft) for p in picks
-        )
-        for pp, p in enumerate(picks):
-            x[p] = data_new[pp]
+        # Process blocks of rows with batched FFTs, using n_jobs threads
+        _, _, n_jobs = parallel_func(_overlap_filter_rows, n_jobs)
+        h_fft = fft.rfft(h, n_fft)
+        n_x_fft = n_fft * int(np.ceil(n_x / (n_fft - len(h) + 1.0)))
+        n_per = max(2**22 // n_x_fft, n_jobs, 1)
+        for start in range(0, len(picks), n_per):
+            these = picks[start : start + n_per]
+            if np.array_equal(these, np.arange(these[0], these[-1] + 1)):
+                these = slice(these[0], these[-1] + 1)  # avoid copying
+            x[these] = _overlap_filter_rows(
+                x[these], h_fft, len(h), n_edge, phase, pad, n_fft, n_jobs
+            )
 
     x = _reshape_view(x, orig_shape)
     return x
 
 
+def _overlap_filter_rows(x, h_fft, n_h, n_edge, phase, pad, n_fft, workers):
+    """Do overlap-add FFT FIR filtering of multiple rows at once."""
+    n_x = x.shape[1] + 2 * n_edge
+    n_seg = n_fft - n_h + 1
+    n_segments = int(np.ceil(n_x / float(n_seg)))
+    shift = ((n_h - 1) // 2 if phase.startswith("zero") else 0) + n_edge
+    # pad to reduce ringing, split into segments, and zero-pad each segment
+    x_ext = np.zeros((len(x), n_segments, n_fft))
+    row_ext = np.zeros(n_segments * n_seg)
+    for ii, row in enumerate(x):
+        row_ext[:n_x] = _smart_pad(row, (n_edge, n_edge), pad)
+        x_ext[ii, :, :n_seg] = row_ext.reshape(n_segments, n_seg)
+    prod = fft.rfft(x_ext, axis=-1, workers=workers)
+    del x_ext
+    prod *= h_fft
+    prod = fft.irfft(prod, n_fft, axis=-1, workers=workers)
+    # add the overlapping part (n_h - 1 <= n_seg) to the following segment
+    x_filtered = np.zeros((len(x), n_segments + 1, n_seg))
+    x_filtered[:, :-1] = prod[..., :n_seg]
+    x_filtered[:, 1:, : n_h - 1] += prod[..., n_seg:]
+    x_filtered = x_filtered.reshape(len(x), -1)[:, shift : shift + n_x - 2 * n_edge]
+    return x_filtered.astype(x.dtype, copy=False)
+
+
 def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     """Do one-dimensional overlap-add FFT FIR filtering."""
     # pad to reduce ringing
@@ -474,11 +508,6 @@ def _construct_fir_filter(
     If x is multi-dimensional, this operates along the last dimension.
     """
     assert freq[0] == 0
-    if fir_design == "firwin2":
-        fir_design = signal.firwin2
-    else:
-        assert fir_design == "firwin"
-        fir_design = partial(_firwin_design, sfreq=sfreq)
     # issue a warning if attenuation is less than this
     min_att_db = 12 if phase == "minimum-half" else 20
 
@@ -492,6 +521,26 @@ def _construct_fir_filter(
 
     # Use overlap-add filter with a fixed length
     N = _check_zero_phase_length(filter_length, phase, gain[-1])
+    h, att_db, att_freq = _design_fir_filter(
+        sfreq, freq, gain, N, phase, fir_window, fir_design
+    )
+    if att_db < min_att_db:
+        att_freq *= sfreq / 2.0
+        warn(
+            f"Attenuation at stop frequency {att_freq:0.2f} Hz is only {att_db:0.2f} "
+            "dB. Increase filter_length for higher attenuation."
+        )
+    return h.copy()  # the cached one must not be modified
+
+
+@_custom_lru_cache(_FILTER_CACHE_SIZE)
+def _design_fir_filter(sfreq, freq, gain, N, phase, fir_window, fir_design):
+    """Design a FIR filter and get its attenuation in the stop band."""
+    if fir_design == "firwin2":
+        fir_design = signal.firwin2
+    else:
+        assert fir_design == "firwin"
+        fir_design = partial(_firwin_design, sfreq=sfreq)
     # construct symmetric (linear phase) filter
     if phase == "minimum-half":
         h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
@@ -504,13 +553,7 @@ def _construct_fir_filter(
     att_db, att_freq = _filter_attenuation(h, freq, gain)
     if phase == "zero-double":
         att_db += 6
-    if att_db < min_att_db:
-        att_freq *= sfreq / 2.0
-        warn(
-            f"Attenuation at stop frequency {att_freq:0.2f} Hz is only {att_db:0.2f} "
-            "dB. Increase filter_length for higher attenuation."
-        )
-    return h
+    return h, att_db, att_freq
 
 
 def _check_zero_phase_length(N, phase, gain_nyq=0):
@@ -597,6 +640,14 @@ def estimate_ringing_samples(system, max_try=100000):
     n : int
         The approximate ringing.
     """
+    idx, converged = _estimate_ringing_samples(system, max_try)
+    if not converged:
+        warn("Could not properly estimate ringing for the filter")
+    return idx
+
+
+@_custom_lru_cache(_FILTER_CACHE_SIZE)
+def _estimate_ringing_samples(system, max_try):
     if isinstance(system, tuple):  # TF
         kind = "ba"
         b, a = system
@@ -626,9 +677,8 @@ def estimate_ringing_samples(system, max_try=100000):
             idx = (ii - 1) * n_per_chunk + last_good
             break
     else:
-        warn("Could not properly estimate ringing for the filter")
-        idx = n_per_chunk * n_chunks_max
-    return idx
+        return n_per_chunk * n_chunks_max, False
+    return idx, True
 
 
 _ftype_dict = {
@@ -847,7 +897,7 @@ def construct_iir_filter(
             for key in ("rp", "rs"):
                 if key in iir_params:
                     kwargs[key] = iir_params[key]
-            system = signal.iirfilter(**kwargs)
+            system = _design_iir_filter("iirfilter", kwargs)
             if phase in ("zero", "zero-double"):
                 ptype, pmul = "(effective, after forward-backward)", 2
             else:
@@ -862,14 +912,15 @@ def construct_iir_filter(
                 raise ValueError(
                     "iir_params must have at least 'gstop' and 'gpass' (or N) entries."
                 )
-            system = signal.iirdesign(
-                Wp,
-                Ws,
-                iir_params["gpass"],
-                iir_params["gstop"],
+            kwargs = dict(
+                wp=Wp,
+                ws=Ws,
+                gpass=iir_params["gpass"],
+                gstop=iir_params["gstop"],
                 ftype=ftype,
                 output=output,
             )
+            system = _design_iir_filter("iirdesign", kwargs)
 
     if system is None:
         raise RuntimeError("coefficients could not be created from iir_params")
@@ -906,6 +957,65 @@ def construct_iir_filter(
     return iir_params
 
 
+def _design_iir_filter(design, kwargs):
+    """Get a copy of the (cached) output of an IIR design function."""
+    return deepcopy(_design_iir_filter_cached(design, kwargs))
+
+
+@_custom_lru_cache(_FILTER_CACHE_SIZE)
+def _design_iir_filter_cached(design, kwargs):
+    return getattr(signal, design)(**kwargs)
+
+
+def filter_cache_info():
+    """Get information about the cache of filter designs.
+
+    Designing long FIR filters or estimating the ringing of IIR filters can
+    take a noticeable amount of time, so the most recently used designs are
+    cached and reused whenever a filter with the same parameters is needed
+    again, e.g., by :func:`mne.filter.create_filter` or
+    :meth:`mne.io.Raw.filter`.
+
+    Returns
+    -------
+    info : dict
+        The number of cache ``"hits"`` and ``"misses"``, the maximum number of
+        cached designs (``"maxsize"``) and the number of currently cached
+        designs (``"currsize"``) for each kind of design: FIR filters
+        (``"fir"``), IIR filters (``"iir"``) and the ringing of IIR filters
+        (``"ringing"``).
+
+    See Also
+    --------
+    clear_filter_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    return dict(
+        fir=_design_fir_filter.cache_info(),
+        iir=_design_iir_filter_cached.cache_info(),
+        ringing=_estimate_ringing_samples.cache_info(),
+    )
+
+
+def clear_filter_cache():
+    """Clear the cache of filter designs.
+
+    See Also
+    --------
+    filter_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    _design_fir_filter.cache_clear()
+    _design_iir_filter_cached.cache_clear()
+    _estimate_ringing_samples.cache_clear()
+
+
 def _check_method(method, iir_params, extra_types=()):
     """Parse method arguments."""
     allowed_types = ["iir", "fir", "fft"] + list(extra_types)
@@ -1034,6 +1144,185 @@ def filter_data(
     return data
 
 
+@verbose
+def filter_bank(
+    inst,
+    bands,
+    picks=None,
+    filter_length="auto",
+    l_trans_bandwidth="auto",
+    h_trans_bandwidth="auto",
+    n_jobs=None,
+    phase="zero",
+    fir_window="hamming",
+    fir_design="firwin",
+    skip_by_annotation=("edge", "bad_acq_skip"),
+    pad=None,
+    *,
+    envelope=False,
+    return_instances=False,
+    verbose=None,
+):
+    """Filter data in multiple frequency bands at once.
+
+    This gives the same result as calling ``inst.copy().filter(l_freq, h_freq)``
+    for each band with ``method='fir'``, but the Fourier transform of the data
+    is only computed once for all bands.
+
+    Parameters
+    ----------
+    inst : instance of Raw | Epochs | Evoked
+        The data to filter. Must be preloaded.
+    bands : list of tuple | dict
+        The ``(l_freq, h_freq)`` of each band (see :meth:`mne.io.Raw.filter`),
+        or a dict mapping band names to them, e.g.,
+        ``dict(alpha=(8, 12), beta=(13, 30))``.
+    %(picks_all_data)s
+    %(filter_length)s
+    %(l_trans_bandwidth)s
+    %(h_trans_bandwidth)s
+    %(n_jobs)s
+    %(phase)s
+    %(fir_window)s
+    %(fir_design)s
+    %(skip_by_annotation)s
+        Only used for :class:`~mne.io.Raw` instances.
+    pad : str | None
+        The type of padding to use (see :func:`mne.filter.filter_data`). None
+        (default) uses the default of ``inst.filter``, i.e.,
+        ``'reflect_limited'`` for :class:`~mne.io.Raw` and ``'edge'`` otherwise.
+    envelope : bool
+        If True, return the envelope of the filtered data (see
+        ``inst.apply_hilbert(envelope=True)``) instead of the filtered data.
+    return_instances : bool
+        If True, return a generator of filtered instances instead of an array.
+    %(verbose)s
+
+    Returns
+    -------
+    data : array, shape (n_bands, [n_epochs, ]n_channels, n_times) | generator
+        The filtered data of the picked channels, or, if
+        ``return_instances=True``, a generator of instances of the same type as
+        ``inst`` with the filtered data of each band.
+
+    See Also
+    --------
+    mne.io.Raw.filter
+    mne.io.Raw.apply_hilbert
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    from .annotations import _annotations_starts_stops
+    from .epochs import BaseEpochs
+    from .evoked import Evoked
+    from .io import BaseRaw
+
+    _validate_type(inst, (BaseRaw, BaseEpochs, Evoked), "inst")
+    _check_preload(inst, "filter_bank")
+    _validate_type(bands, (list, tuple, dict), "bands")
+    if isinstance(bands, dict):
+        bands = list(bands.values())
+    bands = [tuple(band) for band in bands]
+    if len(bands) == 0 or not all(len(band) == 2 for band in bands):
+        raise ValueError("bands must contain at least one (l_freq, h_freq) tuple")
+    _validate_type(envelope, bool, "envelope")
+    _validate_type(return_instances, bool, "return_instances")
+    data = inst._data
+    n_times = data.shape[-1]
+    _, picks = _filt_check_picks(inst.info, picks, None, None)
+    if pad is None:
+        pad = "reflect_limited" if isinstance(inst, BaseRaw) else "edge"
+    if isinstance(inst, BaseRaw):
+        onsets, ends = _annotations_starts_stops(inst, skip_by_annotation, invert=True)
+        logger.info(
+            "Filtering raw data in %d contiguous segment%s", len(onsets), _pl(onsets)
+        )
+    else:
+        onsets, ends = np.array([0]), np.array([n_times])
+    # design the filters based on the longest segment, as inst.filter does
+    max_idx = (ends - onsets).argmax()
+    hs = list()
+    for l_freq, h_freq in bands:
+        h = create_filter(
+            data[..., picks[:1], onsets[max_idx] : ends[max_idx]],
+            inst.info["sfreq"],
+            l_freq,
+            h_freq,
+            filter_length,
+            l_trans_bandwidth,
+            h_trans_bandwidth,
+            "fir",
+            None,
+            phase,
+            fir_window,
+            fir_design,
+        )
+        _check_zero_phase_length(len(h), phase)
+        hs.append(h)
+    segments = list()
+    for start, stop in zip(onsets, ends):
+        n_edge = max(max(min(len(h), stop - start) - 1, 0) for h in hs)
+        if phase == "zero-double":
+            use_hs = [np.convolve(h, h[::-1]) for h in hs]
+        else:
+            use_hs = hs
+        n_fft = next_fast_len(stop - start + 2 * n_edge + max(map(len, use_hs)) - 1)
+        h_ffts = [fft.rfft(h, n_fft) for h in use_hs]
+        shifts = [
+            n_edge + ((len(h) - 1) // 2 if phase.startswith("zero") else 0)
+            for h in use_hs
+        ]
+        segments.append((start, stop, n_edge, n_fft, h_ffts, shifts))
+    n_fft_hilbert = next_fast_len(n_times) if envelope else None
+
+    # filter each channel (of each epoch) in all bands
+    shape = data.shape[:-2] + (len(picks), n_times)
+    rows = data[..., picks, :].reshape(-1, n_times)
+    out = np.empty((len(bands), len(rows), n_times))
+    parallel, p_fun, n_jobs = parallel_func(_filter_bank_row, n_jobs)
+    if n_jobs == 1:
+        for ri, row in enumerate(rows):
+            out[:, ri] = _filter_bank_row(row, segments, pad, n_fft_hilbert)
+    else:
+        rows_out = parallel(p_fun(row, segments, pad, n_fft_hilbert) for row in rows)
+        for ri, row_out in enumerate(rows_out):
+            out[:, ri] = row_out
+    out = out.reshape((len(bands),) + shape)
+    if not return_instances:
+        return out
+    return (
+        _filter_bank_inst(inst, band_data, picks, l_freq, h_freq)
+        for band_data, (l_freq, h_freq) in zip(out, bands)
+    )
+
+
+def _filter_bank_row(x, segments, pad, n_fft_hilbert):
+    """Filter one row of data in all bands of a filter bank."""
+    # samples outside of the segments are left untouched, as in inst.filter
+    out = np.repeat(x[np.newaxis].astype(np.float64), len(segments[0][4]), 0)
+    for start, stop, n_edge, n_fft, h_ffts, shifts in segments:
+        x_ext = _smart_pad(x[start:stop].astype(np.float64), (n_edge, n_edge), pad)
+        x_fft = fft.rfft(x_ext, n_fft)
+        for bi, (h_fft, shift) in enumerate(zip(h_ffts, shifts)):
+            out[bi, start:stop] = fft.irfft(x_fft * h_fft, n_fft)[
+                shift : shift + stop - start
+            ]
+    if n_fft_hilbert is not None:
+        out = _my_hilbert(out, n_fft_hilbert, envelope=True)
+    return out
+
+
+def _filter_bank_inst(inst, data, picks, l_freq, h_freq):
+    """Create an instance with the data of one band of a filter bank."""
+    inst = inst.copy()
+    update_info, _ = _filt_check_picks(inst.info, picks, h_freq, l_freq)
+    inst._data[..., picks, :] = data
+    _filt_update_info(inst.info, update_info, l_freq, h_freq)
+    return inst
+
+
 @verbose
 def create_filter(
     data,
@@ -1526,25 +1815,7 @@ def notch_filter(
     x = _check_filterable(x, "notch filtered", "notch_filter")
     iir_params, method = _check_method(method, iir_params, ["spectrum_fit"])
 
-    if freqs is not None:
-        freqs = np.atleast_1d(freqs)
-    elif method != "spectrum_fit":
-        raise ValueError("freqs=None can only be used with method spectrum_fit")
-
-    # Only have to deal with notch_widths for non-autodetect
-    if freqs is not None:
-        if notch_widths is None:
-            notch_widths = freqs / 200.0
-        elif np.any(notch_widths < 0):
-            raise ValueError("notch_widths must be >= 0")
-        else:
-            notch_widths = np.atleast_1d(notch_widths)
-            if len(notch_widths) == 1:
-                notch_widths = notch_widths[0] * np.ones_like(freqs)
-            elif len(notch_widths) != len(freqs):
-                raise ValueError(
-                    "notch_widths must be None, scalar, or the same length as freqs"
-                )
+    freqs, notch_widths = _check_notch_freqs(freqs, notch_widths, method)
 
     if method in ("fir", "iir"):
         # Speed this up by computing the fourier coefficients once
@@ -1586,6 +1857,29 @@ def notch_filter(
     return xf
 
 
+def _check_notch_freqs(freqs, notch_widths, method):
+    if freqs is not None:
+        freqs = np.atleast_1d(freqs)
+    elif method != "spectrum_fit":
+        raise ValueError("freqs=None can only be used with method spectrum_fit")
+
+    # Only have to deal with notch_widths for non-autodetect
+    if freqs is not None:
+        if notch_widths is None:
+            notch_widths = freqs / 200.0
+        elif np.any(notch_widths < 0):
+            raise ValueError("notch_widths must be >= 0")
+        else:
+            notch_widths = np.atleast_1d(notch_widths)
+            if len(notch_widths) == 1:
+                notch_widths = notch_widths[0] * np.ones_like(freqs)
+            elif len(notch_widths) != len(freqs):
+                raise ValueError(
+                    "notch_widths must be None, scalar, or the same length as freqs"
+                )
+    return freqs, notch_widths
+
+
 def _get_window_thresh(n_times, sfreq, mt_bandwidth, p_value):
     from .time_frequency.multitaper import _compute_mt_params
 
@@ -1614,39 +1908,49 @@ def _mt_spectrum_proc(
     """Call _mt_spectrum_remove."""
     # set up array for filtering, reshape to 2D, operate on last axis
     x, orig_shape, picks = _prep_for_filtering(x, copy, picks)
+    window_fun, threshold, get_wt = _mt_spectrum_setup(
+        x.shape[-1], sfreq, mt_bandwidth, p_value, filter_length
+    )
+    parallel, p_fun, n_jobs = parallel_func(_mt_spectrum_remove_win, n_jobs)
+    # Process blocks of channels at once, bounding the size of their tapered
+    # spectra (n_channels, n_tapers, n_freqs) to ~64 MB
+    n_per = max(2**22 // (window_fun.size // 2 + 1), 1)
+    n_per = min(n_per, -(-len(picks) // n_jobs))
+    blocks = [picks[start : start + n_per] for start in range(0, len(picks), n_per)]
+    args = (sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt)
+    if n_jobs == 1:
+        data_new = [_mt_spectrum_remove_win(x[block], *args) for block in blocks]
+    else:
+        data_new = parallel(p_fun(x[block], *args) for block in blocks)
+    freq_list = list()
+    for block, (x_, f) in zip(blocks, data_new):
+        x[block] = x_
+        freq_list.extend(f)
+    _log_mt_spectrum_freqs(freq_list, line_freqs)
+
+    x = _reshape_view(x, orig_shape)
+    return x
+
+
+def _mt_spectrum_setup(n_times, sfreq, mt_bandwidth, p_value, filter_length):
     if isinstance(filter_length, str) and filter_length == "auto":
         filter_length = "10s"
     if filter_length is None:
-        filter_length = x.shape[-1]
-    filter_length = min(_to_samples(filter_length, sfreq, "", ""), x.shape[-1])
+        filter_length = n_times
+    filter_length = min(_to_samples(filter_length, sfreq, "", ""), n_times)
     get_wt = partial(
         _get_window_thresh, sfreq=sfreq, mt_bandwidth=mt_bandwidth, p_value=p_value
     )
     window_fun, threshold = get_wt(filter_length)
-    parallel, p_fun, n_jobs = parallel_func(_mt_spectrum_remove_win, n_jobs)
-    if n_jobs == 1:
-        freq_list = list()
-        for ii, x_ in enumerate(x):
-            if ii in picks:
-                x[ii], f = _mt_spectrum_remove_win(
-                    x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt
-                )
-                freq_list.append(f)
-    else:
-        data_new = parallel(
-            p_fun(x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt)
-            for xi, x_ in enumerate(x)
-            if xi in picks
-        )
-        freq_list = [d[1] for d in data_new]
-        data_new = np.array([d[0] for d in data_new])
-        x[picks, :] = data_new
+    return window_fun, threshold, get_wt
 
+
+def _log_mt_spectrum_freqs(freq_list, line_freqs):
     # report found frequencies, but do some sanitizing first by binning into
     # 1 Hz bins
-    counts = Counter(
-        sum((np.unique(np.round(ff)).tolist() for f in freq_list for ff in f), list())
-    )
+    counts = Counter()
+    for f in freq_list:
+        counts.update(np.unique(np.round(f)).tolist())
     kind = "Detected" if line_freqs is None else "Removed"
     found_freqs = (
         "\n".join(
@@ -1657,29 +1961,42 @@ def _mt_spectrum_proc(
     )
     logger.info(f"{kind} notch frequencies (Hz):\n{found_freqs}")
 
-    x = _reshape_view(x, orig_shape)
-    return x
-
 
 def _mt_spectrum_remove_win(
     x, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
 ):
-    n_times = x.shape[-1]
-    n_samples = window_fun.shape[1]
-    n_overlap = (n_samples + 1) // 2
     x_out = np.zeros_like(x)
     rm_freqs = list()
+    _mt_spectrum_cola(
+        x_out,
+        x.shape[-1],
+        rm_freqs,
+        sfreq,
+        line_freqs,
+        notch_widths,
+        window_fun,
+        threshold,
+        get_thresh,
+    ).feed(x)
+    return x_out, rm_freqs
+
+
+def _mt_spectrum_cola(
+    store, n_times, rm_freqs, sfreq, line_freqs, notch_widths, window_fun, *args
+):
+    """Set up the removal of line frequencies in overlapping windows."""
+    n_samples = window_fun.shape[1]
+    n_overlap = (n_samples + 1) // 2
 
     # Define how to process a chunk of data
     def process(x_, *, start, stop):
         out = _mt_spectrum_remove(
-            x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
+            x_, sfreq, line_freqs, notch_widths, window_fun, *args
         )
-        rm_freqs.append(out[1])
+        rm_freqs.extend(out[1])
         return (out[0],)  # must return a tuple
 
-    _COLA(process, x_out, n_times, n_samples, n_overlap, sfreq, verbose=False).feed(x)
-    return x_out, rm_freqs
+    return _COLA(process, store, n_times, n_samples, n_overlap, sfreq, verbose=False)
 
 
 def _mt_spectrum_remove(
@@ -1688,17 +2005,15 @@ def _mt_spectrum_remove(
     """Use MT-spectrum to remove line frequencies.
 
     Based on Chronux. If line_freqs is specified, all freqs within notch_width
-    of each line_freq is set to zero.
+    of each line_freq is set to zero. All rows of x are processed at once, and
+    the removed frequencies are returned for each row.
     """
-    from .time_frequency.multitaper import _mt_spectra
-
-    assert x.ndim == 1
+    assert x.ndim == 2
     if x.shape[-1] != window_fun.shape[-1]:
         window_fun, threshold = get_thresh(x.shape[-1])
     # drop the even tapers
     n_tapers = len(window_fun)
     tapers_odd = np.arange(0, n_tapers, 2)
-    tapers_even = np.arange(1, n_tapers, 2)
     tapers_use = window_fun[tapers_odd]
 
     # sum tapers for (used) odd prolates across time (n_tapers, 1)
@@ -1708,36 +2023,50 @@ def _mt_spectrum_remove(
     H0_sq = sum_squared(H0)
 
     # make "time" vector
-    rads = 2 * np.pi * (np.arange(x.size) / float(sfreq))
-
-    # compute mt_spectrum (returning n_ch, n_tapers, n_freq)
-    x_p, freqs = _mt_spectra(x[np.newaxis, :], window_fun, sfreq)
-
-    # sum of the product of x_p and H0 across tapers (1, n_freqs)
-    x_p_H0 = np.sum(x_p[:, tapers_odd, :] * H0[np.newaxis, :, np.newaxis], axis=1)
+    rads = 2 * np.pi * (np.arange(x.shape[-1]) / float(sfreq))
 
-    # resulting calculated amplitudes for all freqs
-    A = x_p_H0 / H0_sq
+    # compute tapered spectra of all rows at once like _mt_spectra, with the DC
+    # and Nyquist bins of the one-sided spectra scaled by 1 / sqrt(2)
+    x_c = x - x.mean(axis=-1, keepdims=True)
+    freqs = fft.rfftfreq(x.shape[-1], 1.0 / sfreq)
+    scale = [0, -1] if x.shape[-1] % 2 == 0 else [0]
 
     if line_freqs is None:
         # figure out which freqs to remove using F stat
 
-        # estimated coefficient
-        x_hat = A * H0[:, np.newaxis]
+        # mt_spectrum (n_ch, n_tapers, n_freqs)
+        x_p = fft.rfft(x_c[:, np.newaxis] * window_fun)
+        x_p[..., scale] /= np.sqrt(2.0)
+
+        # sum of the product of x_p and H0 across tapers (n_ch, n_freqs)
+        x_p_H0 = np.einsum("ctf,t->cf", x_p[:, tapers_odd], H0)
+
+        # resulting calculated amplitudes for all freqs
+        A = x_p_H0 / H0_sq
 
         # numerator for F-statistic
-        num = (n_tapers - 1) * (A * A.conj()).real * H0_sq
-        # denominator for F-statistic
-        den = np.sum(np.abs(x_p[:, tapers_odd, :] - x_hat) ** 2, 1) + np.sum(
-            np.abs(x_p[:, tapers_even, :]) ** 2, 1
-        )
+        A_sq = (A * A.conj()).real * H0_sq
+        num = (n_tapers - 1) * A_sq
+        # denominator for F-statistic, the residual power of the odd tapers
+        # after subtracting the estimated coefficient (x_hat = A * H0) plus the
+        # power of the even tapers, where the former is
+        # sum(abs(x_p[odd] - x_hat) ** 2) = sum(abs(x_p[odd]) ** 2) - A_sq
+        power = x_p.view(np.float64)
+        power = np.einsum("ctf,ctf->cf", power, power)
+        power = power[:, ::2] + power[:, 1::2]
+        den = np.maximum(power - A_sq, np.finfo(float).eps * power)
         den[den == 0] = np.inf
         f_stat = num / den
 
         # find frequencies to remove
-        indices = np.where(f_stat > threshold)[1]
-        rm_freqs = freqs[indices]
+        remove = f_stat > threshold
     else:
+        # without the F-test only the amplitudes are needed, and as the FFT is
+        # linear, their sum across tapers is the spectrum of the H0-weighted
+        # sum of the tapers
+        A = fft.rfft(x_c * (H0 @ tapers_use)) / H0_sq
+        A[:, scale] /= np.sqrt(2.0)
+
         # specify frequencies
         indices_1 = np.unique([np.argmin(np.abs(freqs - lf)) for lf in line_freqs])
         indices_2 = [
@@ -1746,20 +2075,18 @@ def _mt_spectrum_remove(
         ]
         indices_2 = np.where(np.any(np.array(indices_2), axis=0))[0]
         indices = np.unique(np.r_[indices_1, indices_2])
-        rm_freqs = freqs[indices]
-
-    fits = list()
-    for ind in indices:
-        c = 2 * A[0, ind]
-        fit = np.abs(c) * np.cos(freqs[ind] * rads + np.angle(c))
-        fits.append(fit)
-
-    if len(fits) == 0:
-        datafit = 0.0
-    else:
-        # fitted sinusoids are summed, and subtracted from data
-        datafit = np.sum(fits, axis=0)
-
+        remove = np.zeros(A.shape, bool)
+        remove[:, indices] = True
+    rm_freqs = [freqs[r] for r in remove]
+
+    # fitted sinusoids abs(c) * cos(freq * rads + angle(c)) with c = 2 * A are
+    # summed across the frequencies of each row, and subtracted from data
+    indices = np.where(remove.any(axis=0))[0]
+    if len(indices) == 0:
+        return x.copy(), rm_freqs
+    c = np.where(remove[:, indices], 2 * A[:, indices], 0.0)
+    phase = freqs[indices, np.newaxis] * rads
+    datafit = c.real @ np.cos(phase) - c.imag @ np.sin(phase)
     return x - datafit, rm_freqs
 
 
@@ -1791,6 +2118,20 @@ def _check_filterable(x, kind="filtered", alternative="filter"):
     return x
 
 
+def _float64_blocks(data):
+    """Get slices along the first axis of data to process in double precision.
+
+    Single-precision epochs are processed a block of epochs (~32 MB of float64)
+    at a time to bound the memory needed for the temporary double-precision
+    copies, everything else is processed at once.
+    """
+    n_per = len(data)
+    if data.dtype == np.float32 and data.ndim == 3:
+        n_per = max(2**22 // max(data[0].size, 1), 1)
+    for start in range(0, len(data), max(n_per, 1)):
+        yield slice(start, start + n_per)
+
+
 def _resamp_ratio_len(up, down, n):
     ratio = float(up) / down
     return ratio, max(int(round(ratio * n)), 1)
@@ -1925,6 +2266,172 @@ def _resample_polyphase(x, *, up, down, pad, window, n_jobs):
     return y
 
 
+# upfirdn padding modes that only depend on the samples near each edge
+_STREAM_PADS = (
+    "constant",
+    "symmetric",
+    "reflect",
+    "edge",
+    "antisymmetric",
+    "antireflect",
+    "smooth",
+)
+
+
+@fill_doc
+class Resampler:
+    """Resample a signal chunk by chunk with a polyphase filter.
+
+    Successive chunks of a signal are passed to :meth:`feed`, which returns
+    the resampled samples that can be computed so far, and :meth:`flush`
+    returns the remaining ones once the signal has ended. The concatenated
+    output is the same as resampling the whole signal at once with
+    :func:`mne.filter.resample` and ``method="polyphase"`` (if
+    ``n_times * up / down`` is an integer, otherwise the latter uses a
+    different rational approximation of the ratio), so long recordings or
+    real-time streams can be resampled without holding them in memory.
+
+    Parameters
+    ----------
+    up : float
+        Factor to upsample by.
+    down : float
+        Factor to downsample by. The ratio ``up / down`` is approximated by the
+        closest fraction with a denominator of at most one million.
+    window : str | tuple | array-like
+        The *time-domain* linear-phase window to use after upsampling the
+        signal, see :func:`scipy.signal.resample_poly` for details. The default
+        ``"auto"`` will use ``("kaiser", 5.0)``.
+    pad : str
+        The type of padding to use at the start and end of the signal. Supports
+        the modes of :func:`scipy.signal.upfirdn` that only depend on the
+        samples near the edges, i.e., all except ``"wrap"`` and ``"line"``.
+        The default ``"auto"`` means ``"reflect"``.
+
+    See Also
+    --------
+    resample
+
+    Notes
+    -----
+    The output of :meth:`feed` lags behind the input by about half of the
+    filter length, i.e. ``len(resampler.window) // (2 * resampler.up)``
+    input samples.
+
+    .. versionadded:: 1.13
+    """
+
+    def __init__(self, up=1.0, down=1.0, *, window="auto", pad="auto"):
+        _validate_type(pad, str, "pad")
+        if pad == "auto":
+            pad = "reflect"
+        _check_option("pad", pad, _STREAM_PADS)
+        ratio = Fraction(float(up)) / Fraction(float(down))
+        ratio = ratio.limit_denominator(10**6)
+        if ratio <= 0:
+            raise ValueError(f"up / down must be positive, got {float(ratio)}")
+        self.pad = pad
+        self.up, self.down = ratio.numerator, ratio.denominator
+        self.window = None
+        if self.up != self.down:
+            self.up, self.down, self.window = _prep_polyphase(
+                None, self.down, self.up, window
+            )
+            self.window = np.array(self.window, float)
+            if self.window.ndim != 1:
+                raise ValueError("window must be 1-D")
+            # same output alignment as scipy.signal.resample_poly
+            half_len = (len(self.window) - 1) // 2
+            n_pre_pad = self.down - half_len % self.down
+            self._h = np.concatenate([np.zeros(n_pre_pad), self.window * self.up])
+            self._n_pre_remove = (half_len + n_pre_pad) // self.down
+            # input samples to keep so that the padding matches at both edges
+            self._n_keep = len(self._h) // self.up + 2
+        self._buffer = None
+        self._buffer_start = 0  # index of the first buffered input sample
+        self._n_in = 0
+        self._n_out = 0
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"<Resampler | up={self.up}, down={self.down}, {self._n_in} "
+            f"sample{_pl(self._n_in)} in, {self._n_out} sample{_pl(self._n_out)} "
+            "out>"
+        )
+
+    def feed(self, data):
+        """Resample the next chunk of the signal.
+
+        Parameters
+        ----------
+        data : array, shape (..., n_times)
+            The next chunk of the signal, resampled along the last axis. All
+            chunks must have the same shape apart from the last dimension.
+
+        Returns
+        -------
+        data_resampled : array, shape (..., n_times_resampled)
+            The resampled samples that can be computed from the signal so far,
+            which can be empty.
+        """
+        data = _check_filterable(data, "resampled", "Resampler.feed")
+        if self.up == self.down:
+            self._buffer = data[..., :0].copy()
+            self._n_in += data.shape[-1]
+            self._n_out += data.shape[-1]
+            return data.copy()
+        if self._buffer is None:
+            self._buffer = data.copy()
+        else:
+            self._buffer = np.concatenate([self._buffer, data], axis=-1)
+        self._n_in += data.shape[-1]
+        if self._n_in < self._n_keep:  # not enough to pad the start like SciPy
+            return self._buffer[..., :0].copy()
+        # outputs that only depend on samples we have seen
+        stop = (self._n_in * self.up - 1) // self.down - self._n_pre_remove + 1
+        return self._emit(stop)
+
+    def flush(self):
+        """Resample the end of the signal.
+
+        Returns
+        -------
+        data_resampled : array, shape (..., n_times_resampled)
+            The remaining resampled samples, using padding after the last
+            sample of the signal. After this, the total number of output
+            samples is ``round(n_times * up / down)`` like for
+            :func:`mne.filter.resample`.
+        """
+        if self._buffer is None:
+            raise RuntimeError("No data has been passed to feed() yet")
+        if self.up == self.down:
+            return self._buffer.copy()
+        return self._emit(_resamp_ratio_len(self.up, self.down, self._n_in)[1])
+
+    def _emit(self, stop):
+        if stop <= self._n_out:
+            return self._buffer[..., :0].copy()
+        # The buffer starts at a multiple of "down", so output sample k is
+        # sample (k + n_pre_remove) * down of the upsampled, filtered signal,
+        # and the padding SciPy would use is only wrong far away from samples
+        # that are either the true edges or not needed anymore.
+        y = signal.upfirdn(self._h, self._buffer, self.up, self.down, mode=self.pad)
+        start = (
+            self._n_out + self._n_pre_remove - self._buffer_start * self.up // self.down
+        )
+        y = y[..., start : start + stop - self._n_out]
+        assert y.shape[-1] == stop - self._n_out
+        self._n_out = stop
+        # drop the samples that no future output depends on
+        n_h = len(self._h)
+        first = -(-((stop + self._n_pre_remove) * self.down - n_h + 1) // self.up)
+        first = min(first, self._n_in - self._n_keep) // self.down * self.down
+        if first > self._buffer_start:
+            self._buffer = self._buffer[..., first - self._buffer_start :]
+            self._buffer_start = first
+        return y
+
+
 def _resample_fft(x_flat, *, ratio, final_len, pad, window, npad, n_jobs):
     x_len = x_flat.shape[-1]
     pad = "reflect_limited" if pad == "auto" else pad
@@ -2454,6 +2961,7 @@ class FilterMixin:
         skip_by_annotation=("edge", "bad_acq_skip"),
         pad="edge",
         *,
+        memmap=None,
         verbose=None,
     ):
         """Filter a subset of channels/vertices.
@@ -2476,6 +2984,7 @@ class FilterMixin:
 
             .. versionadded:: 0.16.
         %(pad_fir)s
+        %(memmap_filter)s
         %(verbose)s
 
         Returns
@@ -2500,7 +3009,8 @@ class FilterMixin:
         The data are modified inplace.
 
         The object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        or ``self.load_data()``, unless ``memmap`` is used with a
+        :class:`~mne.io.Raw` instance.
 
         ``l_freq`` and ``h_freq`` are the frequencies below which and above
         which, respectively, to filter out of the data. Thus the uses are:
@@ -2530,7 +3040,13 @@ class FilterMixin:
         from .io import BaseRaw
         from .source_estimate import _BaseSourceEstimate
 
-        _check_preload(self, "inst.filter")
+        if memmap is None:
+            _check_preload(self, "inst.filter")
+        elif not isinstance(self, BaseRaw) or self.preload:
+            raise ValueError(
+                "memmap can only be used to filter Raw instances whose data "
+                "are not preloaded"
+            )
         if not isinstance(self, _BaseSourceEstimate):
             update_info, picks = _filt_check_picks(self.info, picks, l_freq, h_freq)
             s_freq = self.info["sfreq"]
@@ -2551,29 +3067,57 @@ class FilterMixin:
         else:
             onsets, ends = np.array([0]), np.array([self._data.shape[1]])
         max_idx = (ends - onsets).argmax()
-        for si, (start, stop) in enumerate(zip(onsets, ends)):
-            # Only output filter params once (for info level), and only warn
-            # once about the length criterion (longest segment is too short)
-            use_verbose = verbose if si == max_idx else "error"
-            filter_data(
-                self._data[:, start:stop],
-                s_freq,
+        if memmap is not None:
+            _filter_raw_chunked(
+                self,
+                memmap,
+                onsets,
+                ends,
+                picks,
                 l_freq,
                 h_freq,
-                picks,
                 filter_length,
                 l_trans_bandwidth,
                 h_trans_bandwidth,
                 n_jobs,
                 method,
                 iir_params,
-                copy=False,
-                phase=phase,
-                fir_window=fir_window,
-                fir_design=fir_design,
-                pad=pad,
-                verbose=use_verbose,
+                phase,
+                fir_window,
+                fir_design,
+                pad,
             )
+            onsets = ends = ()  # already filtered
+        for si, (start, stop) in enumerate(zip(onsets, ends)):
+            # Only output filter params once (for info level), and only warn
+            # once about the length criterion (longest segment is too short)
+            use_verbose = verbose if si == max_idx else "error"
+            for sl in _float64_blocks(self._data):
+                block = self._data[sl][:, start:stop]
+                # single-precision data are filtered in double precision
+                data = block.astype(np.float64) if block.dtype == np.float32 else block
+                filter_data(
+                    data,
+                    s_freq,
+                    l_freq,
+                    h_freq,
+                    picks,
+                    filter_length,
+                    l_trans_bandwidth,
+                    h_trans_bandwidth,
+                    n_jobs,
+                    method,
+                    iir_params,
+                    copy=False,
+                    phase=phase,
+                    fir_window=fir_window,
+                    fir_design=fir_design,
+                    pad=pad,
+                    verbose=use_verbose,
+                )
+                if data is not block:
+                    block[:] = data
+                use_verbose = "error"
         # update info if filter is applied to all data channels/vertices,
         # and it's not a band-stop filter
         if not isinstance(self, _BaseSourceEstimate):
@@ -2641,16 +3185,29 @@ class FilterMixin:
             return self
 
         _check_preload(self, "inst.resample")
-        self._data = resample(
-            self._data,
-            sfreq,
-            o_sfreq,
+        resamp = partial(
+            resample,
+            up=sfreq,
+            down=o_sfreq,
             npad=npad,
             window=window,
             n_jobs=n_jobs,
             pad=pad,
             method=method,
         )
+        if self._data.dtype == np.float32 and len(self._data):
+            # resample in double precision, but keep single precision in memory
+            data = None
+            for sl in _float64_blocks(self._data):
+                block = resamp(self._data[sl].astype(np.float64))
+                if data is None:
+                    data = np.empty(
+                        self._data.shape[:-1] + block.shape[-1:], np.float32
+                    )
+                data[sl] = block
+            self._data = data
+        else:
+            self._data = resamp(self._data)
         lowpass = self.info.get("lowpass")
         lowpass = np.inf if lowpass is None else lowpass
         with self.info._unlock():
@@ -2944,6 +3501,177 @@ def _filt_update_info(info, update_info, l_freq, h_freq):
                 info["highpass"] = float(l_freq)
 
 
+def _filter_raw_chunked(
+    raw,
+    fname,
+    onsets,
+    ends,
+    picks,
+    l_freq,
+    h_freq,
+    filter_length,
+    l_trans_bandwidth,
+    h_trans_bandwidth,
+    n_jobs,
+    method,
+    iir_params,
+    phase,
+    fir_window,
+    fir_design,
+    pad,
+):
+    """Filter non-preloaded raw data chunk-by-chunk into a memmap."""
+    from .io.base import _allocate_data
+
+    iir_params, method = _check_method(method, iir_params)
+    filt = create_filter(
+        None,
+        raw.info["sfreq"],
+        l_freq,
+        h_freq,
+        filter_length,
+        l_trans_bandwidth,
+        h_trans_bandwidth,
+        method,
+        iir_params,
+        phase,
+        fir_window,
+        fir_design,
+    )
+    # Each chunk is read with enough neighboring samples that the edges of
+    # the read (where padding is used) do not affect the samples kept. This
+    # makes FIR filtering exact; for IIR the forward-backward filtering is
+    # exact up to the (negligible) ringing beyond "padlen", and forward-only
+    # filtering instead carries the filter state across chunks.
+    zi = None
+    if method == "fir":
+        if len(filt) > (ends - onsets).max():
+            warn(
+                f"filter_length ({len(filt)}) is longer than the signal "
+                f"({(ends - onsets).max()}), distortion is likely. Reduce filter "
+                "length or filter a longer signal."
+            )
+        n_margin = len(filt)
+    elif phase == "forward":
+        n_margin = 0
+        zi = dict()
+    else:
+        n_margin = filt["padlen"]
+    n_chunk = max(int(round(10.0 * raw.info["sfreq"])), 2 * n_margin, 1)
+    data = _allocate_data(fname, (raw.info["nchan"], raw.n_times), raw._dtype)
+    logger.info(
+        f"Filtering in chunks of {n_chunk} samples and writing the result to {fname}"
+    )
+    # Samples outside the segments are copied as-is
+    last = 0
+    for start, stop in zip(np.append(onsets, raw.n_times), np.append(ends, 0)):
+        for this_start in range(last, start, n_chunk):
+            this_stop = min(this_start + n_chunk, start)
+            data[:, this_start:this_stop] = raw._read_segment(this_start, this_stop)
+        last = stop
+    for start, stop in zip(onsets, ends):
+        if zi is not None:
+            zi.clear()
+        for this_start in range(start, stop, n_chunk):
+            this_stop = min(this_start + n_chunk, stop)
+            read_start = max(this_start - n_margin, start)
+            read_stop = min(this_stop + n_margin, stop)
+            x = raw._read_segment(read_start, read_stop)
+            if method == "fir":
+                x = _overlap_add_filter(x, filt, None, phase, picks, n_jobs, False, pad)
+            elif zi is None:
+                x = _iir_filter(x, filt, picks, n_jobs, False, phase)
+            else:
+                x[picks] = _iir_filter_state(x[picks], filt, zi)
+            data[:, this_start:this_stop] = x[
+                :, this_start - read_start : this_stop - read_start
+            ]
+    if isinstance(data, np.memmap):
+        data.flush()
+    raw._data = data
+    raw.preload = True
+    raw._comp = None  # no longer needed
+    raw.close()
+
+
+def _mt_spectrum_raw_chunked(
+    raw,
+    fname,
+    onsets,
+    ends,
+    picks,
+    line_freqs,
+    notch_widths,
+    mt_bandwidth,
+    p_value,
+    filter_length,
+):
+    """Remove line frequencies from non-preloaded raw data into a memmap."""
+    from .io.base import _allocate_data
+
+    sfreq = raw.info["sfreq"]
+    n_chunk = max(int(round(10.0 * sfreq)), 1)
+    data = _allocate_data(fname, (raw.info["nchan"], raw.n_times), raw._dtype)
+    logger.info(
+        f"Removing line noise in chunks of {n_chunk} samples and writing the result "
+        f"to {fname}"
+    )
+    # The overlapping multitaper windows are processed as soon as all of their
+    # samples have been read, so the result is the same as for preloaded data.
+    # Samples outside the segments, and channels not picked, are copied as-is.
+    freq_list = list()
+    last = 0
+    for start, stop in zip(np.append(onsets, raw.n_times), np.append(ends, 0)):
+        for this_start in range(last, start, n_chunk):
+            this_stop = min(this_start + n_chunk, start)
+            data[:, this_start:this_stop] = raw._read_segment(this_start, this_stop)
+        last = stop
+    for start, stop in zip(onsets, ends):
+        window_fun, threshold, get_wt = _mt_spectrum_setup(
+            stop - start, sfreq, mt_bandwidth, p_value, filter_length
+        )
+        cola = _mt_spectrum_cola(
+            _Storer(data[:, start:stop], picks=picks),
+            stop - start,
+            freq_list,
+            sfreq,
+            line_freqs,
+            notch_widths,
+            window_fun,
+            threshold,
+            get_wt,
+        )
+        for this_start in range(start, stop, n_chunk):
+            this_stop = min(this_start + n_chunk, stop)
+            x = raw._read_segment(this_start, this_stop)
+            data[:, this_start:this_stop] = x
+            cola.feed(x[picks])
+    _log_mt_spectrum_freqs(freq_list, line_freqs)
+    if isinstance(data, np.memmap):
+        data.flush()
+    raw._data = data
+    raw.preload = True
+    raw._comp = None  # no longer needed
+    raw.close()
+
+
+def _iir_filter_state(x, iir_params, zi):
+    """Apply a forward IIR filter to a chunk, carrying over its state."""
+    if "sos" in iir_params:
+        sos = iir_params["sos"]
+        if "zi" not in zi:
+            _check_coefficients(sos)
+            zi["zi"] = np.zeros((len(sos), len(x), 2))
+        x, zi["zi"] = signal.sosfilt(sos, x, axis=-1, zi=zi["zi"])
+    else:
+        b, a = iir_params["b"], iir_params["a"]
+        if "zi" not in zi:
+            _check_coefficients((b, a))
+            zi["zi"] = np.zeros((len(x), max(len(a), len(b)) - 1))
+        x, zi["zi"] = signal.lfilter(b, a, x, axis=-1, zi=zi["zi"])
+    return x
+
+
 def _iir_pad_apply_unpad(x, *, func, padlen, padtype, **kwargs):
     x_out = np.reshape(x, (-1, x.shape[-1])).copy()
     for this_x in x_out:
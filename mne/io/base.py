@@ -4,12 +4,15 @@
 
 import os
 import shutil
-from collections import defaultdict
-from contextlib import nullcontext
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, nullcontext
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import timedelta
 from inspect import getfullargspec
+from io import BytesIO
+from math import gcd
 from pathlib import Path
 from typing import Any
 
@@ -32,8 +35,18 @@ from .._fiff.pick import (
     pick_info,
     pick_types,
 )
-from .._fiff.proj import ProjMixin, _proj_equal, activate_proj, setup_proj
-from .._fiff.utils import _check_orig_units, _make_split_fnames
+from .._fiff.proj import (
+    ProjMixin,
+    _proj_equal,
+    activate_proj,
+    make_projector_info,
+    setup_proj,
+)
+from .._fiff.utils import (
+    _check_orig_units,
+    _get_compression_funcs,
+    _make_split_fnames,
+)
 from .._fiff.write import (
     _NEXT_FILE_BUFFER,
     _get_split_size,
@@ -49,6 +62,7 @@ from .._fiff.write import (
     write_int,
     write_string,
 )
+from .._ola import _cola_bounds
 from ..annotations import (
     Annotations,
     _annotations_starts_stops,
@@ -61,16 +75,20 @@ from ..channels.channels import InterpolationMixin, ReferenceMixin, UpdateChanne
 from ..defaults import _handle_default
 from ..event import concatenate_events, find_events
 from ..filter import (
+    _STREAM_PADS,
     FilterMixin,
+    Resampler,
     _check_fun,
+    _check_notch_freqs,
     _check_resamp_noop,
+    _mt_spectrum_raw_chunked,
     _resamp_ratio_len,
     _resample_stim_channels,
     notch_filter,
     resample,
 )
 from ..html_templates import _get_html_template
-from ..parallel import parallel_func
+from ..parallel import _check_n_jobs, parallel_func
 from ..time_frequency.spectrum import Spectrum, SpectrumMixin, _validate_method
 from ..time_frequency.tfr import RawTFR
 from ..utils import (
@@ -373,7 +391,14 @@ class BaseRaw(
 
     @verbose
     def _read_segment(
-        self, start=0, stop=None, sel=None, data_buffer=None, *, verbose=None
+        self,
+        start=0,
+        stop=None,
+        sel=None,
+        data_buffer=None,
+        *,
+        n_jobs=None,
+        verbose=None,
     ):
         """Read a chunk of raw data.
 
@@ -391,8 +416,7 @@ class BaseRaw(
             numpy array to fill with data read, must have the correct shape.
             If str, a np.memmap with the correct data type will be used
             to store the data.
-        projector : array
-            SSP operator to apply to the data.
+        %(n_jobs_read)s
         %(verbose)s
 
         Returns
@@ -465,6 +489,7 @@ class BaseRaw(
         assert (mult is None) ^ (cals is None)  # xor
 
         # read from necessary files
+        reads = list()
         offset = 0
         for fi in np.nonzero(files_used)[0]:
             start_file = self._first_samps[fi]
@@ -480,19 +505,42 @@ class BaseRaw(
             if start_file < self._first_samps[fi] or stop_file < start_file:
                 raise ValueError("Bad array indexing, could be a bug")
             n_read = stop_file - start_file
-            this_sl = slice(offset, offset + n_read)
             # reindex back to original file
             orig_idx = _convert_slice(self._read_picks[fi][need_idx])
-            _ReadSegmentFileProtector(self)._read_segment_file(
-                data[:, this_sl],
+            reads.append((fi, orig_idx, int(start_file), int(stop_file), offset))
+            offset += n_read
+        n_jobs = 1 if n_jobs is None else _check_n_jobs(n_jobs)
+        if n_jobs > 1:
+            reads = _split_reads(
+                reads, n_jobs, self._get_buffer_size(), self._first_samps
+            )
+        logger.debug(
+            f"Reading {len(reads)} segment{_pl(reads)} using "
+            f"{n_jobs} thread{_pl(n_jobs)}"
+        )
+        reader = _ReadSegmentFileProtector(self)
+
+        def _read_one(fi, orig_idx, start_file, stop_file, offset):
+            reader._read_segment_file(
+                data[:, offset : offset + stop_file - start_file],
                 orig_idx,
                 fi,
-                int(start_file),
-                int(stop_file),
+                start_file,
+                stop_file,
                 cals,
                 mult,
             )
-            offset += n_read
+
+        if n_jobs == 1:
+            for read in reads:
+                _read_one(*read)
+        else:
+            # Each read goes to its own slice of the output, so file I/O for
+            # upcoming segments overlaps with calibration of the current ones
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [executor.submit(_read_one, *read) for read in reads]
+                for future in futures:
+                    future.result()
         return data
 
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
@@ -575,7 +623,7 @@ class BaseRaw(
         return self._getitem((picks, slice(start, stop)), return_times=False)
 
     @verbose
-    def load_data(self, *, memmap=None, verbose=None):
+    def load_data(self, *, memmap=None, n_jobs=None, verbose=None):
         """Load raw data.
 
         Parameters
@@ -584,6 +632,9 @@ class BaseRaw(
             If not ``None``, preload data into a memory-mapped file at this
             path. If ``None`` (default), preload data into RAM.
 
+            .. versionadded:: 1.13
+        %(n_jobs_read)s
+
             .. versionadded:: 1.13
         %(verbose)s
 
@@ -602,10 +653,10 @@ class BaseRaw(
         if not self.preload:
             if memmap is not None:
                 _validate_type(memmap, "path-like", "memmap")
-            self._preload_data(memmap if memmap is not None else True)
+            self._preload_data(memmap if memmap is not None else True, n_jobs=n_jobs)
         return self
 
-    def _preload_data(self, preload):
+    def _preload_data(self, preload, *, n_jobs=None):
         """Actually preload the data."""
         data_buffer = preload
         if isinstance(preload, bool | np.bool_) and not preload:
@@ -614,7 +665,7 @@ class BaseRaw(
         logger.info(
             f"Reading 0 ... {len(t) - 1}  =  {0.0:9.3f} ... {t[-1]:9.3f} secs..."
         )
-        self._data = self._read_segment(data_buffer=data_buffer)
+        self._data = self._read_segment(data_buffer=data_buffer, n_jobs=n_jobs)
         assert len(self._data) == self.info["nchan"]
         self.preload = True
         self._comp = None  # no longer needed
@@ -1078,6 +1129,110 @@ class BaseRaw(
             return data, times
         return data
 
+    @verbose
+    def iter_chunks(
+        self,
+        duration=10.0,
+        overlap=0.0,
+        picks=None,
+        *,
+        proj=False,
+        start=0,
+        stop=None,
+        verbose=None,
+    ):
+        """Iterate over contiguous chunks of data.
+
+        This allows processing long recordings that have not been preloaded
+        with memory usage proportional to the chunk duration rather than the
+        recording length.
+
+        Parameters
+        ----------
+        duration : float
+            The duration of each chunk in seconds. Any samples remaining at the
+            end that do not fill a complete chunk are added to the final chunk,
+            so it can be up to twice as long. If there are fewer samples than
+            ``duration``, a single chunk (without overlap) is returned.
+        overlap : float
+            The overlap between consecutive chunks in seconds. Must be smaller
+            than ``duration``.
+        %(picks_all)s
+        proj : bool
+            If True, apply all SSP projectors in ``raw.info["projs"]`` to each
+            chunk (even ones that are not active yet). If False (default), the
+            data are returned as :meth:`get_data` would return them, i.e., only
+            with projectors that have already been applied.
+        start : int
+            The first sample to include. Defaults to 0.
+        stop : int | None
+            End sample (first not to include). If None (default), the end of
+            the data is used.
+        %(verbose)s
+
+        Yields
+        ------
+        start : int
+            The index of the first sample of the chunk in ``raw.times``.
+        stop : int
+            The index of the first sample after the chunk in ``raw.times``.
+        data : ndarray, shape (n_channels, stop - start)
+            The data of the chunk.
+
+        Notes
+        -----
+        The chunk boundaries are the same as the ones used internally for
+        constant overlap-add processing (e.g., by :meth:`filter`), so chunks
+        can be fed to such processing directly.
+
+        .. versionadded:: 1.13
+        """
+        _validate_type(duration, "numeric", "duration")
+        _validate_type(overlap, "numeric", "overlap")
+        _validate_type(proj, bool, "proj")
+        sfreq = self.info["sfreq"]
+        n_samples = int(round(float(duration) * sfreq))
+        n_overlap = int(round(float(overlap) * sfreq))
+        if n_samples <= 0:
+            raise ValueError(f"duration must be positive, got {duration}")
+        if not 0 <= n_overlap < n_samples:
+            raise ValueError(
+                f"overlap must be non-negative and smaller than duration ({duration}), "
+                f"got {overlap}"
+            )
+        _validate_type(start, "int-like", "start", "int")
+        _validate_type(stop, ("int-like", None), "stop", "int, None")
+        picks = _picks_to_idx(self.info, picks, "all", exclude=())
+        stop = self.n_times if stop is None else min(int(stop), self.n_times)
+        start = max(int(start), 0)
+        if stop <= start:
+            raise ValueError(f"start ({start}) and stop ({stop}) yielded no samples")
+        projector = None
+        if proj and len(self.info["projs"]):
+            projector, _ = make_projector_info(self.info)
+            projector = projector[picks]
+            # only the channels the projection mixes in need to be read
+            read_picks = np.where(np.any(projector, axis=0))[0]
+            projector = projector[:, read_picks]
+        if n_samples >= stop - start:  # a single chunk without overlap
+            n_samples, n_overlap = stop - start, 0
+        starts, stops = _cola_bounds(stop - start, n_samples, n_overlap)
+        logger.info(
+            f"Iterating over {len(starts)} chunk{_pl(starts)} of (at least) "
+            f"{n_samples / sfreq:0.1f} s with {n_overlap / sfreq:0.1f} s overlap"
+        )
+        for this_start, this_stop in zip(starts + start, stops + start):
+            this_start, this_stop = int(this_start), int(this_stop)
+            if projector is None:
+                data = self._getitem(
+                    (picks, slice(this_start, this_stop)), return_times=False
+                )
+            else:
+                data = projector @ self._getitem(
+                    (read_picks, slice(this_start, this_stop)), return_times=False
+                )
+            yield this_start, this_stop, data
+
     @verbose
     def apply_function(
         self,
@@ -1189,6 +1344,8 @@ class BaseRaw(
         fir_design="firwin",
         skip_by_annotation=("edge", "bad_acq_skip"),
         pad="reflect_limited",
+        *,
+        memmap=None,
         verbose=None,
     ):
         return super().filter(
@@ -1206,6 +1363,7 @@ class BaseRaw(
             fir_design=fir_design,
             skip_by_annotation=skip_by_annotation,
             pad=pad,
+            memmap=memmap,
             verbose=verbose,
         )
 
@@ -1227,6 +1385,8 @@ class BaseRaw(
         fir_design="firwin",
         pad="reflect_limited",
         skip_by_annotation=("edge", "bad_acq_skip"),
+        *,
+        memmap=None,
         verbose=None,
     ):
         """Notch filter a subset of channels.
@@ -1266,6 +1426,7 @@ class BaseRaw(
 
             .. versionadded:: 0.15
         %(skip_by_annotation)s
+        %(memmap_notch)s
         %(verbose)s
 
         Returns
@@ -1284,7 +1445,8 @@ class BaseRaw(
         "picks". By default the data of the Raw object is modified inplace.
 
         The Raw object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        or ``self.load_data()``, unless ``memmap`` is used with
+        ``method='spectrum_fit'``.
 
         .. note:: If n_jobs > 1, more memory is required as
                   ``len(picks) * n_times`` additional time points need to
@@ -1294,12 +1456,33 @@ class BaseRaw(
         """
         fs = float(self.info["sfreq"])
         picks = _picks_to_idx(self.info, picks, exclude=(), none="data_or_ica")
-        _check_preload(self, "raw.notch_filter")
-        assert self._data is not None
+        if memmap is None:
+            _check_preload(self, "raw.notch_filter")
+        elif self.preload or method != "spectrum_fit":
+            raise ValueError(
+                "memmap can only be used with method='spectrum_fit' for Raw "
+                "instances whose data are not preloaded"
+            )
         onsets, ends = _annotations_starts_stops(self, skip_by_annotation, invert=True)
         logger.info(
             "Filtering raw data in %d contiguous segment%s", len(onsets), _pl(onsets)
         )
+        if memmap is not None:
+            freqs, notch_widths = _check_notch_freqs(freqs, notch_widths, method)
+            _mt_spectrum_raw_chunked(
+                self,
+                memmap,
+                onsets,
+                ends,
+                picks,
+                freqs,
+                notch_widths,
+                mt_bandwidth,
+                p_value,
+                filter_length,
+            )
+            return self
+        assert self._data is not None
         for si, (start, stop) in enumerate(zip(onsets, ends)):
             notch_filter(
                 self._data[:, start:stop],
@@ -1403,7 +1586,9 @@ class BaseRaw(
         For optimum performance and to make use of ``n_jobs > 1``, the raw
         object has to have the data loaded e.g. with ``preload=True`` or
         ``self.load_data()``, but this increases memory requirements. The
-        resulting raw object will have the data loaded into memory.
+        resulting raw object will have the data loaded into memory. With
+        ``method="polyphase"``, data that are not loaded are read and resampled
+        in chunks using :class:`mne.filter.Resampler`.
         """
         sfreq = float(sfreq)
         o_sfreq = float(self.info["sfreq"])
@@ -1456,8 +1641,13 @@ class BaseRaw(
         if self.preload:
             assert self._data is not None
             new_data = np.empty((len(self.ch_names), new_offsets[-1]), self._data.dtype)
+        else:
+            new_data = None
         for ri, (n_orig, n_new) in enumerate(zip(self._raw_lengths, n_news)):
             this_sl = slice(new_offsets[ri], new_offsets[ri + 1])
+            resampler = None
+            if method == "polyphase" and pad in ("auto",) + _STREAM_PADS:
+                resampler = _segment_resampler(int(n_new), int(n_orig), window, pad)
             if self.preload:
                 assert self._data is not None
                 data_chunk = self._data[:, offsets[ri] : offsets[ri + 1]]
@@ -1470,12 +1660,34 @@ class BaseRaw(
                     new_data[stim_picks, this_sl] = _resample_stim_channels(
                         data_chunk[stim_picks], n_new, data_chunk.shape[1]
                     )
+            elif resampler is not None:
+                # read all channels a chunk at a time and resample them on the fly
+                start = new_offsets[ri]
+                for _, _, data_chunk in self.iter_chunks(
+                    start=offsets[ri], stop=offsets[ri + 1], verbose="error"
+                ):
+                    if new_data is None:
+                        new_data = np.empty(
+                            (len(self.ch_names), new_offsets[-1]), data_chunk.dtype
+                        )
+                    resamp = resampler.feed(data_chunk)
+                    new_data[:, start : start + resamp.shape[1]] = resamp
+                    start += resamp.shape[1]
+                new_data[:, start : new_offsets[ri + 1]] = resampler.flush()
+                if len(stim_picks) > 0:
+                    new_data[stim_picks, this_sl] = _resample_stim_channels(
+                        self.get_data(
+                            stim_picks, offsets[ri], offsets[ri + 1], verbose="error"
+                        ),
+                        n_new,
+                        n_orig,
+                    )
             else:  # this will not be I/O efficient, but will be mem efficient
                 for ci in range(len(self.ch_names)):
                     data_chunk = self.get_data(
                         ci, offsets[ri], offsets[ri + 1], verbose="error"
                     )[0]
-                    if ci == 0 and ri == 0:
+                    if new_data is None:
                         new_data = np.empty(
                             (len(self.ch_names), new_offsets[-1]), data_chunk.dtype
                         )
@@ -1772,6 +1984,9 @@ class BaseRaw(
         overwrite=False,
         split_size="2GB",
         split_naming="neuromag",
+        *,
+        n_jobs=None,
+        compression=None,
         verbose=None,
     ):
         """Save raw data to file.
@@ -1825,6 +2040,23 @@ class BaseRaw(
         %(split_naming)s
 
             .. versionadded:: 0.17
+        n_jobs : int | None
+            The number of threads to use to read, project, and calibrate
+            upcoming data buffers while the current one is being written to
+            disk. If ``-1``, it is set to the number of CPU cores. ``None``
+            (default) means doing everything serially. The written file is
+            identical either way.
+
+            .. versionadded:: 1.13
+        compression : None | 'zlib' | 'zstd'
+            If not None, compress each data buffer independently using this
+            codec (``'zstd'`` requires the ``zstandard`` package). Such files
+            are smaller and can still be read buffer-by-buffer (e.g., with
+            ``preload=False``) by :func:`mne.io.read_raw_fif`, but they cannot
+            be read by other FIF software (e.g., MNE-C or MaxFilter). Default
+            is None, which writes standard uncompressed data buffers.
+
+            .. versionadded:: 1.13
         %(verbose)s
 
         Returns
@@ -1912,7 +2144,12 @@ class BaseRaw(
         _validate_type(split_naming, str, "split_naming")
         _check_option("split_naming", split_naming, ("neuromag", "bids"))
 
-        cfg = _RawFidWriterCfg(buffer_size, split_size, drop_small_buffer, fmt)
+        n_jobs = 1 if n_jobs is None else _check_n_jobs(n_jobs)
+        if compression is not None:
+            _get_compression_funcs(compression)  # check early
+        cfg = _RawFidWriterCfg(
+            buffer_size, split_size, drop_small_buffer, fmt, n_jobs, compression
+        )
         raw_fid_writer = _RawFidWriter(self, info, picks, projector, start, stop, cfg)
         filenames = _write_raw(raw_fid_writer, fname, split_naming, overwrite)
         return filenames
@@ -2660,6 +2897,17 @@ class BaseRaw(
             print(msg)
 
 
+def _segment_resampler(n_new, n_orig, window, pad):
+    """Get a Resampler matching resample() of a segment, None if there is none."""
+    # resample() uses the ratio of the segment lengths, which the Resampler
+    # might approximate for very long segments
+    resampler = Resampler(n_new, n_orig, window=window, pad=pad)
+    g_ = gcd(n_new, n_orig)
+    if (resampler.up, resampler.down) != (n_new // g_, n_orig // g_):
+        return None
+    return resampler
+
+
 def _allocate_data(preload, shape, dtype):
     """Allocate data in memory or in memmap for preloading."""
     if preload in (None, True):  # None comes from _read_segment
@@ -2670,6 +2918,42 @@ def _allocate_data(preload, shape, dtype):
     return data
 
 
+def _iter_threaded(func, args, n_jobs):
+    """Yield func(*arg) for each arg, computing up to 2 * n_jobs ahead in threads."""
+    if n_jobs == 1:
+        for arg in args:
+            yield func(*arg)
+        return
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        futures = deque()
+        try:
+            for arg in args:
+                futures.append(executor.submit(func, *arg))
+                if len(futures) > 2 * n_jobs:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+        finally:  # e.g., the consumer stopped early
+            for future in futures:
+                future.cancel()
+
+
+def _split_reads(reads, n_jobs, buffer_size, first_samps):
+    """Split per-file reads into buffer-aligned chunks to be read concurrently."""
+    n_total = sum(stop - start for _, _, start, stop, _ in reads)
+    # a few chunks per thread keeps all of them busy until the end
+    chunk = -(-n_total // (4 * n_jobs))
+    chunk = max(-(-chunk // buffer_size), 1) * buffer_size
+    out = list()
+    for fi, idx, start, stop, offset in reads:
+        # align to the (typical) on-disk buffer boundaries of the file
+        first = start + chunk - (start - first_samps[fi]) % chunk
+        bounds = [start] + np.arange(first, stop, chunk).tolist() + [stop]
+        for this_start, this_stop in zip(bounds[:-1], bounds[1:]):
+            out.append((fi, idx, this_start, this_stop, offset + this_start - start))
+    return out
+
+
 def _convert_slice(sel):
     if len(sel) and (np.diff(sel) == 1).all():
         return slice(sel[0], sel[-1] + 1)
@@ -2918,6 +3202,8 @@ class _RawFidWriterCfg:
     split_size: int
     drop_small_buffer: bool
     fmt: str
+    n_jobs: int
+    compression: str | None
     reset_range: bool = field(init=False)
     data_type: int = field(init=False)
 
@@ -2974,6 +3260,8 @@ class _RawFidWriter:
             self.projector,
             self.cfg.drop_small_buffer,
             self.cfg.fmt,
+            self.cfg.n_jobs,
+            self.cfg.compression,
         )
         end_block(fid, FIFF.FIFFB_MEAS)
         is_next_split = self.start < self.stop
@@ -3005,12 +3293,19 @@ def _write_raw_data(
     projector,
     drop_small_buffer,
     fmt,
+    n_jobs=1,
+    compression=None,
 ):
     # Start the raw data
     data_kind = "IAS_" if info.get("maxshield", False) else ""
     data_kind = getattr(FIFF, f"FIFFB_{data_kind}RAW_DATA")
     start_block(fid, data_kind)
 
+    compress = None
+    if compression is not None:
+        write_string(fid, FIFF.FIFF_MNE_DATA_COMPRESSION, compression)
+        compress = _get_compression_funcs(compression)[0]
+
     first_samp = raw.first_samp + start
     if first_samp != 0:
         write_int(fid, FIFF.FIFF_FIRST_SAMPLE, first_samp)
@@ -3053,12 +3348,36 @@ def _write_raw_data(
                 )
 
     cals = [ch["cal"] * ch["range"] for ch in info["chs"]]
+    skipped = np.zeros(len(firsts), bool)
+    if do_skips:
+        skipped = [
+            ((first >= sk_onsets) & (last <= sk_ends)).any()
+            for first, last in zip(firsts, lasts)
+        ]
+
+    def _get_buffer(first, last):
+        data, times = raw[picks, first:last]
+        assert len(times) == last - first
+        if projector is not None:
+            data = np.dot(projector, data)
+        return _raw_buffer_bytes(data, cals, fmt, compress)
+
+    # Prepare the data buffers (possibly ahead of time in other threads)
+    buffers = _iter_threaded(
+        _get_buffer,
+        [
+            (first, last)
+            for first, last, skip in zip(firsts, lasts, skipped)
+            if not skip
+        ],
+        n_jobs,
+    )
     # Write the blocks
     n_current_skip = 0
     new_start = start
-    for first, last in zip(firsts, lasts):
-        if do_skips:
-            if ((first >= sk_onsets) & (last <= sk_ends)).any():
+    with closing(buffers):
+        for first, last, skip in zip(firsts, lasts, skipped):
+            if skip:
                 # Track how many we have
                 n_current_skip += 1
                 continue
@@ -3070,51 +3389,47 @@ def _write_raw_data(
                 # write_nop(fid)
                 # write_nop(fid)
                 n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
-
-        if projector is not None:
-            data = np.dot(projector, data)
-
-        if drop_small_buffer and (first > start) and (len(times) < buffer_size):
-            logger.info("Skipping data chunk due to small buffer ... [done]")
-            break
-        logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
-        _write_raw_buffer(fid, data, cals, fmt)
-
-        pos = fid.tell()
-        this_buff_size_bytes = pos - pos_prev
-        overage = pos - split_size + _NEXT_FILE_BUFFER
-        if overage > 0:
-            # This should occur on the first buffer write of the file, so
-            # we should mention the space required for the meas info
-            raise ValueError(
-                f"buffer size ({this_buff_size_bytes}) is too large for the "
-                f"given split size ({split_size}) "
-                f"by {overage} bytes after writing info ({pos_prev}) and "
-                "leaving enough space "
-                f'for end tags ({_NEXT_FILE_BUFFER}): decrease "buffer_size_sec" '
-                'or increase "split_size".'
-            )
+            buffer = next(buffers)
+
+            if drop_small_buffer and (first > start) and (last - first < buffer_size):
+                logger.info("Skipping data chunk due to small buffer ... [done]")
+                break
+            logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
+            fid.write(buffer)
+
+            pos = fid.tell()
+            this_buff_size_bytes = pos - pos_prev
+            overage = pos - split_size + _NEXT_FILE_BUFFER
+            if overage > 0:
+                # This should occur on the first buffer write of the file, so
+                # we should mention the space required for the meas info
+                raise ValueError(
+                    f"buffer size ({this_buff_size_bytes}) is too large for the "
+                    f"given split size ({split_size}) "
+                    f"by {overage} bytes after writing info ({pos_prev}) and "
+                    "leaving enough space "
+                    f'for end tags ({_NEXT_FILE_BUFFER}): decrease "buffer_size_sec" '
+                    'or increase "split_size".'
+                )
 
-        new_start = last
-        # Split files if necessary, leave some space for next file info
-        # make sure we check to make sure we actually *need* another buffer
-        # with the "and" check
-        if (
-            pos >= split_size - this_buff_size_bytes - _NEXT_FILE_BUFFER
-            and first + buffer_size < stop
-        ):
-            start_block(fid, FIFF.FIFFB_REF)
-            write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
-            write_string(fid, FIFF.FIFF_REF_FILE_NAME, next_fname.name)
-            if info["meas_id"] is not None:
-                write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
-            write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
-            end_block(fid, FIFF.FIFFB_REF)
+            new_start = last
+            # Split files if necessary, leave some space for next file info
+            # make sure we check to make sure we actually *need* another buffer
+            # with the "and" check
+            if (
+                pos >= split_size - this_buff_size_bytes - _NEXT_FILE_BUFFER
+                and first + buffer_size < stop
+            ):
+                start_block(fid, FIFF.FIFFB_REF)
+                write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
+                write_string(fid, FIFF.FIFF_REF_FILE_NAME, next_fname.name)
+                if info["meas_id"] is not None:
+                    write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
+                write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
+                end_block(fid, FIFF.FIFFB_REF)
 
-            break
-        pos_prev = pos
+                break
+            pos_prev = pos
 
     end_block(fid, data_kind)
     return new_start
@@ -3154,13 +3469,11 @@ def _write_raw_metadata(fid, info, data_type, reset_range, annotations):
         _write_annotations(fid, annotations)
 
 
-def _write_raw_buffer(fid, buf, cals, fmt):
-    """Write raw buffer.
+def _raw_buffer_bytes(buf, cals, fmt, compress=None):
+    """Convert a raw buffer to the bytes of its FIF data buffer tag.
 
     Parameters
     ----------
-    fid : file descriptor
-        an open raw data file.
     buf : array
         The buffer to write.
     cals : array
@@ -3169,6 +3482,15 @@ def _write_raw_buffer(fid, buf, cals, fmt):
         'short', 'int', 'single', or 'double' for 16/32 bit int or 32/64 bit
         float for each item. This will be doubled for complex datatypes. Note
         that short and int formats cannot be used for complex data.
+    compress : callable | None
+        If not None, the function used to compress the data, in which case a
+        FIFF_MNE_COMPRESSED_DATA_BUFFER tag (whose data are the number of
+        samples followed by the compressed data) is created instead.
+
+    Returns
+    -------
+    buffer : bytes
+        The tag, ready to be written to an open raw data file.
     """
     if buf.shape[0] != len(cals):
         raise ValueError("buffer and calibration sizes do not match")
@@ -3200,7 +3522,17 @@ def _write_raw_buffer(fid, buf, cals, fmt):
     buf = buf / np.ravel(cals)[:, None]
     if cast_int:
         buf = buf.astype(np.int32)
+    fid = BytesIO()
     write_function(fid, FIFF.FIFF_DATA_BUFFER, buf)
+    buffer = fid.getvalue()
+    if compress is not None:
+        # keep the type of the uncompressed tag (in the 16-byte header)
+        type_ = np.frombuffer(buffer, ">i4", count=2)[1]
+        data = np.array(buf.shape[1], ">i4").tobytes() + compress(buffer[16:])
+        kind = FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER
+        header = np.array([kind, type_, len(data), FIFF.FIFFV_NEXT_SEQ], ">i4")
+        buffer = header.tobytes() + data
+    return buffer
 
 
 def _check_raw_compatibility(raw):
@@ -590,16 +590,30 @@ class RawGDF(BaseRaw):
         )
 
 
+def _decode_ch(raw_bytes, subtype, dtype):
+    """Decode raw bytes of shape (n_records, n_bytes) into samples."""
+    n_rec = raw_bytes.shape[0]
+    # BDF
+    if subtype == "bdf":
+        # place the three little-endian bytes in the upper part of an int32 and
+        # shift back down, which takes care of the sign (24th bit) for us
+        ch_data = np.zeros((raw_bytes.size // 3, 4), np.uint8)
+        ch_data[:, 1:] = raw_bytes.reshape(-1, 3)
+        ch_data = ch_data.view(INT32)[:, 0] >> 8
+
+    # GDF data and EDF data
+    else:
+        ch_data = np.ascontiguousarray(raw_bytes).view(dtype)
+    return ch_data.reshape(n_rec, -1)
+
+
 def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     """Read a number of samples for a single channel."""
     assert dtype is not None
     # BDF
     if subtype == "bdf":
         ch_data = read_from_file_or_buffer(fid, dtype=dtype, count=samp * dtype_byte)
-        ch_data = ch_data.reshape(-1, 3).astype(INT32)
-        ch_data = (ch_data[:, 0]) + (ch_data[:, 1] << 8) + (ch_data[:, 2] << 16)
-        # 24th bit determines the sign
-        ch_data[ch_data >= (1 << 23)] -= 1 << 24
+        ch_data = _decode_ch(ch_data[np.newaxis], subtype, dtype)[0]
 
     # GDF data and EDF data
     else:
@@ -608,6 +622,20 @@ def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     return ch_data
 
 
+def _byte_cols(ch_offsets, chs, dtype_byte):
+    """Get the byte columns within a record for a set of channels."""
+    cols = np.concatenate(
+        [
+            np.arange(ch_offsets[ci] * dtype_byte, ch_offsets[ci + 1] * dtype_byte)
+            for ci in chs
+        ]
+    )
+    # contiguous channels can be sliced rather than gathered
+    if len(cols) and (np.diff(cols) == 1).all():
+        cols = slice(cols[0], cols[-1] + 1)
+    return cols
+
+
 def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals, mult):
     """Read a chunk of raw data."""
     n_samps = raw_extras["n_samps"]
@@ -619,16 +647,26 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
     orig_sel = raw_extras["sel"]
     tal_idx = raw_extras.get("tal_idx", np.empty(0, int))
     subtype = raw_extras["subtype"]
-    cal = raw_extras["cal"]
-    offsets = raw_extras["offsets"]
-    gains = raw_extras["units"]
+    cal = np.asarray(raw_extras["cal"])
+    offsets = np.asarray(raw_extras["offsets"])
+    gains = np.asarray(raw_extras["units"])
 
-    read_sel = np.concatenate([orig_sel[idx], tal_idx])
     tal_data = []
-
-    # only try to read the stim channel if it's not None and it's
-    # actually one of the requested channels
     idx_arr = np.arange(idx.start, idx.stop) if isinstance(idx, slice) else idx
+    idx_arr = np.asarray(idx_arr, dtype=int)
+
+    # Only the requested channels are decoded. Within each record the samples
+    # of a channel are stored contiguously, so the channels that share a number
+    # of samples per record (and are not stim channels, which need special
+    # handling) can be gathered and decoded in a single vectorized operation
+    groups = dict()
+    stim_pos = list()
+    for pos, orig_idx in enumerate(idx_arr):
+        if orig_idx in stim_channel_idxs:
+            stim_pos.append(pos)
+        else:
+            groups.setdefault(n_samps[orig_sel[orig_idx]], []).append(pos)
+    groups = [np.array(pos, int) for pos in groups.values()]
 
     # We could read this one EDF block at a time, which would be this:
     ch_offsets = np.cumsum(np.concatenate([[0], n_samps]), dtype=np.int64)
@@ -636,68 +674,79 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
     # But to speed it up, we really need to read multiple blocks at once,
     # Otherwise we can end up with e.g. 18,181 chunks for a 20 MB file!
     # Let's do ~10 MB chunks:
-    n_per = max(10 * 1024 * 1024 // (ch_offsets[-1] * dtype_byte), 1)
+    rec_bytes = ch_offsets[-1] * dtype_byte
+    n_per = max(10 * 1024 * 1024 // rec_bytes, 1)
+    group_cols = [
+        _byte_cols(ch_offsets, orig_sel[idx_arr[pos]], dtype_byte) for pos in groups
+    ]
+    tal_cols = [_byte_cols(ch_offsets, [ci], dtype_byte) for ci in tal_idx]
 
     with _gdf_edf_get_fid(filenames, buffering=0) as fid:
         # Extract data
-        start_offset = data_offset + block_start_idx * ch_offsets[-1] * dtype_byte
+        start_offset = data_offset + block_start_idx * rec_bytes
 
-        # first read everything into the `ones` array. For channels with
-        # lower sampling frequency, there will be zeros left at the end of the
-        # row. Ignore TAL/annotations channel and only store `orig_sel`
-        ones = np.zeros((len(orig_sel), data.shape[-1]), dtype=data.dtype)
+        # first read everything into the `ones` array, which has one row per
+        # requested channel. For channels with lower sampling frequency, there
+        # will be zeros left at the end of the row.
+        ones = np.zeros((len(idx_arr), data.shape[-1]), dtype=data.dtype)
         # save how many samples have already been read per channel
-        n_smp_read = [0 for _ in range(len(orig_sel))]
+        n_smp_read = np.zeros(len(idx_arr), np.int64)
 
         # read data in chunks
         for ai in range(0, len(r_lims), n_per):
-            block_offset = ai * ch_offsets[-1] * dtype_byte
+            block_offset = ai * rec_bytes
             n_read = min(len(r_lims) - ai, n_per)
             fid.seek(start_offset + block_offset, 0)
-            # Read and reshape to (n_chunks_read, ch0_ch1_ch2_ch3...)
-            many_chunk = _read_ch(
-                fid, subtype, ch_offsets[-1] * n_read, dtype_byte, dtype
+            # Read and reshape to (n_chunks_read, ch0_ch1_ch2_ch3...) bytes
+            many_chunk = read_from_file_or_buffer(
+                fid, dtype=np.uint8, count=rec_bytes * n_read
             ).reshape(n_read, -1)
             r_sidx = r_lims[ai][0]
             r_eidx = buf_len * (n_read - 1) + r_lims[ai + n_read - 1][1]
 
-            # loop over selected channels, ci=channel selection
-            for ii, ci in enumerate(read_sel):
-                # This now has size (n_chunks_read, n_samp[ci])
-                ch_data = many_chunk[:, ch_offsets[ci] : ch_offsets[ci + 1]].copy()
-
-                # annotation channel has to be treated separately
-                if ci in tal_idx:
-                    tal_data.append(ch_data)
-                    continue
-
-                orig_idx = idx_arr[ii]
+            for pos, cols in zip(groups, group_cols):
+                orig_idx = idx_arr[pos]
+                # This now has size (n_chunks_read, n_channels, n_samp)
+                ch_data = _decode_ch(many_chunk[:, cols], subtype, dtype)
+                ch_data = ch_data.reshape(n_read, len(pos), -1)
+                ch_data = ch_data * cal[orig_idx][:, np.newaxis]
+                ch_data += offsets[orig_idx][:, np.newaxis]
+                ch_data *= gains[orig_idx][:, np.newaxis]
+                ch_data = ch_data.transpose(1, 0, 2).reshape(len(pos), -1)
+                one = ch_data[:, r_sidx:r_eidx]
+                # note how many samples have been read
+                smp_read = n_smp_read[pos[0]]
+                ones[pos, smp_read : smp_read + one.shape[1]] = one
+                n_smp_read[pos] += one.shape[1]
+
+            for pos in stim_pos:
+                orig_idx = idx_arr[pos]
+                ci = orig_sel[orig_idx]
+                cols = _byte_cols(ch_offsets, [ci], dtype_byte)
+                ch_data = _decode_ch(many_chunk[:, cols], subtype, dtype)
                 ch_data = ch_data * cal[orig_idx]
                 ch_data += offsets[orig_idx]
                 ch_data *= gains[orig_idx]
-
-                assert ci == orig_sel[orig_idx]
-
                 if n_samps[ci] != buf_len:
-                    if orig_idx in stim_channel_idxs:
-                        # Stim channel will be interpolated
-                        old = np.linspace(0, 1, n_samps[ci] + 1, True)
-                        new = np.linspace(0, 1, buf_len, False)
-                        ch_data = np.append(ch_data, np.zeros((len(ch_data), 1)), -1)
-                        ch_data = interp1d(old, ch_data, kind="zero", axis=-1)(new)
-                elif orig_idx in stim_channel_idxs:
+                    # Stim channel will be interpolated
+                    old = np.linspace(0, 1, n_samps[ci] + 1, True)
+                    new = np.linspace(0, 1, buf_len, False)
+                    ch_data = np.append(ch_data, np.zeros((len(ch_data), 1)), -1)
+                    ch_data = interp1d(old, ch_data, kind="zero", axis=-1)(new)
+                else:
                     ch_data = np.bitwise_and(ch_data.astype(int), 2**17 - 1)
-
                 one_i = ch_data.ravel()[r_sidx:r_eidx]
+                smp_read = n_smp_read[pos]
+                ones[pos, smp_read : smp_read + len(one_i)] = one_i
+                n_smp_read[pos] += len(one_i)
 
-                # note how many samples have been read
-                smp_read = n_smp_read[orig_idx]
-                ones[orig_idx, smp_read : smp_read + len(one_i)] = one_i
-                n_smp_read[orig_idx] += len(one_i)
+            # annotation channel has to be treated separately
+            for cols in tal_cols:
+                tal_data.append(_decode_ch(many_chunk[:, cols], subtype, dtype))
 
         # resample channels with lower sample frequency
         # skip if no data was requested, ie. only annotations were read
-        if any(n_smp_read) > 0:
+        if n_smp_read.any():
             # expected number of samples, equals maximum sfreq
             smp_exp = data.shape[-1]
 
@@ -731,7 +780,7 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
                     "See also https://github.com/mne-tools/mne-python/issues/10635"
                 )
 
-            _mult_cal_one(data[:, :], ones, idx, cals, mult)
+            _mult_cal_one(data[:, :], ones, slice(None), cals, mult)
 
     if len(tal_data) > 1:
         tal_data = np.concatenate([tal.ravel() for tal in tal_data])
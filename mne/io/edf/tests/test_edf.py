@@ -199,6 +199,26 @@ def test_bdf_crop_save_stim_channel(tmp_path):
     raw.save(tmp_path / "test-raw.fif", tmin=1.2, tmax=4.0, overwrite=True)
 
 
+@pytest.mark.parametrize(
+    "fname, reader", [(bdf_path, read_raw_bdf), (edf_path, read_raw_edf)]
+)
+def test_edf_bdf_random_access(fname, reader):
+    """Test reading windows of channel subsets without preloading."""
+    rng = np.random.default_rng(0)
+    raw = reader(fname, preload=False)
+    data = reader(fname, preload=True).get_data()
+    n_times = len(raw.times)
+    for start in (0, 5, n_times // 3, n_times - 100):
+        stop = min(start + rng.integers(1, 3000), n_times)
+        picks = np.sort(rng.choice(len(raw.ch_names), 7, replace=False))
+        got = raw.get_data(picks, start=start, stop=stop)
+        assert_array_equal(got, data[picks, start:stop])
+        # channels in arbitrary order
+        picks = picks[::-1]
+        got = raw.get_data(picks, start=start, stop=stop)
+        assert_array_equal(got, data[picks, start:stop])
+
+
 @testing.requires_testing_data
 @pytest.mark.parametrize(
     "fname",
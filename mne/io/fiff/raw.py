@@ -4,6 +4,7 @@
 
 import copy
 import os.path as op
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 
@@ -12,15 +13,16 @@ import numpy as np
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import read_meas_info
 from ..._fiff.open import _fiff_get_fid, _get_next_fname, fiff_open
-from ..._fiff.tag import _call_dict, read_tag
+from ..._fiff.tag import _call_dict, _simple_dict, read_tag
 from ..._fiff.tree import dir_tree_find
-from ..._fiff.utils import _mult_cal_one
+from ..._fiff.utils import _get_compression_funcs, _mult_cal_one
 from ...annotations import Annotations, _read_annotations_fif
 from ...channels import fix_mag_coil_types
 from ...event import AcqParserFIF
 from ...fixes import _reshape_view
 from ...utils import (
     _check_fname,
+    _check_option,
     _file_like,
     _on_missing,
     check_fname,
@@ -62,6 +64,7 @@ class Raw(BaseRaw):
         activity. Can also be "yes" to load without eliciting a warning.
     %(preload)s
     %(on_split_missing)s
+    %(memmap_fif)s
     %(verbose)s
 
     Attributes
@@ -96,14 +99,16 @@ class Raw(BaseRaw):
         allow_maxshield=False,
         preload=False,
         on_split_missing="raise",
+        memmap=False,
         verbose=None,
     ):
+        _check_option("memmap", memmap, (False, "r"))
         raws = []
         do_check_ext = not _file_like(fname)
         next_fname = fname
         while next_fname is not None:
             raw, next_fname, buffer_size_sec = self._read_raw_file(
-                next_fname, allow_maxshield, preload, do_check_ext
+                next_fname, allow_maxshield, preload, do_check_ext, memmap=memmap
             )
             do_check_ext = False
             raws.append(raw)
@@ -178,7 +183,14 @@ class Raw(BaseRaw):
 
     @verbose
     def _read_raw_file(
-        self, fname, allow_maxshield, preload, do_check_ext=True, verbose=None
+        self,
+        fname,
+        allow_maxshield,
+        preload,
+        do_check_ext=True,
+        *,
+        memmap=False,
+        verbose=None,
     ):
         """Read in header information from a raw file."""
         logger.info(f"Opening raw data file {fname}...")
@@ -199,10 +211,14 @@ class Raw(BaseRaw):
             # filename
             fname = _check_fname(fname, "read", True, "fname")
             whole_file = preload if fname.suffix == ".gz" else False
+            if memmap and fname.suffix == ".gz":
+                raise ValueError("memmap cannot be used with gzipped files")
         else:
             # file-like
             if not preload:
                 raise ValueError("preload must be used with file-like objects")
+            if memmap:
+                raise ValueError("memmap cannot be used with file-like objects")
             whole_file = True
         ff, tree, _ = fiff_open(fname, preload=whole_file)
         with ff as fid:
@@ -235,6 +251,13 @@ class Raw(BaseRaw):
             first_samp = 0
             first_skip = 0
 
+            #   Get the compression of the data buffers if there is one
+            compression = None
+            if directory[first].kind == FIFF.FIFF_MNE_DATA_COMPRESSION:
+                compression = read_tag(fid, directory[first].pos).data
+                first += 1
+                _check_entry(first, nent)
+
             #   Get first sample tag if it is there
             if directory[first].kind == FIFF.FIFF_FIRST_SAMPLE:
                 tag = read_tag(fid, directory[first].pos)
@@ -287,7 +310,10 @@ class Raw(BaseRaw):
                 ent = directory[k]
                 # There can be skips in the data (e.g., if the user unclicked)
                 # an re-clicked the button
-                if ent.kind == FIFF.FIFF_DATA_BUFFER:
+                if ent.kind in (
+                    FIFF.FIFF_DATA_BUFFER,
+                    FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER,
+                ):
                     #   Figure out the number of samples in this buffer
                     try:
                         div = _byte_dict[ent.type]
@@ -295,7 +321,11 @@ class Raw(BaseRaw):
                         raise RuntimeError(
                             f"Cannot handle data buffers of type {ent.type}"
                         ) from None
-                    nsamp = ent.size // (div * nchan)
+                    if ent.kind == FIFF.FIFF_DATA_BUFFER:
+                        nsamp = ent.size // (div * nchan)
+                    else:  # stored before the compressed data
+                        fid.seek(ent.pos + 16, 0)
+                        nsamp = int(np.frombuffer(fid.read(4), ">i4")[0])
                     if orig_format is None:
                         orig_format = _orig_format_dict[ent.type]
 
@@ -355,6 +385,20 @@ class Raw(BaseRaw):
         del raw_extras["last"]
         del raw_extras["nsamp"]
         raw_extras["filename"] = fname
+        raw_extras["compression"] = compression
+        if memmap and compression is not None:
+            raise ValueError(
+                "memmap cannot be used with files whose data buffers are compressed"
+            )
+        types = set(ent.type for ent in raw_extras["ent"] if ent is not None)
+        if memmap and types.issubset(_memmap_dtype_dict):
+            # Index of where the samples of each buffer start on disk (just past
+            # the 16-byte tag header), -1 for skips. Each buffer is viewed with
+            # the dtype of its own tag; otherwise we read tag by tag.
+            raw_extras["memmap_offsets"] = np.array(
+                [-1 if ent is None else ent.pos + 16 for ent in raw_extras["ent"]],
+                np.int64,
+            )
 
         raw.last_samp = first_samp - 1
         raw.orig_format = orig_format
@@ -403,10 +447,21 @@ class Raw(BaseRaw):
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file."""
         n_bad = 0
-        with _fiff_get_fid(self._raw_extras[fi]["filename"]) as fid:
-            bounds = self._raw_extras[fi]["bounds"]
-            ents = self._raw_extras[fi]["ent"]
-            nchan = self._raw_extras[fi]["orig_nchan"]
+        extra = self._raw_extras[fi]
+        offsets = extra.get("memmap_offsets", None)
+        decompress = None
+        if extra.get("compression") is not None:
+            decompress = _get_compression_funcs(extra["compression"])[1]
+        with ExitStack() as stack:
+            if offsets is None:
+                fid = stack.enter_context(_fiff_get_fid(extra["filename"]))
+            else:
+                # Opening a read-only map is cheap, so (just like the file
+                # descriptor) we do it for each read rather than storing it
+                mm = np.memmap(extra["filename"], dtype=np.uint8, mode="r")
+            bounds = extra["bounds"]
+            ents = extra["ent"]
+            nchan = extra["orig_nchan"]
             use = (stop > bounds[:-1]) & (start < bounds[1:])
             offset = 0
             for ei in np.where(use)[0]:
@@ -423,25 +478,44 @@ class Raw(BaseRaw):
                 # only read data if it exists
                 if ent is None:
                     continue  # just use zeros for gaps
-                # faster to always read full tag, taking advantage of knowing the header
-                # already (cutting out some of read_tag) ...
-                fid.seek(ent.pos + 16, 0)
-                one = _call_dict[ent.type](fid, ent, shape=None, rlims=None)
-                try:
-                    one = _reshape_view(one, (nsamp, nchan))
-                except AttributeError:  # one is None
-                    n_bad += picksamp
+                if offsets is not None:
+                    # zero-copy view of just the samples we want
+                    dtype = np.dtype(_memmap_dtype_dict[ent.type])
+                    one = np.frombuffer(
+                        mm,
+                        dtype=dtype,
+                        count=picksamp * nchan,
+                        offset=int(offsets[ei]) + first_pick * nchan * dtype.itemsize,
+                    )
+                    one = _reshape_view(one, (picksamp, nchan))
+                elif decompress is not None:
+                    # the whole buffer has to be decompressed
+                    fid.seek(ent.pos + 20, 0)
+                    one = np.frombuffer(
+                        decompress(fid.read(ent.size - 4)),
+                        _memmap_dtype_dict[ent.type],
+                    )
+                    one = _reshape_view(one, (nsamp, nchan))[first_pick:last_pick]
                 else:
+                    # faster to always read full tag, taking advantage of knowing
+                    # the header already (cutting out some of read_tag) ...
+                    fid.seek(ent.pos + 16, 0)
+                    one = _call_dict[ent.type](fid, ent, shape=None, rlims=None)
+                    try:
+                        one = _reshape_view(one, (nsamp, nchan))
+                    except AttributeError:  # one is None
+                        n_bad += picksamp
+                        continue
                     # ... then pick samples we want
                     if first_pick != 0 or last_pick != nsamp:
                         one = one[first_pick:last_pick]
-                    _mult_cal_one(
-                        data[:, this_start:this_stop],
-                        one.T,
-                        idx,
-                        cals,
-                        mult,
-                    )
+                _mult_cal_one(
+                    data[:, this_start:this_stop],
+                    one.T,
+                    idx,
+                    cals,
+                    mult,
+                )
             if n_bad:
                 warn(
                     f"FIF raw buffer could not be read, acquisition error "
@@ -493,6 +567,21 @@ class Raw(BaseRaw):
         return self._acqparser
 
 
+# Big-endian on-disk dtypes of data buffers that can be viewed directly
+_memmap_dtype_dict = {
+    key: _simple_dict[key]
+    for key in (
+        FIFF.FIFFT_DAU_PACK16,
+        FIFF.FIFFT_SHORT,
+        FIFF.FIFFT_FLOAT,
+        FIFF.FIFFT_DOUBLE,
+        FIFF.FIFFT_INT,
+    )
+}
+_memmap_dtype_dict[FIFF.FIFFT_COMPLEX_FLOAT] = ">c8"
+_memmap_dtype_dict[FIFF.FIFFT_COMPLEX_DOUBLE] = ">c16"
+
+
 def _check_entry(first, nent):
     """Sanity check entries."""
     if first >= nent:
@@ -501,7 +590,13 @@ def _check_entry(first, nent):
 
 @fill_doc
 def read_raw_fif(
-    fname, allow_maxshield=False, preload=False, on_split_missing="raise", verbose=None
+    fname,
+    allow_maxshield=False,
+    preload=False,
+    on_split_missing="raise",
+    *,
+    memmap=False,
+    verbose=None,
 ) -> Raw:
     """Reader function for Raw FIF data.
 
@@ -524,6 +619,7 @@ def read_raw_fif(
         activity. Can also be "yes" to load without eliciting a warning.
     %(preload)s
     %(on_split_missing)s
+    %(memmap_fif)s
     %(verbose)s
 
     Returns
@@ -546,6 +642,7 @@ def read_raw_fif(
         preload=preload,
         verbose=verbose,
         on_split_missing=on_split_missing,
+        memmap=memmap,
     )
 
 
@@ -31,7 +31,9 @@ from mne import (
     pick_types,
 )
 from mne._fiff.constants import FIFF
+from mne._fiff.open import fiff_open
 from mne._fiff.tag import _read_tag_header, read_tag
+from mne._fiff.write import _NEXT_FILE_BUFFER
 from mne.annotations import Annotations
 from mne.datasets import testing
 from mne.filter import filter_data
@@ -2032,6 +2034,173 @@ def test_memmap(tmp_path):
     # require them.
 
 
+@pytest.mark.parametrize("fmt", ("single", "double", "int", "short"))
+def test_memmap_read(tmp_path, fmt):
+    """Test reading buffers through memory-mapped views."""
+    rng = np.random.default_rng(0)
+    info = create_info(4, 1000.0, ["eeg", "eeg", "mag", "grad"])
+    # integer-valued so that all formats can represent it
+    raw = RawArray(rng.integers(-1000, 1000, (4, 20000)).astype(float), info)
+    fname = tmp_path / "test_raw.fif"
+    # odd buffer size to get partial buffers
+    raw.save(fname, fmt=fmt, buffer_size_sec=0.7)
+    raw_read = read_raw_fif(fname)
+    raw_mm = read_raw_fif(fname, memmap="r")
+    assert "memmap_offsets" in raw_mm._raw_extras[0]
+    # multiple files
+    raw_read = concatenate_raws([raw_read, read_raw_fif(fname)])
+    raw_mm = concatenate_raws([raw_mm, read_raw_fif(fname, memmap="r")])
+    for sl in (slice(None), slice(5, 1234), slice(699, 701), slice(19990, 20010)):
+        assert_array_equal(raw_read[:, sl][0], raw_mm[:, sl][0])
+        assert_array_equal(raw_read[[0, 2], sl][0], raw_mm[[0, 2], sl][0])
+    assert raw_mm.get_data().any()
+    # with projection
+    raw_read.set_eeg_reference(projection=True).apply_proj()
+    raw_mm.set_eeg_reference(projection=True).apply_proj()
+    assert_allclose(raw_read.get_data(), raw_mm.get_data(), rtol=1e-7, atol=0)
+    raw_mm.load_data()
+    assert not isinstance(raw_mm._data, np.memmap)
+    assert_allclose(raw_read.get_data(), raw_mm.get_data(), rtol=1e-7, atol=0)
+    # errors
+    with pytest.raises(ValueError, match="Invalid value for the 'memmap'"):
+        read_raw_fif(fname, memmap="r+")
+    with open(fname, "rb") as fid:
+        with pytest.raises(ValueError, match="cannot be used with file-like"):
+            read_raw_fif(fid, preload=True, memmap="r")
+
+
+def test_memmap_read_mixed_types(tmp_path, monkeypatch):
+    """Test memory-mapped reads of buffers with different types."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 1000.0, "eeg")
+    raw = RawArray(rng.integers(-1000, 1000, (3, 5000)).astype(float), info)
+    fname = tmp_path / "test_raw.fif"
+    fmts = iter(["single", "double"] * 10)
+    raw_buffer_bytes = base._raw_buffer_bytes
+    monkeypatch.setattr(
+        base,
+        "_raw_buffer_bytes",
+        lambda buf, cals, fmt, compress=None: raw_buffer_bytes(
+            buf, cals, next(fmts), compress
+        ),
+    )
+    raw.save(fname, buffer_size_sec=0.7)
+    monkeypatch.undo()
+    raw_read = read_raw_fif(fname)
+    types = set(ent.type for ent in raw_read._raw_extras[0]["ent"])
+    assert types == {FIFF.FIFFT_FLOAT, FIFF.FIFFT_DOUBLE}
+    raw_mm = read_raw_fif(fname, memmap="r")
+    assert "memmap_offsets" in raw_mm._raw_extras[0]
+    for sl in (slice(None), slice(699, 1401), slice(4990, 5000)):
+        assert_array_equal(raw_read[:, sl][0], raw_mm[:, sl][0])
+    assert_allclose(raw_mm.get_data(), raw.get_data(), rtol=1e-7)
+
+
+@pytest.mark.parametrize("n_jobs", (2, 3))
+def test_save_n_jobs(tmp_path, n_jobs):
+    """Test writing raw data buffers prepared in other threads."""
+    rng = np.random.default_rng(0)
+    info = create_info(4, 1000.0, ["eeg", "eeg", "eeg", "mag"])
+    raw = RawArray(rng.standard_normal((4, 20000)), info)
+    raw.set_eeg_reference(projection=True)
+    raw.set_annotations(Annotations([3.0, 10.5], [1.0, 0.5], ["BAD_ACQ_SKIP"] * 2))
+    kwargs = dict(buffer_size_sec=0.5, proj=True, split_size=1200000)
+    fname = tmp_path / "test_raw.fif"
+    fnames = raw.save(fname, **kwargs)
+    assert len(fnames) > 1
+    want = [_fiff_read_tree(this_fname)[1] for this_fname in fnames]
+    assert FIFF.FIFF_DATA_SKIP in [d.kind for d in sum(want, [])]
+    want_data = read_raw_fif(fname).get_data()
+    # same names so that the file references are the same
+    assert raw.save(fname, overwrite=True, n_jobs=n_jobs, **kwargs) == fnames
+    for this_fname, directory in zip(fnames, want):
+        got = _fiff_read_tree(this_fname)[1]
+        assert [(d.kind, d.type, d.size, d.pos) for d in got] == [
+            (d.kind, d.type, d.size, d.pos) for d in directory
+        ]
+    raw_read = read_raw_fif(fname)
+    assert raw_read.n_times == 20000
+    assert_array_equal(raw_read.get_data(), want_data)
+
+
+@pytest.mark.parametrize("compression", ("zlib", "zstd"))
+@pytest.mark.parametrize("fmt", ("single", "short"))
+def test_save_compression(tmp_path, compression, fmt):
+    """Test writing and reading compressed data buffers."""
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    info = create_info(3, 1000.0, "eeg")
+    data = np.zeros((3, 20000))  # compressible
+    data[:, 1000:3000] = np.random.default_rng(0).integers(-100, 100, (3, 2000))
+    raw = RawArray(data, info)
+    raw.set_annotations(Annotations([4.9], [1.4], ["BAD_ACQ_SKIP"]))
+    fname = tmp_path / "test_raw.fif"
+    fname_comp = tmp_path / "test_comp_raw.fif"
+    kwargs = dict(fmt=fmt, buffer_size_sec=0.7, split_size=_NEXT_FILE_BUFFER + 40000)
+    fnames = raw.save(fname, **kwargs)
+    fnames_comp = raw.save(fname_comp, compression=compression, **kwargs)
+    assert len(fnames_comp) == 1 < len(fnames)
+    directory = _fiff_read_tree(fname_comp)[1]
+    kinds = [d.kind for d in directory]
+    assert FIFF.FIFF_DATA_BUFFER not in kinds
+    assert FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER in kinds
+    assert FIFF.FIFF_DATA_SKIP in kinds
+    raw_read = read_raw_fif(fname)
+    raw_comp = read_raw_fif(fname_comp)
+    assert raw_comp.orig_format == fmt
+    assert raw_comp.n_times == raw.n_times
+    for sl in (slice(None), slice(5, 1234), slice(699, 701), slice(4990, 6010)):
+        assert_array_equal(raw_comp[:, sl][0], raw_read[:, sl][0])
+    assert_array_equal(raw_comp.load_data().get_data(), raw_read.get_data())
+    with pytest.raises(ValueError, match="cannot be used with files whose data"):
+        read_raw_fif(fname_comp, memmap="r")
+    with pytest.raises(ValueError, match="Invalid value for the 'compression'"):
+        raw.save(fname_comp, compression="gzip", overwrite=True)
+
+
+def test_index_cache(tmp_path, monkeypatch):
+    """Test caching of the tag directory and tree."""
+    cache_dir = tmp_path / "cache"
+    fname = tmp_path / "test_raw.fif"
+    info = create_info(3, 1000.0, "eeg")
+    raw = RawArray(np.random.default_rng(0).standard_normal((3, 5000)), info)
+    raw.set_annotations(Annotations([1.0], [0.5], ["BAD_foo"]))
+    raw.save(fname)
+    tree, directory = _fiff_read_tree(fname)
+    monkeypatch.setenv("MNE_FIF_INDEX_CACHE_DIR", str(cache_dir))
+    tree_write, directory_write = _fiff_read_tree(fname)
+    cache_fnames = list(cache_dir.glob("*-idx.npz"))
+    assert len(cache_fnames) == 1
+    with catch_logging(verbose="debug") as log:
+        tree_cached, directory_cached = _fiff_read_tree(fname)
+    assert "Using cached tag directory" in log.getvalue()
+    for this_tree, this_directory in (
+        (tree_write, directory_write),
+        (tree_cached, directory_cached),
+    ):
+        assert_object_equal(this_tree, tree)
+        assert_object_equal(this_directory, directory)
+    raw_read = read_raw_fif(fname)
+    assert_allclose(raw_read.get_data(), raw.get_data())
+    assert_object_equal(raw_read.annotations, raw.annotations)
+    # a modified file is detected
+    raw.crop(0, 2).save(fname, overwrite=True)
+    with catch_logging(verbose="debug") as log:
+        tree, _ = _fiff_read_tree(fname)
+    assert "out of date" in log.getvalue()
+    assert read_raw_fif(fname).n_times == raw.n_times
+    # and a broken cache is ignored
+    cache_fnames[0].write_bytes(b"foo")
+    assert_object_equal(_fiff_read_tree(fname)[0], tree)
+    assert_object_equal(_fiff_read_tree(fname)[0], tree)
+
+
+def _fiff_read_tree(fname):
+    ff, tree, directory = fiff_open(fname)
+    ff.close()
+    return tree, directory
+
+
 # These are slow on Azure Windows so let's do a subset
 @pytest.mark.parametrize(
     "kind",
@@ -855,6 +855,127 @@ def test_load_data_memmap(tmp_path):
     assert_array_equal(raw._data[:, 0], np.arange(1, 9))
 
 
+class _RawSampleNumbers(BaseRaw):
+    def __init__(self, first_samp=0):
+        info = create_info(4, 100.0, "eeg")
+        super().__init__(
+            info,
+            first_samps=(first_samp,),
+            last_samps=(first_samp + 9999,),
+            buffer_size_sec=0.37,
+        )
+
+    def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
+        one = np.arange(start, stop) + 1e5 * np.arange(1, 5)[:, np.newaxis]
+        _mult_cal_one(data, one, idx, cals, mult)
+
+
+@pytest.mark.parametrize("n_jobs", (1, 2, 3))
+def test_load_data_n_jobs(n_jobs):
+    """Test loading raw data using multiple threads."""
+    raw = concatenate_raws([_RawSampleNumbers(), _RawSampleNumbers(123)])
+    want = raw.get_data()
+    assert_array_equal(want[1, [0, 9999, 10000, -1]], [2e5, 209999, 200123, 210122])
+    assert_array_equal(raw.copy().load_data(n_jobs=n_jobs).get_data(), want)
+    got = raw._read_segment(5000, 15000, sel=[1, 3], n_jobs=n_jobs)
+    assert_array_equal(got, want[[1, 3], 5000:15000])
+    raw.add_proj(mne.compute_proj_raw(raw, n_eeg=1)).apply_proj()
+    assert_allclose(
+        raw.copy().load_data(n_jobs=n_jobs).get_data(), raw.get_data(), atol=1e-7
+    )
+
+
+@pytest.mark.parametrize("preload", (False, True))
+def test_iter_chunks(preload):
+    """Test iterating over chunks of raw data."""
+    raw = _RawSampleNumbers()
+    if preload:
+        raw.load_data()
+    chunks = list(raw.iter_chunks(7.0, 2.0, picks=[0, 2]))
+    starts, stops, datas = zip(*chunks)
+    # every chunk is 7 s long apart from the last one (which is lumped)
+    assert_array_equal(starts, np.arange(0, 9300, 500))
+    assert_array_equal(stops[:-1], np.arange(700, 9700, 500))
+    assert stops[-1] == raw.n_times == 10000
+    for start, stop, data in chunks:
+        assert_array_equal(data, raw.get_data([0, 2], start, stop))
+    # subset and longer-than-data durations
+    ((start, stop, data),) = raw.iter_chunks(1000.0, start=10, stop=20)
+    assert (start, stop) == (10, 20)
+    assert_array_equal(data, raw.get_data(start=10, stop=20))
+    ((start, stop, data),) = raw.iter_chunks(10.0, overlap=5.0, stop=100)
+    assert (start, stop) == (0, 100)
+    # projection
+    raw.add_proj(mne.compute_proj_raw(raw, n_eeg=1))
+    assert not raw.proj
+    want = raw.copy().apply_proj().get_data([1])
+    got = np.concatenate([d for _, _, d in raw.iter_chunks(10.0, picks=[1])], 1)
+    assert_array_equal(got, raw.get_data([1]))
+    got = np.concatenate(
+        [d for _, _, d in raw.iter_chunks(10.0, picks=[1], proj=True)], 1
+    )
+    assert_allclose(got, want, atol=1e-7)
+    with pytest.raises(ValueError, match="must be positive"):
+        next(raw.iter_chunks(0.0))
+    with pytest.raises(ValueError, match="smaller than duration"):
+        next(raw.iter_chunks(1.0, 1.0))
+    with pytest.raises(ValueError, match="yielded no samples"):
+        next(raw.iter_chunks(1.0, start=20, stop=10))
+
+
+@pytest.mark.parametrize(
+    "method, phase, atol",
+    [
+        ("fir", "zero", 1e-12),
+        ("fir", "minimum", 1e-12),
+        ("iir", "forward", 1e-12),
+        ("iir", "zero", 1e-6),
+    ],
+)
+def test_filter_memmap(tmp_path, method, phase, atol):
+    """Test chunked filtering of non-preloaded data into a memmap."""
+    raw = concatenate_raws([_RawSampleNumbers(), _RawSampleNumbers(123)])
+    raw.annotations.append(150.0, 10.0, "bad_acq_skip")
+    kwargs = dict(l_freq=1.0, h_freq=10.0, picks=[0, 1, 3], method=method)
+    kwargs["phase"] = phase
+    want = raw.copy().load_data().filter(**kwargs).get_data()
+    fname = tmp_path / "filtered.dat"
+    with catch_logging() as log:
+        raw.filter(**kwargs, memmap=fname, verbose=True)
+    assert "Filtering in chunks of" in log.getvalue()
+    assert raw.preload
+    assert isinstance(raw._data, np.memmap)
+    assert raw.info["highpass"] == 0.0  # not all data channels filtered
+    got = raw.get_data()
+    # unfiltered channel and skipped samples
+    assert_array_equal(got[2], want[2])
+    assert_array_equal(got[:, 15000:16000], want[:, 15000:16000])
+    assert_allclose(got, want, rtol=0, atol=atol * np.abs(want).max())
+    with pytest.raises(ValueError, match="not preloaded"):
+        raw.filter(1.0, None, memmap=tmp_path / "other.dat")
+
+
+@pytest.mark.parametrize("freqs", (None, 10.0))
+def test_notch_filter_memmap(tmp_path, freqs):
+    """Test chunked multitaper line noise removal into a memmap."""
+    raw = concatenate_raws([_RawSampleNumbers(), _RawSampleNumbers(123)])
+    raw.annotations.append(150.0, 10.0, "bad_acq_skip")
+    kwargs = dict(freqs=freqs, picks=[0, 1, 3], method="spectrum_fit")
+    want = raw.copy().load_data().notch_filter(**kwargs).get_data()
+    fname = tmp_path / "notched.dat"
+    with catch_logging() as log:
+        raw.notch_filter(**kwargs, memmap=fname, verbose=True)
+    assert "Removing line noise in chunks of" in log.getvalue()
+    assert raw.preload
+    assert isinstance(raw._data, np.memmap)
+    got = raw.get_data()
+    assert_array_equal(got[2], want[2])
+    assert_array_equal(got[:, 15000:16000], want[:, 15000:16000])
+    assert_allclose(got, want, rtol=1e-12)
+    with pytest.raises(ValueError, match="not preloaded"):
+        raw.notch_filter(10.0, method="spectrum_fit", memmap=tmp_path / "other.dat")
+
+
 def test_test_raw_reader():
     """Test _test_raw_reader."""
     _test_raw_reader(_read_raw_arange, test_scaling=False, test_rank="less")
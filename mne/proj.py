@@ -27,6 +27,7 @@ from .utils import (
     _check_fname,
     _check_option,
     _validate_type,
+    _verbose_safe_false,
     check_fname,
     logger,
     verbose,
@@ -363,9 +364,13 @@ def compute_proj_raw(
         start = max(raw.time_as_index(start)[0], 0)
         stop = raw.time_as_index(stop)[0] if stop else raw.n_times
         stop = min(stop, raw.n_times)
-        data, times = raw[:, start:stop]
-        _check_n_samples(stop - start, data.shape[0])
-        data = np.dot(data, data.T)  # compute data covariance
+        _check_n_samples(stop - start, raw.info["nchan"])
+        # compute data covariance chunk by chunk to keep memory usage bounded
+        data = 0
+        for _, _, chunk in raw.iter_chunks(
+            10.0, start=start, stop=stop, verbose=_verbose_safe_false()
+        ):
+            data += chunk @ chunk.T
         info = raw.info
         # convert back to times
         start = start / raw.info["sfreq"]
@@ -17,6 +17,7 @@ from numpy.testing import (
 )
 
 from mne import (
+    Annotations,
     Epochs,
     compute_covariance,
     compute_proj_raw,
@@ -395,6 +396,26 @@ def test_cov_estimation_on_raw(method, tmp_path):
         )
 
 
+def test_cov_estimation_on_raw_chunked():
+    """Test single-segment raw covariance estimation in chunks."""
+    rng = np.random.default_rng(0)
+    info = create_info(5, 100.0, "eeg")
+    raw = RawArray(rng.standard_normal((5, 3456)) * 1e-6, info)
+    for kwargs in (dict(), dict(tmin=1.0, tmax=30.0)):
+        cov = compute_raw_covariance(raw, tstep=None, **kwargs)
+        want = np.cov(raw.get_data(tmin=kwargs.get("tmin"), tmax=kwargs.get("tmax")))
+        assert_allclose(cov.data, want, rtol=1e-10)
+    assert cov.nfree == 2899
+    # bad segments still lead to rejection of the whole segment
+    raw.set_annotations(Annotations([2.0], [1.0], ["BAD_foo"]))
+    with pytest.raises(ValueError, match="No samples found"):
+        compute_raw_covariance(raw, tstep=None)
+    # same for projectors in compute_proj_raw
+    projs = compute_proj_raw(raw, duration=None, n_eeg=2)
+    u, _, _ = np.linalg.svd(raw.get_data())
+    assert_allclose(np.abs(projs[0]["data"]["data"][0]), np.abs(u[:, 0]), rtol=1e-7)
+
+
 @pytest.mark.slowtest
 def test_cov_estimation_on_raw_reg():
     """Test estimation from raw with regularization."""
@@ -49,6 +49,7 @@ from mne.epochs import (
     BaseEpochs,
     EpochsArray,
     _handle_event_repeated,
+    _minimize_time_diff,
     average_movements,
     bootstrap,
     combine_event_ids,
@@ -807,6 +808,64 @@ def test_reject_by_annotations_reject_tmin_reject_tmax():
     assert len(epochs) == 1
 
 
+@pytest.mark.parametrize("detrend, decim", [(None, 1), (1, 3)])
+def test_epochs_batched_from_raw(detrend, decim):
+    """Test that epochs loaded in batches match those loaded one at a time."""
+    rng = np.random.default_rng(0)
+    info = mne.create_info(3, 1000.0, ["eeg", "eeg", "eog"])
+    raw = mne.io.RawArray(rng.standard_normal((3, 20000)), info)
+    with raw.info._unlock():
+        raw.info["lowpass"] = 100.0
+    raw.set_annotations(mne.Annotations([5, 12.3], [1, 0.1], ["BAD_a", "bad_b"]))
+    # overlapping, adjacent, sparse, and out-of-bounds windows
+    samps = np.concatenate(
+        [[50], np.arange(1000, 3000, 100), [4000, 4300, 9000, 12300, 19950]]
+    )
+    events = np.array([samps, np.zeros_like(samps), np.ones_like(samps)]).T
+    kwargs = dict(tmin=-0.1, tmax=0.3, detrend=detrend, decim=decim)
+    epochs = mne.Epochs(raw, events, preload=False, **kwargs)
+    epochs.drop_bad()
+    epochs_one = mne.Epochs(raw, events, preload=False, **kwargs)
+    want = list()
+    for idx in range(len(events)):
+        epoch = epochs_one._get_epoch_from_raw(idx)
+        want.append(epochs_one._detrend_offset_decim(epoch, epochs_one._detrend_picks))
+    assert epochs.drop_log[-1] == ("TOO_SHORT",)
+    assert epochs.drop_log[samps.tolist().index(12300)] == ("bad_b",)
+    assert want[0] is None
+    assert want[-1].shape[1] < len(epochs.times)
+    want = [w for w in want if isinstance(w, np.ndarray)][:-1]
+    assert len(epochs) == len(want) > 0
+    assert_allclose(epochs.get_data(), np.array(want), rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize(
+    "preload_raw", (pytest.param(False, marks=pytest.mark.slowtest), True)
+)
+def test_epochs_n_jobs(tmp_path, preload_raw, monkeypatch):
+    """Test reading and rejecting epochs in parallel."""
+    pytest.importorskip("joblib")
+    rng = np.random.default_rng(0)
+    info = mne.create_info(3, 1000.0, "eeg")
+    mne.io.RawArray(rng.standard_normal((3, 60000)) * 1e-5, info).save(
+        tmp_path / "test_raw.fif"
+    )
+    raw = read_raw_fif(tmp_path / "test_raw.fif", preload=preload_raw)
+    events = make_fixed_length_events(raw, duration=0.5)
+    kwargs = dict(tmin=-0.1, tmax=0.3, detrend=1, reject=dict(eeg=8e-5))
+    monkeypatch.setattr(BaseEpochs, "_get_n_per_block", lambda self: 20)
+    want = Epochs(raw, events, preload=True, **kwargs)
+    assert 0 < len(want) < len(events)
+    epochs = Epochs(raw, events, preload=True, n_jobs=2, **kwargs)
+    assert epochs.drop_log == want.drop_log
+    assert_array_equal(epochs.get_data(), want.get_data())
+    epochs = Epochs(raw, events, **kwargs).drop_bad(n_jobs=2)
+    assert epochs.drop_log == want.drop_log
+    # linear detrending rounds differently for differently sized blocks
+    want = Epochs(raw, events, **kwargs).drop_bad().load_data()
+    assert_array_equal(epochs.load_data(n_jobs=2).get_data(), want.get_data())
+
+
 def test_own_data():
     """Test for epochs data ownership (gh-5346)."""
     raw, events = _get_data()[:2]
@@ -1658,6 +1717,93 @@ def test_split_saving_and_loading_back(tmp_path, epochs_to_split, preload):
     assert_array_equal(epochs.events, epochs2.events)
 
 
+@pytest.mark.parametrize("fmt", ("single", "double"))
+@pytest.mark.parametrize("suffix", (".fif", ".fif.gz"))
+def test_epochs_fif_lazy_memmap(tmp_path, fmt, suffix, monkeypatch):
+    """Test lazy reading of split epochs files through memory-mapping."""
+    rng = np.random.default_rng(0)
+    info = mne.create_info(4, 1000.0, "eeg")
+    data = rng.standard_normal((600, 4, 500))
+    events = np.array([np.arange(600) * 500, np.zeros(600, int), np.ones(600, int)]).T
+    fname = tmp_path / f"test-epo{suffix}"
+    EpochsArray(data, info, events=events).save(
+        fname, fmt=fmt, split_size="2MB", overwrite=True
+    )
+    epochs = read_epochs(fname, preload=False)
+    assert len(epochs._raw) > 1
+    for raw in epochs._raw:
+        assert (raw.memmap() is not None) == (suffix == ".fif")
+    want = read_epochs(fname, preload=True).get_data()
+    assert_array_equal(epochs.get_data(), want)
+    idx = [550, 3, 120, 599, 3]
+    assert_array_equal(epochs[idx].get_data(), want[idx])
+    assert_array_equal(epochs._get_epoch_from_raw(120), want[120])
+    assert_array_equal(np.array([e for e in epochs]), want)
+    # reading blocks in parallel, which for gzipped files is done serially
+    pytest.importorskip("joblib")
+    monkeypatch.setattr(BaseEpochs, "_get_n_per_block", lambda self: 20)
+    epochs = read_epochs(fname, preload=False)
+    assert len(epochs.copy().drop_bad(reject=dict(eeg=1e3), n_jobs=4)) == len(want)
+    assert_array_equal(epochs.load_data(n_jobs=4).get_data(), want)
+    # ... also when they are the inputs of lazily concatenated epochs
+    epochs = concatenate_epochs(
+        [read_epochs(fname, preload=False) for _ in range(2)], preload=False
+    )
+    assert_array_equal(
+        epochs.load_data(n_jobs=4).get_data(), np.concatenate([want] * 2)
+    )
+
+
+@pytest.mark.parametrize("preload", (True, False))
+def test_epochs_dtype(tmp_path, preload):
+    """Test keeping single-precision epochs and evoked data in memory."""
+    rng = np.random.default_rng(0)
+    info = mne.create_info(4, 1000.0, "eeg")
+    raw = RawArray(rng.standard_normal((4, 20000)) * 1e-6, info)
+    events = make_fixed_length_events(raw, duration=1.0)
+    kwargs = dict(tmin=-0.1, tmax=0.8, baseline=None, preload=preload)
+    epochs = Epochs(raw, events, **kwargs)
+    epochs_32 = Epochs(raw, events, dtype="float32", **kwargs)
+    want = epochs.get_data()
+    assert epochs_32.get_data().dtype == np.float32
+    assert_allclose(epochs_32.get_data(), want, rtol=1e-6, atol=1e-12)
+    epochs.load_data()
+    epochs_32.load_data()
+    assert epochs_32._data.nbytes * 2 == epochs._data.nbytes
+    assert_array_equal(
+        EpochsArray(want, info, dtype=np.float32).get_data(), want.astype(np.float32)
+    )
+    data_c = want + 1j * want
+    epochs_c = EpochsArray(data_c, info, dtype="float32")
+    assert epochs_c.get_data().dtype == np.complex64
+    for meth, kw in (
+        ("apply_baseline", dict(baseline=(None, 0))),
+        ("crop", dict(tmin=0.0, tmax=0.7)),
+        ("filter", dict(l_freq=None, h_freq=40.0)),
+        ("resample", dict(sfreq=250.0)),
+    ):
+        getattr(epochs, meth)(**kw)
+        getattr(epochs_32, meth)(**kw)
+        assert epochs_32._data.dtype == np.float32, meth
+        assert_allclose(epochs_32._data, epochs._data, rtol=1e-4, atol=1e-12)
+    evoked_32 = epochs_32.average()
+    assert evoked_32.data.dtype == np.float32
+    assert_allclose(evoked_32.data, epochs.average().data, rtol=1e-4, atol=1e-12)
+    fname = tmp_path / "test-epo.fif"
+    epochs_32.save(fname, fmt="single")
+    epochs_read = read_epochs(fname, preload=preload, dtype="float32")
+    assert epochs_read.get_data().dtype == np.float32
+    assert_array_equal(epochs_read.get_data(), epochs_32.get_data())
+    assert read_epochs(fname).get_data().dtype == np.float64
+    fname = tmp_path / "test-ave.fif"
+    evoked_32.save(fname)
+    evoked_read = mne.read_evokeds(fname, dtype="float32")[0]
+    assert evoked_read.data.dtype == np.float32
+    assert_allclose(evoked_read.data, evoked_32.data, rtol=1e-6)
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        EpochsArray(want, info, dtype=int)
+
+
 @pytest.mark.parametrize(
     "split_naming, dst_fname, split_fname_fn, check_bids",
     [
@@ -2231,6 +2377,54 @@ def test_reject_epochs(tmp_path):
     assert epochs_cleaned.flat == dict(grad=new_flat["grad"], mag=flat["mag"])
 
 
+def test_reject_vectorized():
+    """Test that rejecting many epochs at once matches per-epoch checks."""
+    rng = np.random.default_rng(0)
+    info = mne.create_info(8, 1000.0, ["eeg"] * 5 + ["eog"] * 2 + ["emg"])
+    data = rng.standard_normal((200, 8, 50))
+    data[::3, 1] *= 5
+    data[::5, 2] *= 0.01
+    data[::7, 5] *= 5
+    data[::11, 4] *= 5  # channel marked as bad below
+    info["bads"] = [info["ch_names"][4]]
+    epochs = EpochsArray(data.copy(), info, reject_tmin=0.005)
+    epochs.drop_bad(
+        reject=dict(eeg=10.0, eog=10.0, emg=lambda x: (x.max() > 3.5, "emg max")),
+        flat=dict(eeg=0.5),
+    )
+    assert len(epochs) < len(data)
+    want = list()
+    for epoch in data:
+        is_good, bad_tuple = epochs._is_good_epoch(epoch)
+        want.append(() if is_good else bad_tuple)
+    assert epochs.drop_log == tuple(want)
+    assert ("emg max",) in want
+    assert_array_equal(epochs.get_data(), data[[w == () for w in want]])
+
+
+@pytest.mark.parametrize("preload", (True, False))
+def test_reject_no_full_epochs(preload, monkeypatch):
+    """Test rejecting blocks without any full-length epoch."""
+    info = mne.create_info(2, 100.0, "eeg")
+    data = np.random.default_rng(0).standard_normal((2, 1000)) * 1e-6
+    raw = mne.io.RawArray(data, info)
+    raw.set_annotations(mne.Annotations([2.0], [1.0], ["BAD_x"]))
+    reject = dict(eeg=1e-3)
+    # only epoch overlaps an annotation
+    events = np.array([[250, 0, 1]])
+    kwargs = dict(tmin=0, tmax=0.5, baseline=None, reject=reject, preload=preload)
+    with pytest.warns(RuntimeWarning, match="All epochs were dropped"):
+        epochs = Epochs(raw, events, **kwargs)
+        epochs.drop_bad()
+    assert epochs.drop_log == (("BAD_x",),)
+    # epoch cut off by the end of the data in a block of a single epoch
+    events = np.array([[100, 0, 1], [950, 0, 1]])
+    monkeypatch.setattr(BaseEpochs, "_get_n_per_block", lambda self: 1)
+    epochs = Epochs(raw, events, **kwargs)
+    epochs.drop_bad()
+    assert epochs.drop_log == ((), ("TOO_SHORT",))
+
+
 @testing.requires_testing_data
 def test_callable_reject():
     """Test using a callable for rejection."""
@@ -3019,6 +3213,41 @@ def test_equalize_epoch_counts_random():
     assert len(epochs_1) == len(epochs_2)
 
 
+def _naive_minimize_time_diff(t_shorter, t_longer):
+    """Greedily drop events, trying each possible removal separately."""
+    kept = np.arange(len(t_longer))
+    while len(kept) > len(t_shorter):
+        scores = list()
+        for ii in range(len(kept)):
+            t_keep = t_longer[np.delete(kept, ii)]
+            n_extra = len(t_keep) - len(t_shorter)
+            t_ref = np.concatenate([t_shorter, np.repeat(t_shorter[-1], n_extra)])
+            weights = np.concatenate([np.full(len(t_shorter), 2), np.ones(n_extra)])
+            scores.append(np.sum(weights * np.abs(t_keep - t_ref)))
+        kept = np.delete(kept, np.argmin(scores))
+    return np.isin(np.arange(len(t_longer)), kept)
+
+
+def test_minimize_time_diff():
+    """Test the time-matching behind equalization with method='mintime'."""
+    # example from the equalize_epoch_counts docstring
+    keep = _minimize_time_diff(
+        np.array([3.5, 4.5, 120.5, 121.5]), np.array([1, 2, 3, 4, 120, 121])
+    )
+    assert_array_equal(keep, [False, False, True, True, True, True])
+    rng = np.random.default_rng(0)
+    for n_longer, n_shorter in [(10, 10), (10, 9), (20, 11), (30, 2)]:
+        t_longer = np.sort(rng.choice(1000, n_longer, replace=False))
+        t_shorter = np.sort(rng.choice(1000, n_shorter, replace=False))
+        keep = _minimize_time_diff(t_shorter, t_longer)
+        assert keep.sum() == n_shorter
+        assert_array_equal(keep, _naive_minimize_time_diff(t_shorter, t_longer))
+    # large event sets are fast
+    t_longer = np.sort(rng.choice(10**7, 5000, replace=False))
+    t_shorter = np.sort(rng.choice(10**7, 4500, replace=False))
+    assert _minimize_time_diff(t_shorter, t_longer).sum() == 4500
+
+
 def test_access_by_name(tmp_path):
     """Test accessing epochs by event name and on_missing for rare events."""
     raw, events, picks = _get_data()
@@ -3896,6 +4125,48 @@ def test_concatenate_epochs_large():
     assert np.max(many_epochs_cat.events[:, 0]) < max_expected_sample_index
 
 
+def test_concatenate_epochs_lazy(tmp_path):
+    """Test concatenating epochs without loading their data."""
+    pd = pytest.importorskip("pandas")
+    from pandas.testing import assert_frame_equal
+
+    rng = np.random.default_rng(0)
+    info = mne.create_info(20, 1000.0, "eeg")
+    fnames = list()
+    for ii in range(3):
+        events = np.array([np.arange(60) * 1100, np.zeros(60, int), [ii + 1] * 60]).T
+        epochs = EpochsArray(
+            rng.standard_normal((60, 20, 1000)),
+            info,
+            events=events,
+            event_id={f"run{ii}": ii + 1},
+            metadata=pd.DataFrame(dict(run=[ii] * 60)),
+        )
+        epochs.drop([1, 4])
+        fnames.append(tmp_path / f"run{ii}-epo.fif")
+        epochs.save(fnames[-1])
+    want = concatenate_epochs([read_epochs(fname) for fname in fnames])
+    epochs = concatenate_epochs(
+        [read_epochs(fname, preload=False) for fname in fnames], preload=False
+    )
+    assert isinstance(epochs, mne.EpochsConcatenated)
+    assert not epochs.preload
+    assert_array_equal(epochs.events, want.events)
+    assert epochs.event_id == want.event_id
+    assert epochs.drop_log == want.drop_log
+    assert_array_equal(epochs.selection, want.selection)
+    assert_frame_equal(epochs.metadata, want.metadata)
+    assert_array_equal(epochs.get_data(), want.get_data())
+    assert_array_equal(epochs[[100, 3, 60]].get_data(), want[[100, 3, 60]].get_data())
+    assert_array_equal(epochs["run1"].get_data(), want["run1"].get_data())
+    # written one split at a time, even over one of the inputs
+    fnames_out = epochs.save(tmp_path / "all-epo.fif", split_size="5MB", fmt="double")
+    assert len(fnames_out) > 1
+    assert_array_equal(read_epochs(fnames_out[0]).get_data(), want.get_data())
+    epochs.save(fnames[0], fmt="double", overwrite=True)
+    assert_array_equal(read_epochs(fnames[0]).get_data(), want.get_data())
+
+
 def test_add_channels():
     """Test epoch splitting / re-appending channel types."""
     raw, events, picks = _get_data()
@@ -4184,6 +4455,35 @@ def test_metadata(tmp_path, monkeypatch):
     assert len(epochs["A.isna()"]) == 1  # epochs for NA in column A
 
 
+def test_metadata_query_subset():
+    """Test that metadata queries select epochs without touching the original."""
+    pd = pytest.importorskip("pandas")
+    rng = np.random.default_rng(0)
+    n_epochs = 50
+    metadata = pd.DataFrame(
+        dict(cond=rng.choice(list("ab"), n_epochs), rt=rng.uniform(size=n_epochs))
+    )
+    data = rng.standard_normal((n_epochs, 2, 10))
+    epochs = EpochsArray(data, create_info(2, 100.0, "eeg"), metadata=metadata)
+    epochs.drop([0, 3])
+    query = "cond == 'a' and rt < 0.5"
+    want = np.flatnonzero(metadata.drop(index=[0, 3]).eval(query).to_numpy())
+    sub = epochs[query]
+    assert_array_equal(sub.selection, epochs.selection[want])
+    assert_array_equal(sub.metadata.index, sub.selection)
+    assert_array_equal(sub.metadata["rt"], epochs.metadata["rt"].iloc[want])
+    assert_array_equal(sub.get_data(), data[epochs.selection[want]])
+    assert sub._data.flags.owndata
+    for idx in np.setdiff1d(epochs.selection, sub.selection):
+        assert sub.drop_log[idx] == ("IGNORED",)
+    assert sub.drop_log[0] == sub.drop_log[3] == ("USER",)
+    # modifying the subset leaves the original untouched
+    sub._data[:] = 0
+    sub.metadata["rt"] = 1.0
+    assert_array_equal(epochs.get_data(), data[epochs.selection])
+    assert_array_equal(epochs.metadata["rt"], metadata["rt"].drop(index=[0, 3]))
+
+
 def assert_metadata_equal(got, exp):
     """Assert metadata are equal."""
     if exp is None:
@@ -4726,6 +5026,53 @@ def test_make_fixed_length_epochs():
     assert "2" in epochs.event_id and len(epochs.event_id) == 1
 
 
+def test_make_fixed_length_epochs_view(tmp_path):
+    """Test fixed-length epochs that are views of the raw data."""
+    rng = np.random.default_rng(0)
+    raw = RawArray(rng.standard_normal((3, 5000)), create_info(3, 100.0, "eeg"))
+    kwargs = dict(duration=2.0, overlap=1.9)
+    want = make_fixed_length_epochs(raw, preload=True, **kwargs)
+    epochs = make_fixed_length_epochs(raw, copy=False, **kwargs)
+    assert epochs.preload
+    assert np.shares_memory(epochs._data, raw._data)
+    assert not epochs._data.flags.writeable
+    assert_array_equal(epochs.get_data(), want.get_data())
+    assert np.shares_memory(epochs[5:10]._data, raw._data)
+    with pytest.raises(ValueError, match="read-only"):
+        epochs.apply_baseline((0, 0.5))
+    # copies are writable
+    epochs_copy = epochs.copy().apply_baseline((0, 0.5))
+    assert_allclose(
+        epochs_copy.get_data(), want.copy().apply_baseline((0, 0.5)).get_data()
+    )
+    # rejection copies the data only if epochs are dropped
+    reject = dict(eeg=np.ptp(want.get_data(), axis=-1).max(axis=-1).mean())
+    want.drop_bad(reject=reject)
+    epochs.drop_bad(reject=reject)
+    assert 0 < len(epochs) < len(epochs.drop_log)
+    assert epochs.drop_log == want.drop_log
+    assert not np.shares_memory(epochs._data, raw._data)
+    assert_array_equal(epochs.get_data(), want.get_data())
+    # bad annotations
+    raw.set_annotations(Annotations([10.0], [1.0], ["BAD_x"]))
+    want = make_fixed_length_epochs(raw, preload=True, **kwargs)
+    epochs = make_fixed_length_epochs(raw, copy=False, **kwargs)
+    assert epochs.drop_log == want.drop_log
+    assert_array_equal(epochs.get_data(), want.get_data())
+    # projectors
+    raw.add_proj(mne.compute_proj_raw(raw, n_eeg=1))
+    with pytest.raises(ValueError, match="projectors need to be applied"):
+        make_fixed_length_epochs(raw, copy=False, **kwargs)
+    epochs = make_fixed_length_epochs(raw, copy=False, proj="delayed", **kwargs)
+    want = make_fixed_length_epochs(raw, preload=True, proj="delayed", **kwargs)
+    assert_allclose(epochs.average().data, want.average().data)
+    # raw data must be preloaded
+    raw.save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif")
+    with pytest.raises(RuntimeError, match="requires raw data to be loaded"):
+        make_fixed_length_epochs(raw, copy=False, proj=False, **kwargs)
+
+
 def test_epochs_huge_events(tmp_path, monkeypatch):
     """Test epochs with event numbers that are too large."""
     data = np.zeros((1, 1, 1000))
@@ -29,8 +29,8 @@ from mne import (
     write_evokeds,
 )
 from mne._fiff.constants import FIFF
-from mne.evoked import Evoked, EvokedArray, _get_peak
-from mne.io import read_raw_fif
+from mne.evoked import Evoked, EvokedAccumulator, EvokedArray, _get_peak
+from mne.io import RawArray, read_raw_fif
 from mne.utils import _record_warnings, grand_average
 
 base_dir = Path(__file__).parents[1] / "io" / "tests" / "data"
@@ -805,6 +805,68 @@ def test_array_epochs(tmp_path):
     pytest.raises(ValueError, EvokedArray, data1, info, tmin=-0.01)
 
 
+def test_evoked_accumulator():
+    """Test accumulating averages incrementally."""
+    rng = np.random.default_rng(0)
+    info = create_info(4, 100.0, "eeg")
+    data = rng.standard_normal((30, 4, 20)) + 1e3  # offset tests stability
+    events = np.array([np.arange(30) * 30, np.zeros(30, int), [1] * 10 + [2] * 20]).T
+    epochs = EpochsArray(data, info, events=events, event_id=dict(a=1, b=2))
+    acc = EvokedAccumulator(info)
+    for evoked in epochs.iter_evoked():
+        acc.update(evoked)
+    assert acc.nave == 30
+    # event types are kept from the comments of iter_evoked
+    evokeds = acc.finalize(by_event_type=True)
+    assert [evoked.comment for evoked in evokeds] == ["1", "2"]
+    assert [evoked.nave for evoked in evokeds] == [10, 20]
+    acc_named = EvokedAccumulator(info, event_id=epochs.event_id)
+    for evoked in epochs.iter_evoked():
+        acc_named.update(evoked)
+    acc_named.update(epochs[:3])
+    evokeds = acc_named.finalize(by_event_type=True)
+    assert [evoked.comment for evoked in evokeds] == ["a", "b"]
+    assert [evoked.nave for evoked in evokeds] == [13, 20]
+    for kind, want in (
+        ("average", epochs.average()),
+        ("standard_error", epochs.standard_error()),
+    ):
+        evoked = acc.finalize(kind)
+        assert evoked.kind == kind
+        assert evoked.nave == want.nave
+        assert_allclose(evoked.data, want.data, rtol=1e-10)
+    # shards merged by event type
+    acc = EvokedAccumulator(info).update(epochs[:13])
+    acc.merge(EvokedAccumulator(info).update(epochs[13:]))
+    evokeds = acc.finalize(by_event_type=True)
+    assert [evoked.comment for evoked in evokeds] == ["a", "b"]
+    for evoked, want in zip(evokeds, epochs.average(by_event_type=True)):
+        assert evoked.nave == want.nave
+        assert_allclose(evoked.data, want.data, rtol=1e-10)
+    evoked = acc.finalize(weights="equal")
+    want = combine_evoked(epochs.average(by_event_type=True), "equal")
+    assert_allclose(evoked.nave, want.nave)
+    assert_allclose(evoked.data, want.data, rtol=1e-10)
+    # lazy epochs are averaged in one pass
+    epochs_lazy = Epochs(
+        RawArray(data.transpose(1, 0, 2).reshape(4, -1), info),
+        events=np.array([np.arange(30) * 20, np.zeros(30, int), [1] * 30]).T,
+        tmin=0.0,
+        tmax=0.19,
+        baseline=None,
+    )
+    assert_allclose(epochs_lazy.average().data, data.mean(0), rtol=1e-12)
+    assert_allclose(
+        epochs_lazy.standard_error().data, data.std(0) / np.sqrt(30), rtol=1e-8
+    )
+    with pytest.raises(ValueError, match="must have shape"):
+        acc.update(data[:, :2])
+    with pytest.raises(ValueError, match="single epoch"):
+        acc.update(epochs.average())
+    with pytest.raises(RuntimeError, match="No epochs"):
+        EvokedAccumulator(info).finalize()
+
+
 def test_time_as_index_and_crop():
     """Test time as index and cropping."""
     tmin, tmax = -0.1, 0.1
@@ -12,21 +12,25 @@ from numpy.testing import (
     assert_array_equal,
     assert_array_less,
 )
-from scipy.signal import butter, freqz, sosfreqz
+from scipy.signal import butter, freqz, resample_poly, sosfreqz
 from scipy.signal import resample as sp_resample
 
-from mne import Epochs, create_info
+from mne import Annotations, Epochs, create_info, make_fixed_length_epochs
 from mne._fiff.pick import _DATA_CH_TYPES_SPLIT
 from mne.filter import (
+    Resampler,
     _length_factors,
     _overlap_add_filter,
     _resample_stim_channels,
     _smart_pad,
+    clear_filter_cache,
     construct_iir_filter,
     create_filter,
     design_mne_c_filter,
     detrend,
     estimate_ringing_samples,
+    filter_bank,
+    filter_cache_info,
     filter_data,
     notch_filter,
     resample,
@@ -97,6 +101,79 @@ def test_estimate_ringing():
         assert estimate_ringing_samples(butter(4, 0.00001)) == 100000
 
 
+@pytest.mark.parametrize("phase", ("zero", "zero-double", "minimum"))
+def test_filter_bank(phase):
+    """Test filtering in multiple bands at once."""
+    rng = np.random.default_rng(0)
+    info = create_info(["a", "b", "stim"], 250.0, ["eeg", "eeg", "stim"])
+    raw = RawArray(rng.standard_normal((3, 5000)), info)
+    raw.set_annotations(Annotations([8.0, 12.0], [0.0, 1.0], ["edge", "bad_acq_skip"]))
+    bands = dict(theta=(4.0, 8.0), beta=(13.0, 30.0), low=(None, 20.0))
+    data = filter_bank(raw, bands, phase=phase)
+    assert data.shape == (3, 2, 5000)
+    envelope = filter_bank(raw, bands, phase=phase, envelope=True)
+    insts = filter_bank(raw, bands, phase=phase, return_instances=True)
+    for bi, (l_freq, h_freq) in enumerate(bands.values()):
+        want = raw.copy().filter(l_freq, h_freq, phase=phase)
+        assert_allclose(data[bi], want.get_data("eeg"), atol=1e-12)
+        inst = next(insts)
+        assert_allclose(inst.get_data(), want.get_data(), atol=1e-12)
+        assert inst.info["highpass"] == want.info["highpass"]
+        assert inst.info["lowpass"] == want.info["lowpass"]
+        want.apply_hilbert(envelope=True)
+        assert_allclose(envelope[bi], want.get_data("eeg"), atol=1e-12)
+    # skipped data are left untouched, as in raw.filter
+    assert_array_equal(
+        data[:, :, 3000:3250], np.repeat(raw._data[np.newaxis, :2, 3000:3250], 3, 0)
+    )
+    # the info is updated for each band
+    insts = filter_bank(raw, [(None, None), (8.0, 12.0)], return_instances=True)
+    assert [inst.info["highpass"] for inst in insts] == [0.0, 8.0]
+    # epochs
+    epochs = make_fixed_length_epochs(raw, 2.0, preload=True)
+    data = filter_bank(epochs, list(bands.values())[:2], phase=phase)
+    assert data.shape == (2, len(epochs), 2, 500)
+    want = epochs.filter(13.0, 30.0, phase=phase).get_data("eeg")
+    assert_allclose(data[1], want, atol=1e-12)
+    with pytest.raises(ValueError, match="at least one"):
+        filter_bank(epochs, [(1.0, 2.0, 3.0)])
+
+
+def test_filter_cache():
+    """Test caching of filter designs."""
+    clear_filter_cache()
+    info = filter_cache_info()
+    assert set(info) == {"fir", "iir", "ringing"}
+    assert info["fir"] == dict(hits=0, misses=0, maxsize=32, currsize=0)
+    x = np.zeros(10000)
+    h = create_filter(x, 1000.0, 1.0, 40.0)
+    h_2 = create_filter(x, 1000.0, 1.0, 40.0)
+    assert_array_equal(h, h_2)
+    h_2[:] = 0  # modifying the output does not affect the cache
+    assert_array_equal(create_filter(x, 1000.0, 1.0, 40.0), h)
+    assert filter_cache_info()["fir"] == dict(hits=2, misses=1, maxsize=32, currsize=1)
+    assert not np.array_equal(create_filter(x, 1000.0, 1.0, 30.0), h)
+    assert filter_cache_info()["fir"]["currsize"] == 2
+    # warnings are emitted for cached designs, too
+    for _ in range(2):
+        with pytest.warns(RuntimeWarning, match="Attenuation"):
+            create_filter(x, 1000.0, None, 40.0, filter_length=11, fir_design="firwin2")
+    # IIR designs and their ringing
+    iir_params = dict(order=4, ftype="butter")
+    params = create_filter(x, 1000.0, 1.0, None, method="iir", iir_params=iir_params)
+    params_2 = create_filter(x, 1000.0, 1.0, None, method="iir", iir_params=iir_params)
+    assert_array_equal(params["sos"], params_2["sos"])
+    assert params["padlen"] == params_2["padlen"]
+    assert params["sos"] is not params_2["sos"]
+    info = filter_cache_info()
+    assert info["iir"]["hits"] == info["ringing"]["hits"] == 1
+    with pytest.warns(RuntimeWarning, match="properly estimate"):
+        estimate_ringing_samples(butter(4, 0.00001))
+    clear_filter_cache()
+    info = filter_cache_info()
+    assert all(info[key]["currsize"] == info[key]["hits"] == 0 for key in info)
+
+
 @pytest.mark.parametrize("n_signal", (1, 2, 3, 5, 10, 20, 40))
 @pytest.mark.parametrize("n_filter", (1, 2, 3, 5, 10, 11, 20, 21, 40, 41, 100, 101))
 @pytest.mark.parametrize("filter_type", ("identity", "random"))
@@ -370,6 +447,22 @@ def test_notch_filters(method, filter_length, line_freq, tol):
     assert_almost_equal(new_power, orig_power, tol)
 
 
+@pytest.mark.parametrize("line_freq", (None, line_freqs))
+def test_notch_spectrum_fit_blocks(line_freq):
+    """Test that multitaper notching of channel blocks is done per channel."""
+    rng = np.random.RandomState(0)
+    sfreq = 487.0
+    t = np.arange(0, int(round(12 * sfreq))) / sfreq
+    x = rng.randn(4, len(t)) + np.sin(2 * np.pi * 60.0 * t + rng.rand(4, 1) * 6)
+    kwargs = dict(method="spectrum_fit", filter_length="4s")
+    want = np.array([notch_filter(x_, sfreq, line_freq, **kwargs) for x_ in x])
+    assert_allclose(notch_filter(x, sfreq, line_freq, **kwargs), want, atol=1e-12)
+    got = notch_filter(x, sfreq, line_freq, picks=[0, 2], n_jobs=2, **kwargs)
+    assert_allclose(got[[0, 2]], want[[0, 2]], atol=1e-12)
+    assert_array_equal(got[[1, 3]], x[[1, 3]])
+    assert np.abs(want).max() < np.abs(x).max()
+
+
 @resample_method_parametrize
 def test_resample(method):
     """Test resampling."""
@@ -434,6 +527,23 @@ def test_n_jobs(n_jobs, capsys):
     assert_allclose(y1, y2)
 
 
+@pytest.mark.parametrize("phase", ("zero", "zero-double", "minimum"))
+@pytest.mark.parametrize("n_times", (100, 5000))
+def test_overlap_add_threads(phase, n_times):
+    """Test batched overlap-add filtering against filtering row by row."""
+    x = np.random.RandomState(0).randn(6, n_times)
+    h = create_filter(x, 1000.0, 1.0, 40.0, phase=phase, verbose="error")
+    picks = [0, 2, 3, 4]
+    for pad in ("reflect_limited", "edge"):
+        # without CUDA, n_jobs="cuda" falls back to filtering row by row
+        want = _overlap_add_filter(x, h, phase=phase, picks=picks, n_jobs="cuda")
+        got = _overlap_add_filter(x, h, phase=phase, picks=picks, n_jobs=2)
+        assert_allclose(got, want, rtol=1e-12, atol=1e-14)
+        assert_array_equal(got[[1, 5]], x[[1, 5]])
+        got = _overlap_add_filter(x, h, n_fft=4 * len(h), phase=phase)
+        assert_allclose(got, _overlap_add_filter(x, h, phase=phase), atol=1e-12)
+
+
 def test_resamp_stim_channel():
     """Test resampling of stim channels."""
     # Downsampling
@@ -473,6 +583,54 @@ def test_resample_raw(method):
     assert data.shape == (1, 63)
 
 
+@pytest.mark.parametrize("up, down", [(1, 4), (3, 2), (1000.0, 256.0)])
+@pytest.mark.parametrize("pad", ("auto", "constant", "edge"))
+def test_resampler(up, down, pad):
+    """Test resampling in chunks."""
+    rng = np.random.RandomState(0)
+    x = rng.randn(2, 3, 2048)
+    resampler = Resampler(up, down, pad=pad)
+    y = list()
+    start = 0
+    while start < x.shape[-1]:
+        stop = start + rng.randint(1, 300)
+        y.append(resampler.feed(x[..., start:stop]))
+        start = stop
+    y.append(resampler.flush())
+    assert all(y_.shape[:-1] == x.shape[:-1] for y_ in y)
+    assert "2048 samples in" in repr(resampler)
+    y = np.concatenate(y, axis=-1)
+    want = resample(x, up, down, method="polyphase", pad=pad)
+    assert_array_equal(y, want)
+    # too short to emit anything before the end
+    resampler = Resampler(up, down, pad=pad)
+    assert resampler.feed(x[..., :3]).shape == (2, 3, 0)
+    y = resampler.flush()
+    kwargs = dict(axis=-1, window=resampler.window, padtype=resampler.pad)
+    want = resample_poly(x[..., :3], resampler.up, resampler.down, **kwargs)
+    assert_array_equal(y, want[..., : y.shape[-1]])
+    with pytest.raises(ValueError, match="Invalid value for the 'pad'"):
+        Resampler(up, down, pad="wrap")
+    with pytest.raises(RuntimeError, match="No data"):
+        Resampler(up, down).flush()
+
+
+@pytest.mark.parametrize("n_times", (12000, 12001))
+def test_resample_raw_chunked(tmp_path, n_times):
+    """Test polyphase resampling of non-preloaded raw data."""
+    data = np.random.RandomState(0).randn(3, n_times)
+    data[2] = 0
+    data[2, ::1000] = 1
+    info = create_info(["a", "b", "STI 014"], 1000.0, ["eeg", "eeg", "stim"])
+    RawArray(data, info).save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif")
+    raw_preload = raw.copy().load_data()
+    for this_raw in (raw, raw_preload):
+        this_raw.resample(250.0, method="polyphase")
+    assert raw.preload
+    assert_array_equal(raw.get_data(), raw_preload.get_data())
+
+
 @resample_method_parametrize
 def test_resample_below_1_sample(method):
     """Test resampling doesn't yield datapoints."""
@@ -27,6 +27,7 @@ __all__ = [
     "_check_channels_spatial_filter",
     "_check_combine",
     "_check_compensation_grade",
+    "_check_data_dtype",
     "_check_decim",
     "_check_depth",
     "_check_dict_keys",
@@ -234,6 +235,7 @@ from .check import (
     _check_channels_spatial_filter,
     _check_combine,
     _check_compensation_grade,
+    _check_data_dtype,
     _check_depth,
     _check_dict_keys,
     _check_edfio_installed,
@@ -333,6 +333,22 @@ def _check_subject(
     return None
 
 
+def _check_data_dtype(dtype, *, is_complex=False):
+    """Get the in-memory data type for real or complex data."""
+    if dtype is None:
+        dtype = np.float64
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise TypeError(f"dtype must be a valid numpy dtype, got {repr(dtype)}")
+    _check_option(
+        "dtype", dtype.name, ("float32", "float64", "complex64", "complex128")
+    )
+    # the precision is what matters, complex data use the matching type
+    dtype = np.finfo(dtype).dtype
+    return np.result_type(dtype, np.complex64) if is_complex else dtype
+
+
 def _check_preload(inst, msg):
     """Ensure data are preloaded."""
     from ..epochs import BaseEpochs
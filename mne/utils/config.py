@@ -178,6 +178,10 @@ _known_config_types = {
     "MNE_DATASETS_REFMEG_NOISE_PATH": "str, path for refmeg_noise data",
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
+    "MNE_FIF_INDEX_CACHE_DIR": (
+        "str, path to a directory in which to cache the tag directory and tree of FIF "
+        "files that are read so that reopening them does not require a full scan"
+    ),
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function decorated with "
@@ -1251,6 +1251,19 @@ dtype : numpy.dtype
     (default) the data type is not modified.
 """
 
+docdict["dtype_data"] = """
+dtype : str | numpy.dtype | None
+    The precision used to store the data in memory, either ``"float32"`` or
+    ``"float64"``. Complex data use the corresponding complex type
+    (``complex64`` or ``complex128``). Single precision halves the memory
+    footprint, and is preserved by methods such as ``average``,
+    ``apply_baseline``, ``crop``, ``filter``, and ``resample``, which
+    compute in double precision internally where needed. ``None`` (default)
+    uses double precision.
+
+    .. versionadded:: 1.13
+"""
+
 # %%
 # E
 
@@ -2685,6 +2698,47 @@ meg : str | list | dict | bool | None
        Added support for specifying alpha values as a dict.
 """
 
+docdict["memmap_fif"] = """
+memmap : False | ``'r'``
+    If ``'r'``, read data buffers of non-preloaded data through read-only
+    :class:`numpy.memmap` views of the file instead of seeking and reading each
+    buffer tag, which avoids allocating a temporary array per buffer when
+    calling e.g. :meth:`~mne.io.Raw.get_data` on long recordings. Cannot be
+    used with gzipped files or file-like objects. Default is ``False``.
+
+    .. versionadded:: 1.13
+"""
+
+docdict["memmap_filter"] = """
+memmap : None | path-like
+    Only used for :class:`~mne.io.Raw` instances whose data are not preloaded.
+    If a path, the data are read and filtered in overlapping chunks of about
+    10 seconds and the result is written to a :class:`numpy.memmap` at this
+    location, which then backs the (now preloaded) data. This keeps memory
+    usage proportional to the chunk and filter lengths rather than the
+    recording length; the result can then be written to disk with
+    :meth:`~mne.io.Raw.save`. FIR filtering gives the same result as filtering
+    preloaded data; forward-backward IIR filtering is equivalent up to ringing
+    beyond ``iir_params['padlen']`` samples. Default is ``None``, which
+    requires the data to be preloaded.
+
+    .. versionadded:: 1.13
+"""
+
+docdict["memmap_notch"] = """
+memmap : None | path-like
+    Only used for :class:`~mne.io.Raw` instances whose data are not preloaded,
+    with ``method='spectrum_fit'``. If a path, the data are read in chunks of
+    about 10 seconds, each multitaper window is processed as soon as all of its
+    samples have been read, and the result is written to a :class:`numpy.memmap`
+    at this location, which then backs the (now preloaded) data. This gives the
+    same result as processing preloaded data with memory usage proportional to
+    the window length rather than the recording length. Default is ``None``,
+    which requires the data to be preloaded.
+
+    .. versionadded:: 1.13
+"""
+
 _metadata_attr_template = """
 metadata : instance of pandas.DataFrame | None
     A :class:`pandas.DataFrame` specifying metadata about each epoch{or_none}.{extra}
@@ -2911,6 +2965,17 @@ n_jobs : int | str
     is installed properly and ``method='fir'``.
 """
 
+docdict["n_jobs_read"] = """
+n_jobs : int | None
+    The number of threads to use to read data from disk. If larger than 1,
+    the data are read in chunks that are fetched and calibrated concurrently,
+    which can be much faster for data split across several files or stored on
+    high-latency (e.g., network) file systems. If ``-1``, it is set to the
+    number of CPU cores. ``None`` (default) means reading serially. Readers
+    are called from multiple threads, so this should only be used with
+    readers whose on-demand reads are thread safe (e.g., FIF).
+"""
+
 docdict["n_pca_components_apply"] = """
 n_pca_components : int | float | None
     The number of PCA components to be kept, either absolute (int)
@@ -220,12 +220,21 @@ class GetEpochsMixin:
             subset of epochs (and optionally array with kept epoch indices)
         """
         self._sanity_check_event_id()
-        inst = self.copy() if copy else self
-        if self._data is not None:
-            np.copyto(inst._data, self._data, casting="no")
+        select = self._item_to_select(item)
+        select_data = select_data and self.preload and self._data is not None
+        if copy:
+            # Data and metadata get replaced by their subselection below, so
+            # share them with the copy rather than copying everything first
+            memo = dict()
+            if select_data:
+                memo[id(self._data)] = self._data
+            if getattr(self, "_metadata", None) is not None:
+                memo[id(self._metadata)] = self._metadata
+            inst = deepcopy(self, memo)
+        else:
+            inst = self
         del self
 
-        select = inst._item_to_select(item)
         has_selection = hasattr(inst, "selection")
         if has_selection:
             key_selection = inst.selection[select]
@@ -238,7 +247,9 @@ class GetEpochsMixin:
                 if isinstance(reason, str):
                     reason = (reason,)
                 reason = tuple(reason)
-                for idx in np.setdiff1d(inst.selection, key_selection):
+                dropped = np.ones(len(inst.selection), bool)
+                dropped[select] = False
+                for idx in inst.selection[dropped]:
                     drop_log[idx] = reason
             inst.drop_log = tuple(drop_log)
             inst.selection = key_selection
@@ -256,10 +267,12 @@ class GetEpochsMixin:
 
             # will reset the index for us
             GetEpochsMixin.metadata.fset(inst, metadata, verbose=False)
-        if inst.preload and select_data:
+        if select_data:
+            inst._data = inst._data[select]
             # ensure that each Epochs instance owns its own data so we can
-            # resize later if necessary
-            inst._data = np.require(inst._data[select], requirements=["O"])
+            # resize later if necessary (read-only views of raw data stay views)
+            if inst._data.flags.writeable:
+                inst._data = np.require(inst._data, requirements=["O"])
         if drop_event_id:
             # update event id to reflect new content of inst
             inst.event_id = {
@@ -1101,13 +1101,16 @@ def _custom_lru_cache(maxsize):
         fun_hash = hash(fun)
         this_cache = _LRU_CACHES[fun_hash] = dict()
         _LRU_CACHE_MAXSIZES[fun_hash] = maxsize
+        counts = dict(hits=0, misses=0)
 
         def cache_fun(*args):
             hash_ = object_hash(args)
             if hash_ in this_cache:
                 this_val = this_cache.pop(hash_)
+                counts["hits"] += 1
             else:
                 this_val = fun(*args)
+                counts["misses"] += 1
             this_cache[hash_] = this_val  # (re)insert in last pos
             while len(this_cache) > _LRU_CACHE_MAXSIZES[fun_hash]:
                 for key in this_cache:  # just an easy way to get first element
@@ -1115,6 +1118,19 @@ def _custom_lru_cache(maxsize):
                     break  # first in, first out
             return this_val
 
+        def cache_info():
+            return dict(
+                counts,
+                maxsize=_LRU_CACHE_MAXSIZES[fun_hash],
+                currsize=len(this_cache),
+            )
+
+        def cache_clear():
+            this_cache.clear()
+            counts.update(hits=0, misses=0)
+
+        cache_fun.cache_info = cache_info
+        cache_fun.cache_clear = cache_clear
         return cache_fun
 
     return dec
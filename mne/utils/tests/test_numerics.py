@@ -601,6 +601,10 @@ def test_custom_lru_cache():
     assert my_fun_2(1, sparse.eye_array(1, format="csc")) == "int, csc_array"
     assert n_calls == [2, 2]
     assert len(_LRU_CACHES[fun_2_hash]) == 1  # other got popped
+    assert my_fun.cache_info() == dict(hits=1, misses=2, maxsize=2, currsize=2)
+    my_fun.cache_clear()
+    assert my_fun.cache_info() == dict(hits=0, misses=0, maxsize=2, currsize=0)
+    assert len(_LRU_CACHES[fun_hash]) == 0
     # we could add support for this eventually, but don't bother for now
     with pytest.raises(RuntimeError, match="Unsupported sparse type"):
         my_fun_2(1, sparse.eye_array(1, format="coo"))